@@ -0,0 +1,141 @@
+"""Benchmark for the importer for drawings stored in a DXF format.
+
+Other revisions can be measured by the same benchmark, for example:
+
+    git worktree add /tmp/chainring-old <revision>
+    python benchmarks/dxf_import_benchmark.py --src /tmp/chainring-old/src
+"""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import argparse
+import contextlib
+import io
+import os
+import struct
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+
+REPEAT = 10
+
+# numbers of worker processes for parallel import of ENTITIES section
+WORKERS = (2, 4)
+
+
+def convert_to_binary(filename: Path) -> bytes:
+    """Convert ASCII DXF file into binary DXF, strings keep the original encoding."""
+    from importers.dxf_binary_tokenizer import DxfBinaryTokenizer
+    from importers.dxf_decoder import DxfDecoder
+
+    data = filename.read_bytes()
+    decoder = DxfDecoder()
+    with contextlib.redirect_stdout(io.StringIO()):
+        encoding = decoder.detect(data[: DxfDecoder.PREFIX_SIZE])
+    lines = data.decode(encoding).splitlines()
+    output = [DxfBinaryTokenizer.SENTINEL]
+    for code, value in zip(lines[0::2], lines[1::2]):
+        code = int(code)
+        value = value.strip()
+        value_type = DxfBinaryTokenizer.value_type(code)
+        output.append(struct.pack("<H", code))
+        if value_type == DxfBinaryTokenizer.DOUBLE:
+            output.append(struct.pack("<d", float(value)))
+        elif value_type == DxfBinaryTokenizer.INT16:
+            output.append(struct.pack("<h", int(value)))
+        elif value_type == DxfBinaryTokenizer.INT32:
+            output.append(struct.pack("<i", int(value)))
+        elif value_type == DxfBinaryTokenizer.INT64:
+            output.append(struct.pack("<q", int(value)))
+        elif value_type == DxfBinaryTokenizer.BOOLEAN:
+            output.append(struct.pack("<B", int(value)))
+        elif value_type == DxfBinaryTokenizer.BINARY_CHUNK:
+            chunk = bytes.fromhex(value)
+            output.append(struct.pack("<B", len(chunk)) + chunk)
+        else:
+            output.append(value.encode(encoding) + b"\x00")
+    return b"".join(output)
+
+
+def benchmark_file(filename: Path, tokenizer, workers: int = 1) -> tuple[float, int]:
+    """Import the given file several times, return the best time and number of groups."""
+    from importers.dxf_importer import DxfImporter
+
+    best = float("inf")
+    lines = 0
+    for _ in range(REPEAT):
+        # the importer is quite verbose
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            drawing = DxfImporter(str(filename), tokenizer, workers).import_dxf()
+            best = min(best, time.perf_counter() - start)
+        lines = drawing.lines
+    return best, lines
+
+
+def parse_arguments() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Benchmark for the DXF importer.")
+    parser.add_argument(
+        "--src",
+        default=str(ROOT / "src"),
+        help="source directory of the measured revision (default: this working tree)",
+    )
+    return parser.parse_args()
+
+
+def main() -> None:
+    """Run the benchmark for all DXF files from test-data directory."""
+    args = parse_arguments()
+    sys.path.insert(0, args.src)
+    from importers.dxf_tokenizer_type import DxfTokenizerType
+
+    # older revisions can't read binary DXF files
+    try:
+        import importers.dxf_binary_tokenizer  # noqa: F401
+
+        binary_supported = True
+    except ImportError:
+        binary_supported = False
+
+    print(f"sources: {args.src}")
+    print(f"CPUs: {os.cpu_count()}")
+    print(
+        f"{'file':20} {'tokenizer':10} {'workers':>7} {'size [kB]':>10} {'groups':>8} "
+        f"{'time [ms]':>10} {'groups/s':>10}"
+    )
+    with tempfile.TemporaryDirectory() as directory:
+        for filename in sorted((ROOT / "test-data").glob("*.dxf")):
+            runs = [(filename, tokenizer.name, tokenizer, 1) for tokenizer in DxfTokenizerType]
+            if binary_supported:
+                # the same drawing stored as binary DXF, the tokenizer is selected automatically
+                binary = Path(directory) / filename.name
+                binary.write_bytes(convert_to_binary(filename))
+                runs.append((binary, "BINARY", DxfTokenizerType.TEXT, 1))
+            # ENTITIES sections smaller than DxfImporter.PARALLEL_MIN_SIZE are parsed sequentially
+            for workers in WORKERS:
+                runs.append((filename, "PARALLEL", DxfTokenizerType.MMAP, workers))
+            for path, name, tokenizer, workers in runs:
+                duration, lines = benchmark_file(path, tokenizer, workers)
+                size = path.stat().st_size / 1024
+                print(
+                    f"{filename.name:20} {name:10} {workers:7} {size:10.0f} {lines:8} "
+                    f"{duration * 1000:10.1f} {lines / duration:10.0f}"
+                )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,58 @@
+"""Benchmark for memory consumed by entities of real and synthetic drawings."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from entities.line import Line  # noqa: E402
+from importers.drawing_importer import DrawingImporter  # noqa: E402
+
+# number of entities in synthetic drawing
+SYNTHETIC_ENTITIES = 1_000_000
+
+
+def memory_per_entity(create_entities) -> tuple[float, int]:
+    """Measure memory allocated by created entities, return size per entity and their count."""
+    tracemalloc.start()
+    try:
+        entities = create_entities()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return size / len(entities), len(entities)
+
+
+def main() -> None:
+    """Report memory per entity for drawing with rooms and for synthetic drawing."""
+    filename = ROOT / "test-drawings" / "input_with_15_rooms.drw"
+    size, count = memory_per_entity(
+        lambda: DrawingImporter(str(filename)).import_drawing().entities
+    )
+    print(f"{filename.name}: {count} entities, {size:.0f} bytes per entity")
+
+    size, count = memory_per_entity(
+        lambda: [
+            Line(i * 1.0, i * 2.0, i * 3.0, i * 4.0, 1, "walls")
+            for i in range(SYNTHETIC_ENTITIES)
+        ]
+    )
+    print(f"synthetic drawing: {count} lines, {size:.0f} bytes per entity")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""Benchmark for creation of canvas items, one call per entity versus batched calls."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import gc
+import sys
+import time
+import tkinter
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+sys.path.insert(0, str(ROOT / "benchmarks"))
+
+from gui.batch_renderer import BatchRenderer  # noqa: E402
+from rescale_benchmark import synthetic_entities  # noqa: E402
+
+SIZES = (10_000, 100_000)
+REPEAT = 5
+
+
+class StubCanvas:
+    """Canvas whose widget command is a Tcl procedure, it is used when no display is available.
+
+    Methods are borrowed from tkinter canvas, so the Python and Tcl overhead of
+    each call is the same as for the real canvas, just items are not stored.
+    """
+
+    PATH = ".canvas"
+
+    _options = tkinter.Misc._options
+    _create = tkinter.Canvas._create
+    create_arc = tkinter.Canvas.create_arc
+    create_line = tkinter.Canvas.create_line
+    create_oval = tkinter.Canvas.create_oval
+    create_polygon = tkinter.Canvas.create_polygon
+    create_text = tkinter.Canvas.create_text
+    delete = tkinter.Canvas.delete
+
+    def __init__(self) -> None:
+        """Create Tcl interpreter with procedure that emulates the canvas widget."""
+        self.tk = tkinter.Tcl()
+        self._w = StubCanvas.PATH
+        self.tk.eval(f"proc {StubCanvas.PATH} {{args}} {{incr ::last_id}}")
+
+    def __str__(self) -> str:
+        """Return path of the canvas widget."""
+        return self._w
+
+
+def create_canvas() -> tuple:
+    """Return real canvas when display is available, otherwise the canvas emulated in Tcl."""
+    try:
+        root = tkinter.Tk()
+    except tkinter.TclError:
+        return StubCanvas(), "Tcl stub"
+    return tkinter.Canvas(root), "Tk canvas"
+
+
+def draw_per_entity(canvas, entities: list) -> None:
+    """Draw entities by one call of tkinter per entity."""
+    for entity in entities:
+        entity.draw(canvas, 0.0, 0.0, 100.0)
+
+
+def draw_batched(canvas, entities: list) -> None:
+    """Draw entities by batch renderer, other entities are drawn directly."""
+    batch = BatchRenderer(canvas)
+    for entity in entities:
+        if not batch.add(entity, 0.0, 0.0, 100.0):
+            entity.draw(canvas, 0.0, 0.0, 100.0)
+    batch.flush()
+
+
+def benchmark(canvas, entities: list, draw) -> float:
+    """Draw all entities several times, return the best time."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        canvas.delete("all")
+        # garbage collection of all entities would be measured otherwise, as in timeit module
+        gc.collect()
+        gc.disable()
+        start = time.perf_counter()
+        draw(canvas, entities)
+        best = min(best, time.perf_counter() - start)
+        gc.enable()
+    return best
+
+
+def main() -> None:
+    """Run the benchmark for per entity and batched creation of canvas items."""
+    canvas, name = create_canvas()
+    print(f"canvas: {name}")
+    print(
+        f"{'entities':>10} {'method':12} {'time [ms]':>10} {'per entity [us]':>16} {'speedup':>8}"
+    )
+    for size in SIZES:
+        entities = synthetic_entities(size)
+        baseline = None
+        for method, draw in (("per entity", draw_per_entity), ("batched", draw_batched)):
+            duration = benchmark(canvas, entities, draw)
+            baseline = baseline or duration
+            print(
+                f"{size:10} {method:12} {duration * 1000:10.1f} "
+                f"{duration / size * 1e6:16.2f} {baseline / duration:8.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+"""Benchmark for rescaling of drawings and computation of their bounds."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import random
+import sys
+import time
+from pathlib import Path
+
+ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(ROOT / "src"))
+
+from drawing import Drawing  # noqa: E402
+from entities import columnar_entities  # noqa: E402
+from entities.arc import Arc  # noqa: E402
+from entities.circle import Circle  # noqa: E402
+from entities.columnar_entities import ColumnarEntities  # noqa: E402
+from entities.line import Line  # noqa: E402
+from entities.polyline import Polyline  # noqa: E402
+from entities.text import Text  # noqa: E402
+
+SIZES = (100_000, 1_000_000)
+REPEAT = 3
+
+
+def synthetic_entities(count: int) -> list:
+    """Generate given number of random entities, mostly lines as in real drawings."""
+    generator = random.Random(count)
+    coordinate = generator.random
+    entities: list = []
+    for i in range(count):
+        kind = i % 10
+        if kind < 6:
+            entities.append(Line(coordinate(), coordinate(), coordinate(), coordinate(), 1, "0"))
+        elif kind == 6:
+            entities.append(Circle(coordinate(), coordinate(), coordinate(), 2, "0"))
+        elif kind == 7:
+            entities.append(Arc(coordinate(), coordinate(), coordinate(), 0.0, 90.0, 3, "0"))
+        elif kind == 8:
+            entities.append(Text(coordinate(), coordinate(), "text", 4, "0"))
+        else:
+            points_x = [coordinate() for _ in range(4)]
+            points_y = [coordinate() for _ in range(4)]
+            entities.append(Polyline(points_x, points_y, 5, "0"))
+    return entities
+
+
+def benchmark_drawing(drawing: Drawing) -> float:
+    """Rescale the drawing and compute its bounds several times, return the best time."""
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        drawing.rescale(1.0, -1.0, 0.5)
+        drawing.get_bounds()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    """Run the benchmark for entity objects and columnar storage with and without NumPy."""
+    numpy = columnar_entities.numpy
+    print(f"{'entities':>10} {'storage':20} {'time [ms]':>10} {'speedup':>8}")
+    for size in SIZES:
+        entities = synthetic_entities(size)
+        runs = [("objects", entities, numpy), ("columnar (python)", entities, None)]
+        if numpy is not None:
+            runs.append(("columnar (numpy)", entities, numpy))
+        baseline = None
+        for name, source, module in runs:
+            columnar_entities.numpy = module
+            storage = source if name == "objects" else ColumnarEntities(source)
+            duration = benchmark_drawing(Drawing(storage, {}))
+            baseline = baseline or duration
+            print(f"{size:10} {name:20} {duration * 1000:10.1f} {baseline / duration:8.1f}")
+        columnar_entities.numpy = numpy
+
+
+if __name__ == "__main__":
+    main()
@@ -18,15 +18,10 @@ from configuration import Configuration
 # from exporters.binary_exporter import *
 from exporters.drawing_exporter import *
 from exporters.json_exporter import *
-from geometry.bounds import Bounds
-from geometry.rescaler import Rescaler
-from gui.dialogs.error_dialogs import error_dialog_drawing_load
 from gui.dialogs.load_dialogs import LoadDialogs
 from gui.main_window import MainWindow
 
 # from importers.binary_importer import *
-from importers.drawing_importer import DrawingImporter
-from importers.dxf_importer import DxfImporter
 
 configuration = Configuration()
 # configuration.write()
@@ -47,6 +42,11 @@ drawing = None
 # json_exporter = JSONExporter("output.json", drawing)
 # json_exporter.export()
 
+main_window.drawing = drawing
+main_window.redraw()
+main_window.add_all_rooms_from_drawing()
+main_window.set_ui_items_for_actual_mode()
+
 if drawing is None:
     drawing_file_name = LoadDialogs.load_drawing(None)
     if (
@@ -54,38 +54,7 @@ if drawing is None:
         and drawing_file_name != ""
         and drawing_file_name != ()
     ):
-        if drawing_file_name.endswith(".drw"):
-            importer = DrawingImporter(drawing_file_name)
-            drawing = importer.import_drawing()
-            if drawing is None:
-                error_dialog_drawing_load()
-        else:
-            importer = DxfImporter(drawing_file_name)
-            drawing = importer.import_dxf()
-            if drawing is None:
-                error_dialog_drawing_load()
-
-if drawing is not None:
-    bounds = Bounds.compute_bounds(drawing.entities)
-    # print(bounds)
-    xoffset, yoffset, scale = Rescaler.compute_scale_for_canvas(
-        bounds, main_window.canvas
-    )
-    # print(xoffset, yoffset, scale)
-
-    # ex = BinaryExporter("output3.bin", entities)
-    # ex.export_binary_drawing()
+        # the drawing is displayed by main window when the import is finished
+        main_window.start_background_import(drawing_file_name)
 
-    # with open("output.bin", "wb") as fout:
-    #     pickle.dump(entities, fout)
-
-    drawing.rescale(xoffset, yoffset, scale)
-
-    # exporter = DrawingExporter("output2.drw", drawing)
-    # exporter.export()
-
-main_window.drawing = drawing
-main_window.redraw()
-main_window.add_all_rooms_from_drawing()
-main_window.set_ui_items_for_actual_mode()
 main_window.show()
@@ -50,6 +50,31 @@ class Configuration:
         """Property holding server port."""
         return self.config.getint("service", "port")
 
+    @property
+    def cache_enabled(self) -> bool:
+        """Property holding flag if imported drawings are cached."""
+        return self.config.getboolean("cache", "enabled", fallback=True)
+
+    @property
+    def cache_directory(self) -> str:
+        """Property holding directory with cached drawings."""
+        return self.config.get("cache", "directory", fallback="~/.cache/chainring")
+
+    @property
+    def cache_max_size(self) -> int:
+        """Property holding size cap of cache with imported drawings (in bytes)."""
+        return self.config.getint("cache", "max_size_mb", fallback=256) * 1024 * 1024
+
+    @property
+    def columnar_storage(self) -> bool:
+        """Property holding flag if entities are stored by types in contiguous arrays."""
+        return self.config.getboolean("storage", "columnar", fallback=False)
+
+    @property
+    def import_workers(self) -> int:
+        """Property holding number of worker processes that parse ENTITIES section of DXF."""
+        return self.config.getint("import", "workers", fallback=1)
+
     def write(self) -> None:
         """Write the configuration back to disk under different name."""
         with open("config2.ini", "w") as fout:
@@ -5,10 +5,16 @@ from typing import Optional
 
 from entities.arc import Arc
 from entities.circle import Circle
+from entities.columnar_entities import ColumnarEntities
 from entities.drawing_entity_type import DrawingEntityType
 from entities.line import Entity, Line
 from entities.polyline import Polyline
 from entities.text import Text
+from geometry.bounds import Bounds
+from geometry.snap_index import SnapIndex
+from geometry.spatial_index import SpatialIndex
+from geometry.view_transform import ViewTransform
+from room_store import RoomRecord, RoomStore
 
 #
 #  (C) Copyright 2017, 2018  Pavel Tisnovsky
@@ -28,20 +34,29 @@ class Drawing:
 
     def __init__(
         self,
-        entities: list[Line | Arc | Circle | Text | Polyline],
+        entities: list[Line | Arc | Circle | Text | Polyline] | ColumnarEntities,
         statistic: dict[DrawingEntityType, int],
         lines: int = 0,
-        metadata: None = None,
+        metadata: Optional[dict[str, str]] = None,
     ) -> None:
         """Initialize the class, setup entities."""
         self._entities = entities
         self._drawing_id = None
         self._statistic = statistic
         self._lines = lines
-        self._rooms: list = []
+        self._rooms = RoomStore()
         self._metadata: dict[str, str] = metadata or {}
         self._room_counter = 1
         self._filename = None
+        self._blocks: dict = {}
+        # bounds known in advance (from DXF header), they are computed otherwise
+        self._bounds: Optional[Bounds] = None
+        # entities drawn onto canvas, indexed by IDs of their graphics entities
+        self._entity_index: dict[int, Entity] = {}
+        # spatial index over entities, it is built when needed
+        self._spatial_index: Optional[SpatialIndex] = None
+        # index of endpoints and vertexes of entities, it is built when needed
+        self._snap_index: Optional[SnapIndex] = None
 
     @property
     def entities(self):
@@ -52,13 +67,15 @@ class Drawing:
     def entities(self, entities) -> None:
         """Setter for property holding all entities on drawing."""
         self._entities = entities
+        self._spatial_index = None
+        self._snap_index = None
 
     @property
     def room_counter(self):
         """Property holding room counter."""
         return self._room_counter
 
-    @entities.setter
+    @room_counter.setter
     def room_counter(self, new_value) -> None:
         """Setter for property holding room counter."""
         self._room_counter = new_value
@@ -100,8 +117,45 @@ class Drawing:
 
     @rooms.setter
     def rooms(self, rooms) -> None:
-        """Setter for rooms on drawing."""
-        self._rooms = rooms
+        """Setter for rooms on drawing, rooms can be represented as dictionaries."""
+        self._rooms = rooms if isinstance(rooms, RoomStore) else RoomStore(rooms or [])
+
+    @property
+    def blocks(self):
+        """Block definitions shared by inserts on drawing."""
+        return self._blocks
+
+    @blocks.setter
+    def blocks(self, blocks) -> None:
+        """Setter for block definitions."""
+        self._blocks = blocks
+
+    @property
+    def bounds(self):
+        """Bounds known in advance, None when they need to be computed."""
+        return self._bounds
+
+    @bounds.setter
+    def bounds(self, bounds) -> None:
+        """Setter for bounds known in advance."""
+        self._bounds = bounds
+
+    def get_bounds(self) -> Bounds:
+        """Return bounds known in advance or compute bounds for all entities."""
+        if self._bounds is not None:
+            return self._bounds
+        if isinstance(self._entities, ColumnarEntities):
+            return self._entities.get_bounds()
+        return Bounds.compute_bounds(self._entities)
+
+    def get_layers(self) -> list[str]:
+        """Return sorted names of all layers used by entities, without the missing layer."""
+        if isinstance(self._entities, ColumnarEntities):
+            layers = set(self._entities.layer_names)
+        else:
+            layers = {entity.layer for entity in self._entities}
+        layers.discard(None)
+        return sorted(layers)
 
     @property
     def filename(self):
@@ -125,22 +179,81 @@ class Drawing:
 
     def rescale(self, xoffset: float, yoffset: float, scale: float) -> None:
         """Rescale the drawing by specified offset and scale."""
-        for entity in self._entities:
-            entity.transform(xoffset, yoffset, scale)
+        if isinstance(self._entities, ColumnarEntities):
+            self._entities.transform(xoffset, yoffset, scale)
+        else:
+            for entity in self._entities:
+                entity.transform(xoffset, yoffset, scale)
+        if self._bounds is not None:
+            self._bounds = Bounds(
+                (self._bounds.xmin + xoffset) * scale,
+                (self._bounds.ymin + yoffset) * scale,
+                (self._bounds.xmax + xoffset) * scale,
+                (self._bounds.ymax + yoffset) * scale,
+            )
+        # coordinates of all entities have been changed
+        self._spatial_index = None
+        self._snap_index = None
+
+    @property
+    def entity_index(self) -> dict[int, Entity]:
+        """Entities drawn onto canvas, indexed by IDs of their graphics entities."""
+        return self._entity_index
+
+    def clear_entity_index(self) -> None:
+        """Forget all graphics entities, it needs to be called when canvas is cleared."""
+        self._entity_index.clear()
 
     def find_entity_by_id(self, entity_id: int) -> Optional[Entity]:
-        """Find entity by specified ID."""
-        for entity in self._entities:
-            if entity._id == entity_id:
-                return entity
-        return None
+        """Find entity by specified ID of graphics entity on canvas."""
+        return self._entity_index.get(entity_id)
+
+    @property
+    def spatial_index(self) -> SpatialIndex:
+        """Spatial index over all entities, it is built on the first access."""
+        if self._spatial_index is None:
+            self._spatial_index = self.build_spatial_index()
+        return self._spatial_index
+
+    def build_spatial_index(self) -> SpatialIndex:
+        """Build new spatial index over all entities."""
+        return SpatialIndex.build(
+            (entity.get_bounds() for entity in self._entities),
+            self.get_bounds(),
+            len(self._entities),
+        )
+
+    def build_indexes(self) -> None:
+        """Build indexes in advance, so they are not built by the first redraw."""
+        if self._spatial_index is None:
+            self._spatial_index = self.build_spatial_index()
+        if self._snap_index is None:
+            self._snap_index = self.build_snap_index()
+
+    @property
+    def snap_index(self) -> SnapIndex:
+        """Index of endpoints and vertexes of all entities, it is built on the first access."""
+        if self._snap_index is None:
+            self._snap_index = self.build_snap_index()
+        return self._snap_index
+
+    def build_snap_index(self) -> SnapIndex:
+        """Build new index of endpoints and vertexes of all entities."""
+        return SnapIndex.build(self._entities, self.get_bounds())
+
+    def find_snap_point(
+        self, x: float, y: float, view: ViewTransform, tolerance: float
+    ) -> Optional[tuple[float, float, float, float]]:
+        """Find snap point nearest to canvas coordinates [x, y] within tolerance in pixels.
+
+        The point is returned both in canvas and world coordinates.
+        """
+        return self.snap_index.nearest_in_view(x, y, view, tolerance)
 
     def add_new_room(self, canvas_id, polygon):
         """Add new room into drawing."""
         room_id = "SAP1000" + str(self._room_counter)
-        self._rooms.append(
-            {"room_id": room_id, "canvas_id": canvas_id, "polygon": polygon}
-        )
+        self._rooms.add(room_id, polygon, canvas_id)
         self._room_counter += 1
         return room_id
 
@@ -152,7 +265,7 @@ class Drawing:
         typ: str = "?",
     ) -> None:
         """Update the polygon for specified room."""
-        room = self.find_room("room_id", room_id)
+        room = self._rooms.find_by_room_id(room_id)
         if room is not None:
             print("updating")
             print(room)
@@ -161,41 +274,34 @@ class Drawing:
             room["polygon"] = polygon
             room["type"] = typ
 
-    def find_room(
-        self, selector: str, value: int | str
-    ) -> Optional[dict[str, str | list[tuple[float, float]] | int | None]]:
+    def find_room(self, selector: str, value: int | str) -> Optional[RoomRecord]:
         """Find room for the specified selector and its value."""
+        if selector == "room_id":
+            return self._rooms.find_by_room_id(value)
+        if selector == "canvas_id":
+            return self._rooms.find_by_canvas_id(value)
         for room in self._rooms:
-            if room[selector] == value:
+            if room.get(selector) == value:
                 return room
         return None
 
-    def find_room_by_room_id(
-        self, canvas_id: str
-    ) -> Optional[dict[str, str | list[tuple[float, float]] | int | None]]:
+    def find_room_by_room_id(self, canvas_id: str) -> Optional[RoomRecord]:
         """Find room for the specified room ID."""
-        return self.find_room("room_id", canvas_id)
+        return self._rooms.find_by_room_id(canvas_id)
 
-    def find_room_by_canvas_id(
-        self, canvas_id: int
-    ) -> Optional[dict[str, str | list[tuple[float, float]] | int | None]]:
+    def find_room_by_canvas_id(self, canvas_id: int) -> Optional[RoomRecord]:
         """Find room for the specified canvas ID."""
-        return self.find_room("canvas_id", canvas_id)
+        return self._rooms.find_by_canvas_id(canvas_id)
 
     def delete_room(self, room_id) -> None:
         """Delete the whole room."""
-        room = self.find_room_by_room_id(room_id)
-        if room is not None:
-            # print(self._rooms)
-            self._rooms.remove(room)
-            # print(self._rooms)
+        self._rooms.delete(room_id)
 
     def delete_room_polygon(self, room_id: str) -> None:
         """Delete polygon for selected room."""
         print("DELETING ROOM POLYGON")
-        room = self.find_room_by_room_id(room_id)
+        room = self._rooms.find_by_room_id(room_id)
         if room is not None:
             room["polygon"] = None
             room["canvas_id"] = None
             print(room)
-            print(self._rooms)
@@ -13,9 +13,11 @@
 #
 
 
-from typing import Optional
+import math
+from typing import Any, Optional
 
 from entities.entity import Entity
+from geometry.affine_transform import AffineTransform
 from geometry.bounds import Bounds
 from gui.canvas import Canvas
 
@@ -23,6 +25,17 @@ from gui.canvas import Canvas
 class Arc(Entity):
     """Class that represents the two dimensional arc entity."""
 
+    __slots__ = (
+        "x",
+        "y",
+        "radius",
+        "angle1",
+        "angle2",
+        "color",
+        "layer",
+        "_id",
+    )
+
     def __init__(
         self,
         x: float,
@@ -63,23 +76,35 @@ class Arc(Entity):
 
     def draw(self, canvas: Canvas, xoffset: int, yoffset: int, scale: int) -> None:
         """Draw the two dimensional arc entity onto canvas."""
+        # draw the arc, remember the canvas ID of the new graphics entity
+        _, coords, options = self.canvas_item(xoffset, yoffset, scale)
+        self._id = canvas.create_arc(*coords, **options)
+
+    def canvas_item(
+        self, xoffset: float, yoffset: float, scale: float
+    ) -> tuple[str, tuple[float, ...], dict[str, Any]]:
+        """Return type, coordinates, and options of canvas item that represents the arc."""
         extent = self.angle2 - self.angle1
 
         # don't use negative angle, not well supported in Tkinter
         if extent < 0:
             extent += 360
 
-        # draw the arc, remember the canvas ID of the new graphics entity
-        self._id = canvas.create_arc(
-            self.x - self.radius,
-            self.y - self.radius,
-            self.x + self.radius,
-            self.y + self.radius,
-            start=self.angle1,
-            extent=extent,
-            outline="black",
-            style="arc",
-            tags="drawing",
+        # transform the center and radius into canvas coordinates
+        x = (self.x + xoffset) * scale
+        y = (self.y + yoffset) * scale
+        radius = self.radius * scale
+
+        return (
+            "arc",
+            (x - radius, y - radius, x + radius, y + radius),
+            {
+                "start": self.angle1,
+                "extent": extent,
+                "outline": "black",
+                "style": "arc",
+                "tags": "drawing",
+            },
         )
 
     def transform(self, xoffset: float, yoffset: float, scale: float) -> None:
@@ -92,6 +117,27 @@ class Arc(Entity):
         self.y *= scale
         self.radius *= scale
 
+    def endpoints(self) -> tuple[tuple[float, float], tuple[float, float]]:
+        """Compute both endpoints of the arc."""
+        # angles are measured in DXF coordinates, where y axis is flipped
+        start = math.radians(self.angle1)
+        end = math.radians(self.angle2)
+        return (
+            (self.x + self.radius * math.cos(start), self.y - self.radius * math.sin(start)),
+            (self.x + self.radius * math.cos(end), self.y - self.radius * math.sin(end)),
+        )
+
+    def distance(self, x: float, y: float) -> float:
+        """Compute distance of point [x, y] from the arc."""
+        angle = math.degrees(math.atan2(self.y - y, x - self.x))
+        if (angle - self.angle1) % 360.0 <= (self.angle2 - self.angle1) % 360.0:
+            return abs(math.hypot(x - self.x, y - self.y) - self.radius)
+        return min(math.hypot(x - px, y - py) for px, py in self.endpoints())
+
+    def snap_points(self) -> list[tuple[float, float]]:
+        """Return both endpoints of the arc."""
+        return list(self.endpoints())
+
     def get_bounds(self) -> Bounds:
         """Compute bounds for given entity."""
         return Bounds(
@@ -100,3 +146,21 @@ class Arc(Entity):
             self.x + self.radius,
             self.y + self.radius,
         )
+
+    @staticmethod
+    def transformed_angle(transform: AffineTransform, angle: float) -> float:
+        """Transform the angle (in degrees) measured counterclockwise with y axis flipped."""
+        radians = math.radians(angle)
+        x, y = transform.apply_vector(math.cos(radians), -math.sin(radians))
+        return math.degrees(math.atan2(-y, x))
+
+    def transformed(self, transform: AffineTransform) -> "Arc":
+        """Return copy of the entity transformed by given affine transformation."""
+        x, y = transform.apply(self.x, self.y)
+        radius = self.radius * transform.scale_factor
+        angle1 = Arc.transformed_angle(transform, self.angle1)
+        angle2 = Arc.transformed_angle(transform, self.angle2)
+        # mirroring changes the orientation of the arc
+        if transform.determinant < 0:
+            angle1, angle2 = angle2, angle1
+        return Arc(x, y, radius, angle1, angle2, self.color, self.layer)
@@ -0,0 +1,45 @@
+"""Module with class that represents block definition shared by all its references."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from typing import Any, Optional
+
+from geometry.bounds import Bounds
+
+
+class Block:
+    """Class that represents block definition shared by all its references (inserts).
+
+    Entities are stored relatively to the block base point.
+    """
+
+    def __init__(self, name: Optional[str] = None) -> None:
+        """Construct new empty block definition."""
+        self.name = name
+        self.base_x = 0.0
+        self.base_y = 0.0
+        self.entities: list[Any] = []
+        self._bounds: Optional[Bounds] = None
+
+    def move_to_base_point(self) -> None:
+        """Move all entities so the block base point is placed at origin."""
+        if self.base_x != 0.0 or self.base_y != 0.0:
+            for entity in self.entities:
+                entity.transform(-self.base_x, -self.base_y, 1.0)
+        self._bounds = None
+
+    def get_bounds(self) -> Bounds:
+        """Compute bounds for all entities in block, the result is cached."""
+        if self._bounds is None:
+            self._bounds = Bounds.compute_bounds(self.entities)
+        return self._bounds
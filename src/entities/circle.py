@@ -12,9 +12,11 @@
 #      Pavel Tisnovsky
 #
 
-from typing import Optional
+import math
+from typing import Any, Optional
 
 from entities.entity import Entity
+from geometry.affine_transform import AffineTransform
 from geometry.bounds import Bounds
 from gui.canvas import Canvas
 
@@ -22,6 +24,18 @@ from gui.canvas import Canvas
 class Circle(Entity):
     """Class that represents the two dimensional circle entity."""
 
+    __slots__ = (
+        "x",
+        "y",
+        "radius",
+        "color",
+        "layer",
+        "_id",
+    )
+
+    # options of canvas items representing circles
+    OPTIONS = {"tags": "drawing"}
+
     def __init__(
         self,
         x: float,
@@ -57,13 +71,18 @@ class Circle(Entity):
     def draw(self, canvas: Canvas, xoffset: int, yoffset: int, scale: int) -> None:
         """Draw the entity onto canvas."""
         # draw the circle, remember the canvas ID of the new graphics entity
-        self._id = canvas.create_oval(
-            self.x - self.radius,
-            self.y - self.radius,
-            self.x + self.radius,
-            self.y + self.radius,
-            tags="drawing",
-        )  # fill="red", tags="drawing")
+        _, coords, options = self.canvas_item(xoffset, yoffset, scale)
+        self._id = canvas.create_oval(*coords, **options)
+
+    def canvas_item(
+        self, xoffset: float, yoffset: float, scale: float
+    ) -> tuple[str, tuple[float, ...], dict[str, Any]]:
+        """Return type, coordinates, and options of canvas item that represents the circle."""
+        # transform the center and radius into canvas coordinates
+        x = (self.x + xoffset) * scale
+        y = (self.y + yoffset) * scale
+        radius = self.radius * scale
+        return "oval", (x - radius, y - radius, x + radius, y + radius), Circle.OPTIONS
 
     def transform(self, xoffset: float, yoffset: float, scale: float) -> None:
         """Perform the transformation of the entity into paper space."""
@@ -75,6 +94,10 @@ class Circle(Entity):
         self.y *= scale
         self.radius *= scale
 
+    def distance(self, x: float, y: float) -> float:
+        """Compute distance of point [x, y] from the circle."""
+        return abs(math.hypot(x - self.x, y - self.y) - self.radius)
+
     def get_bounds(self) -> Bounds:
         """Compute bounds for given entity."""
         return Bounds(
@@ -83,3 +106,9 @@ class Circle(Entity):
             self.x + self.radius,
             self.y + self.radius,
         )
+
+    def transformed(self, transform: AffineTransform) -> "Circle":
+        """Return copy of the entity transformed by given affine transformation."""
+        x, y = transform.apply(self.x, self.y)
+        radius = self.radius * transform.scale_factor
+        return Circle(x, y, radius, self.color, self.layer)
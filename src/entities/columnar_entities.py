@@ -0,0 +1,471 @@
+"""Entities of drawing stored by types in contiguous arrays (struct of arrays)."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from array import array
+from collections.abc import Iterable, Iterator
+from typing import Any, Optional
+
+from entities.arc import Arc
+from entities.circle import Circle
+from entities.entity import Entity
+from entities.line import Line
+from entities.polyline import Polyline
+from entities.text import Text
+from geometry.bounds import Bounds
+
+# NumPy is optional, columns are processed by pure Python code without it
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+class EntityColumns:
+    """Columns with coordinates, colors, and layers of all entities of one type."""
+
+    def __init__(self, names: tuple[str, ...]) -> None:
+        """Create empty float column for each coordinate name."""
+        self.names = names
+        for name in names:
+            setattr(self, name, array("d"))
+        self.color = array("h")
+        self.layer = array("I")
+
+    def __len__(self) -> int:
+        """Return number of entities stored in columns."""
+        return len(self.color)
+
+    def add(self, values: tuple[float, ...], color: int, layer: int) -> int:
+        """Add one entity, return its row."""
+        for name, value in zip(self.names, values):
+            getattr(self, name).append(value)
+        self.color.append(color)
+        self.layer.append(layer)
+        return len(self.color) - 1
+
+
+class ColumnarEntities:
+    """Entities of drawing stored by types in contiguous arrays (struct of arrays).
+
+    Coordinates are stored in float arrays, colors and layer indexes in small
+    integer arrays, and polyline vertexes in flat buffers with offsets. The
+    container behaves like a list of entities, lightweight views are created
+    on demand when entities are accessed one by one.
+    """
+
+    # kinds of entities (value stored for each entity)
+    LINE = 0
+    CIRCLE = 1
+    ARC = 2
+    TEXT = 3
+    POLYLINE = 4
+    # entities without columnar representation (inserts) are stored as objects
+    OBJECT = 5
+
+    # color stored for entities without color
+    NO_COLOR = -32768
+
+    def __init__(self, entities: Iterable[Entity] = ()) -> None:
+        """Create the container, optionally filled by given entities."""
+        # kind and row in table for each entity, in drawing order
+        self.kinds = array("B")
+        self.rows = array("I")
+        # canvas IDs, zero means that the entity is not drawn
+        self.ids = array("I")
+        # layer names are stored just once, None is used for entities without layer
+        self.layer_names: list[Optional[str]] = [None]
+        self.layer_indexes: dict[Optional[str], int] = {None: 0}
+        self.lines = EntityColumns(("x1", "y1", "x2", "y2"))
+        self.circles = EntityColumns(("x", "y", "radius"))
+        self.arcs = EntityColumns(("x", "y", "radius", "angle1", "angle2"))
+        self.texts = EntityColumns(("x", "y"))
+        self.text_strings: list[str] = []
+        self.polylines = EntityColumns(())
+        # vertexes of polyline stored in row R are in range offsets[R]:offsets[R+1]
+        self.polyline_offsets = array("I", [0])
+        self.points_x = array("d")
+        self.points_y = array("d")
+        self.objects: list[Entity] = []
+        self.tables = {
+            ColumnarEntities.LINE: self.lines,
+            ColumnarEntities.CIRCLE: self.circles,
+            ColumnarEntities.ARC: self.arcs,
+            ColumnarEntities.TEXT: self.texts,
+            ColumnarEntities.POLYLINE: self.polylines,
+        }
+        self.extend(entities)
+
+    def layer_index(self, layer: Optional[str]) -> int:
+        """Return index of layer name, new layers are registered."""
+        index = self.layer_indexes.get(layer)
+        if index is None:
+            index = len(self.layer_names)
+            self.layer_names.append(layer)
+            self.layer_indexes[layer] = index
+        return index
+
+    def add_entity(self, kind: int, row: int) -> None:
+        """Register new entity stored in given table row."""
+        self.kinds.append(kind)
+        self.rows.append(row)
+        self.ids.append(0)
+
+    def store_color(self, color: Optional[int]) -> int:
+        """Convert color code into value stored in column."""
+        return ColumnarEntities.NO_COLOR if color is None else color
+
+    def add_line(
+        self, x1: float, y1: float, x2: float, y2: float, color: Optional[int], layer: Optional[str]
+    ) -> None:
+        """Add new line."""
+        row = self.lines.add(
+            (x1, y1, x2, y2), self.store_color(color), self.layer_index(layer)
+        )
+        self.add_entity(ColumnarEntities.LINE, row)
+
+    def add_circle(
+        self, x: float, y: float, radius: float, color: Optional[int], layer: Optional[str]
+    ) -> None:
+        """Add new circle."""
+        row = self.circles.add((x, y, radius), self.store_color(color), self.layer_index(layer))
+        self.add_entity(ColumnarEntities.CIRCLE, row)
+
+    def add_arc(
+        self,
+        x: float,
+        y: float,
+        radius: float,
+        angle1: float,
+        angle2: float,
+        color: Optional[int],
+        layer: Optional[str],
+    ) -> None:
+        """Add new arc."""
+        row = self.arcs.add(
+            (x, y, radius, angle1, angle2), self.store_color(color), self.layer_index(layer)
+        )
+        self.add_entity(ColumnarEntities.ARC, row)
+
+    def add_text(
+        self, x: float, y: float, text: str, color: Optional[int], layer: Optional[str]
+    ) -> None:
+        """Add new text."""
+        row = self.texts.add((x, y), self.store_color(color), self.layer_index(layer))
+        self.text_strings.append(text)
+        self.add_entity(ColumnarEntities.TEXT, row)
+
+    def add_polyline(
+        self,
+        points_x: Iterable[float],
+        points_y: Iterable[float],
+        color: Optional[int],
+        layer: Optional[str],
+    ) -> None:
+        """Add new polyline."""
+        row = self.polylines.add((), self.store_color(color), self.layer_index(layer))
+        self.points_x.extend(points_x)
+        self.points_y.extend(points_y)
+        self.polyline_offsets.append(len(self.points_x))
+        self.add_entity(ColumnarEntities.POLYLINE, row)
+
+    def append(self, entity: Entity) -> None:
+        """Add the entity, it is converted into columns when possible."""
+        if isinstance(entity, Line):
+            self.add_line(
+                entity.x1, entity.y1, entity.x2, entity.y2, entity.color, entity.layer
+            )
+        elif isinstance(entity, Circle):
+            self.add_circle(entity.x, entity.y, entity.radius, entity.color, entity.layer)
+        elif isinstance(entity, Arc):
+            self.add_arc(
+                entity.x,
+                entity.y,
+                entity.radius,
+                entity.angle1,
+                entity.angle2,
+                entity.color,
+                entity.layer,
+            )
+        elif isinstance(entity, Text):
+            self.add_text(entity.x, entity.y, entity.text, entity.color, entity.layer)
+        elif isinstance(entity, Polyline):
+            self.add_polyline(entity.points_x, entity.points_y, entity.color, entity.layer)
+        else:
+            self.objects.append(entity)
+            self.add_entity(ColumnarEntities.OBJECT, len(self.objects) - 1)
+
+    def extend(self, entities: Iterable[Entity]) -> None:
+        """Add all given entities."""
+        for entity in entities:
+            self.append(entity)
+
+    def __len__(self) -> int:
+        """Return number of all entities."""
+        return len(self.kinds)
+
+    def view(self, index: int) -> Entity:
+        """Return view to entity with given index."""
+        kind = self.kinds[index]
+        if kind == ColumnarEntities.OBJECT:
+            return self.objects[self.rows[index]]
+        return VIEW_CLASSES[kind](self, index)
+
+    def __getitem__(self, index: Any) -> Any:
+        """Return view to entity, or list of views for slice."""
+        if isinstance(index, slice):
+            return [self.view(i) for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("entity index out of range")
+        return self.view(index)
+
+    def __iter__(self) -> Iterator[Entity]:
+        """Generate views to all entities in drawing order."""
+        for index in range(len(self.kinds)):
+            yield self.view(index)
+
+    def transform(self, xoffset: float, yoffset: float, scale: float) -> None:
+        """Perform the transformation of all entities into paper space."""
+        for columns, xnames, ynames in (
+            (self.lines, ("x1", "x2"), ("y1", "y2")),
+            (self.circles, ("x",), ("y",)),
+            (self.arcs, ("x",), ("y",)),
+            (self.texts, ("x",), ("y",)),
+        ):
+            for name in xnames:
+                ColumnarEntities.transform_column(getattr(columns, name), xoffset, scale)
+            for name in ynames:
+                ColumnarEntities.transform_column(getattr(columns, name), yoffset, scale)
+        ColumnarEntities.transform_column(self.circles.radius, 0.0, scale)
+        ColumnarEntities.transform_column(self.arcs.radius, 0.0, scale)
+        ColumnarEntities.transform_column(self.points_x, xoffset, scale)
+        ColumnarEntities.transform_column(self.points_y, yoffset, scale)
+        for entity in self.objects:
+            entity.transform(xoffset, yoffset, scale)
+
+    @staticmethod
+    def transform_column(column: array, offset: float, scale: float) -> None:
+        """Translate and scale all values in column, the same way as entities do."""
+        if numpy is not None:
+            # the view shares memory with the column, so the column is changed in place
+            values = numpy.frombuffer(column, dtype=numpy.float64)
+            values += offset
+            values *= scale
+            del values
+        else:
+            column[:] = array("d", [(value + offset) * scale for value in column])
+
+    @staticmethod
+    def column_bounds(xs: array, ys: array, radiuses: Optional[array] = None) -> Bounds:
+        """Compute bounds of points or circles with coordinates stored in columns."""
+        if numpy is not None:
+            x = numpy.frombuffer(xs, dtype=numpy.float64)
+            y = numpy.frombuffer(ys, dtype=numpy.float64)
+            if radiuses is None:
+                return Bounds(float(x.min()), float(y.min()), float(x.max()), float(y.max()))
+            r = numpy.frombuffer(radiuses, dtype=numpy.float64)
+            return Bounds(
+                float((x - r).min()),
+                float((y - r).min()),
+                float((x + r).max()),
+                float((y + r).max()),
+            )
+        if radiuses is None:
+            return Bounds(min(xs), min(ys), max(xs), max(ys))
+        return Bounds(
+            min(x - r for x, r in zip(xs, radiuses)),
+            min(y - r for y, r in zip(ys, radiuses)),
+            max(x + r for x, r in zip(xs, radiuses)),
+            max(y + r for y, r in zip(ys, radiuses)),
+        )
+
+    def get_bounds(self) -> Bounds:
+        """Compute bounds for all entities directly from columns."""
+        bounds = Bounds()
+        lines = self.lines
+        for xs, ys in (
+            (lines.x1, lines.y1),
+            (lines.x2, lines.y2),
+            (self.points_x, self.points_y),
+            (self.texts.x, self.texts.y),
+        ):
+            if xs:
+                bounds.enlarge(ColumnarEntities.column_bounds(xs, ys))
+        for columns in (self.circles, self.arcs):
+            if columns.x:
+                bounds.enlarge(ColumnarEntities.column_bounds(columns.x, columns.y, columns.radius))
+        for entity in self.objects:
+            bounds.enlarge(entity.get_bounds())
+        return bounds
+
+
+def column_property(name: str) -> property:
+    """Create property that reads and writes the value stored in column."""
+
+    def getter(view):
+        return getattr(view._columns, name)[view._row]
+
+    def setter(view, value):
+        getattr(view._columns, name)[view._row] = value
+
+    return property(getter, setter, doc=f"Value of {name} stored in column.")
+
+
+class EntityView:
+    """Mixin for lightweight views to entities stored in columns.
+
+    Slots are declared by view classes, because entity classes have their own slots.
+    """
+
+    __slots__ = ()
+
+    # kind of viewed entities
+    KIND = ColumnarEntities.LINE
+
+    def __init__(self, store: ColumnarEntities, index: int) -> None:
+        """Create view to entity with given index, entity constructor is not called."""
+        self._store = store
+        self._index = index
+        self._row = store.rows[index]
+        self._columns = store.tables[self.KIND]
+
+    @property
+    def color(self) -> Optional[int]:
+        """Color code of the entity."""
+        color = self._columns.color[self._row]
+        return None if color == ColumnarEntities.NO_COLOR else color
+
+    @color.setter
+    def color(self, color: Optional[int]) -> None:
+        """Set the color code of the entity."""
+        self._columns.color[self._row] = self._store.store_color(color)
+
+    @property
+    def layer(self) -> Optional[str]:
+        """Layer name of the entity."""
+        return self._store.layer_names[self._columns.layer[self._row]]
+
+    @layer.setter
+    def layer(self, layer: Optional[str]) -> None:
+        """Move the entity into another layer."""
+        self._columns.layer[self._row] = self._store.layer_index(layer)
+
+    @property
+    def _id(self) -> Optional[int]:
+        """Graphics entity ID on the canvas."""
+        return self._store.ids[self._index] or None
+
+    @_id.setter
+    def _id(self, canvas_id: Optional[int]) -> None:
+        """Set the graphics entity ID on the canvas."""
+        self._store.ids[self._index] = canvas_id or 0
+
+
+# attributes of all views
+VIEW_SLOTS = ("_store", "_index", "_row", "_columns")
+
+
+class LineView(EntityView, Line):
+    """View to line stored in columns."""
+
+    __slots__ = VIEW_SLOTS
+
+    KIND = ColumnarEntities.LINE
+    x1 = column_property("x1")
+    y1 = column_property("y1")
+    x2 = column_property("x2")
+    y2 = column_property("y2")
+
+
+class CircleView(EntityView, Circle):
+    """View to circle stored in columns."""
+
+    __slots__ = VIEW_SLOTS
+
+    KIND = ColumnarEntities.CIRCLE
+    x = column_property("x")
+    y = column_property("y")
+    radius = column_property("radius")
+
+
+class ArcView(EntityView, Arc):
+    """View to arc stored in columns."""
+
+    __slots__ = VIEW_SLOTS
+
+    KIND = ColumnarEntities.ARC
+    x = column_property("x")
+    y = column_property("y")
+    radius = column_property("radius")
+    angle1 = column_property("angle1")
+    angle2 = column_property("angle2")
+
+
+class TextView(EntityView, Text):
+    """View to text stored in columns."""
+
+    __slots__ = VIEW_SLOTS
+
+    KIND = ColumnarEntities.TEXT
+    x = column_property("x")
+    y = column_property("y")
+
+    @property
+    def text(self) -> str:
+        """The string displayed by text entity."""
+        return self._store.text_strings[self._row]
+
+    @text.setter
+    def text(self, text: str) -> None:
+        """Change the string displayed by text entity."""
+        self._store.text_strings[self._row] = text
+
+
+class PolylineView(EntityView, Polyline):
+    """View to polyline stored in columns, vertexes are returned as copies."""
+
+    __slots__ = VIEW_SLOTS
+
+    KIND = ColumnarEntities.POLYLINE
+
+    @property
+    def points_x(self) -> list[float]:
+        """Copy of x coordinates of all vertexes."""
+        offsets = self._store.polyline_offsets
+        return self._store.points_x[offsets[self._row] : offsets[self._row + 1]].tolist()
+
+    @property
+    def points_y(self) -> list[float]:
+        """Copy of y coordinates of all vertexes."""
+        offsets = self._store.polyline_offsets
+        return self._store.points_y[offsets[self._row] : offsets[self._row + 1]].tolist()
+
+    def transform(self, xoffset: float, yoffset: float, scale: float) -> None:
+        """Perform the transformation of the polyline stored in columns."""
+        offsets = self._store.polyline_offsets
+        start, end = offsets[self._row], offsets[self._row + 1]
+        for i in range(start, end):
+            self._store.points_x[i] = (self._store.points_x[i] + xoffset) * scale
+            self._store.points_y[i] = (self._store.points_y[i] + yoffset) * scale
+
+
+# view classes for all kinds of entities stored in columns
+VIEW_CLASSES = {
+    ColumnarEntities.LINE: LineView,
+    ColumnarEntities.CIRCLE: CircleView,
+    ColumnarEntities.ARC: ArcView,
+    ColumnarEntities.TEXT: TextView,
+    ColumnarEntities.POLYLINE: PolylineView,
+}
@@ -25,4 +25,5 @@ class DrawingEntityType(Enum):
     ARC = (4,)
     TEXT = (5,)
     POLYLINE = (6,)
-    ATTRIB = 7
+    ATTRIB = (7,)
+    INSERT = 8
@@ -13,21 +13,47 @@
 #
 
 from abc import ABC, abstractmethod
+from typing import Any, Optional
 
+from geometry.affine_transform import AffineTransform
 from geometry.bounds import Bounds
 
 
 class Entity(ABC):
     """Abstract class that represents any two dimensional entity."""
 
+    # entities don't need instance dictionaries, they are created in huge numbers
+    __slots__ = ()
+
     @abstractmethod
     def draw(self, canvas, xoffset, yoffset, scale):
         """Draw the entity onto canvas."""
 
+    def canvas_item(
+        self, xoffset: float, yoffset: float, scale: float
+    ) -> Optional[tuple[str, tuple[float, ...], dict[str, Any]]]:
+        """Return type, coordinates, and options of canvas item that represents the entity.
+
+        None is returned for entities that are not drawn as one canvas item.
+        """
+        return None
+
     @abstractmethod
     def transform(self, xoffset, yoffset, scale):
         """Perform the transformation of the entity into paper space."""
 
+    @abstractmethod
+    def distance(self, x: float, y: float) -> float:
+        """Compute distance of point [x, y] from the entity."""
+
+    def snap_points(self) -> list[tuple[float, float]]:
+        """Return endpoints and vertexes of the entity that the cursor can snap to."""
+        return []
+
     @abstractmethod
     def get_bounds(self) -> Bounds:
         """Compute bounds for given entity."""
+
+    @abstractmethod
+    def transformed(self, transform: AffineTransform) -> "Entity":
+        """Return copy of the entity transformed by given affine transformation."""
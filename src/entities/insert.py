@@ -0,0 +1,157 @@
+"""Module with class that represents reference to block (insert entity)."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import math
+from collections.abc import Iterable, Iterator
+from typing import Optional
+
+from entities.block import Block
+from entities.entity import Entity
+from geometry.affine_transform import AffineTransform
+from geometry.bounds import Bounds
+from gui.canvas import Canvas
+
+
+class Insert(Entity):
+    """Class that represents reference to block (insert entity).
+
+    Block entities are not copied, they are expanded lazily when needed.
+    """
+
+    __slots__ = (
+        "block_name",
+        "transform_matrix",
+        "color",
+        "layer",
+        "block",
+        "_id",
+    )
+
+    # protection against blocks that (indirectly) refer to themselves
+    MAX_NESTING = 16
+
+    # entities from this layer inherit layer of the insert
+    INHERITED_LAYER = "0"
+
+    # color BYBLOCK
+    INHERITED_COLOR = 0
+
+    def __init__(
+        self,
+        block_name: str,
+        transform: AffineTransform,
+        color: Optional[int],
+        layer: Optional[str],
+        block: Optional[Block] = None,
+    ) -> None:
+        """Construct new reference to block placed by given transformation."""
+        self.block_name = block_name
+        self.transform_matrix = transform
+        self.color = color
+        self.layer = layer
+        # block definition is resolved when the whole file is read
+        self.block = block
+        # graphics entity ID on the canvas
+        self._id = None
+
+    def expand(self, nesting: int = 0) -> Iterator[Entity]:
+        """Generate block entities transformed to the insert position."""
+        if self.block is None or nesting >= Insert.MAX_NESTING:
+            return
+        for entity in self.block.entities:
+            if isinstance(entity, Insert):
+                nested = entity.transformed(self.transform_matrix)
+                self.inherit_attributes(nested)
+                yield from nested.expand(nesting + 1)
+            else:
+                expanded = entity.transformed(self.transform_matrix)
+                self.inherit_attributes(expanded)
+                yield expanded
+
+    def inherit_attributes(self, entity: Entity) -> None:
+        """Set layer and color inherited from the insert."""
+        if entity.layer == Insert.INHERITED_LAYER:
+            entity.layer = self.layer
+        if entity.color == Insert.INHERITED_COLOR:
+            entity.color = self.color
+
+    @staticmethod
+    def expand_all(entities: Iterable[Entity]) -> Iterator[Entity]:
+        """Generate all entities, inserts are replaced by the entities from blocks."""
+        for entity in entities:
+            if isinstance(entity, Insert):
+                yield from entity.expand()
+            else:
+                yield entity
+
+    def str(self) -> str:
+        """Return textual representation of all entities from the block."""
+        return "\n".join(entity.str() for entity in self.expand())
+
+    def as_dict(self):
+        """Convert Insert entity into proper dictionary."""
+        t = self.transform_matrix
+        return {
+            "T": "I",
+            "block": self.block_name,
+            "transform": [t.a, t.b, t.c, t.d, t.e, t.f],
+            "color": self.color,
+            "layer": self.layer,
+        }
+
+    def draw(
+        self, canvas: Canvas, xoffset: int = 0, yoffset: int = 0, scale: int = 1
+    ) -> None:
+        """Draw all entities from the block onto canvas."""
+        for entity in self.expand():
+            entity.draw(canvas, xoffset, yoffset, scale)
+
+    def transform(self, xoffset: float, yoffset: float, scale: float) -> None:
+        """Perform the transformation of the entity into paper space."""
+        # block entities are shared, so just the insert placement is changed
+        paper = AffineTransform(scale, 0.0, 0.0, scale, xoffset * scale, yoffset * scale)
+        self.transform_matrix = paper.compose(self.transform_matrix)
+
+    def transformed(self, transform: AffineTransform) -> "Insert":
+        """Return copy of the entity transformed by given affine transformation."""
+        return Insert(
+            self.block_name,
+            transform.compose(self.transform_matrix),
+            self.color,
+            self.layer,
+            self.block,
+        )
+
+    def distance(self, x: float, y: float) -> float:
+        """Compute distance of point [x, y] from the nearest entity from the block."""
+        return min((entity.distance(x, y) for entity in self.expand()), default=math.inf)
+
+    def snap_points(self) -> list[tuple[float, float]]:
+        """Return snap points of all entities from the block."""
+        return [point for entity in self.expand() for point in entity.snap_points()]
+
+    def get_bounds(self) -> Bounds:
+        """Compute bounds for given entity from transformed bounds of the block."""
+        bounds = Bounds()
+        if self.block is None:
+            return bounds
+        block_bounds = self.block.get_bounds()
+        if block_bounds.xmin > block_bounds.xmax:
+            # empty block
+            return bounds
+        for x in (block_bounds.xmin, block_bounds.xmax):
+            for y in (block_bounds.ymin, block_bounds.ymax):
+                tx, ty = self.transform_matrix.apply(x, y)
+                bounds.enlarge(Bounds(tx, ty, tx, ty))
+        return bounds
@@ -13,16 +13,31 @@
 #
 
 
-from typing import Optional
+from typing import Any, Optional
 
 from entities.entity import Entity
+from geometry.affine_transform import AffineTransform
 from geometry.bounds import Bounds
+from geometry.utils import GeometryUtils
 from gui.canvas import Canvas
 
 
 class Line(Entity):
     """Class that represents the two dimensional line entity."""
 
+    __slots__ = (
+        "x1",
+        "y1",
+        "x2",
+        "y2",
+        "color",
+        "layer",
+        "_id",
+    )
+
+    # options of canvas items representing lines
+    OPTIONS = {"fill": "black", "tags": "drawing"}
+
     def __init__(
         self,
         x1: float,
@@ -59,9 +74,25 @@ class Line(Entity):
         }
 
     def draw(
-        self, canvas: Canvas, xoffset: int = 0, yoffset: int = 0, scale: int = 1
+        self,
+        canvas: Canvas,
+        xoffset: int = 0,
+        yoffset: int = 0,
+        scale: int = 1,
+        item: Optional[int] = None,
     ) -> None:
-        """Draw the entity onto canvas."""
+        """Draw the entity onto canvas, existing line item is moved when it is specified."""
+        _, coords, options = self.canvas_item(xoffset, yoffset, scale)
+        if item is None:
+            self._id = canvas.create_line(*coords, **options)
+        else:
+            canvas.coords(item, *coords)
+            self._id = item
+
+    def canvas_item(
+        self, xoffset: float, yoffset: float, scale: float
+    ) -> tuple[str, tuple[float, ...], dict[str, Any]]:
+        """Return type, coordinates, and options of canvas item that represents the line."""
         # step 1: translate
         x1 = self.x1 + xoffset
         y1 = self.y1 + yoffset
@@ -72,7 +103,7 @@ class Line(Entity):
         y1 *= scale
         x2 *= scale
         y2 *= scale
-        self._id = canvas.create_line(x1, y1, x2, y2, fill="black", tags="drawing")
+        return "line", (x1, y1, x2, y2), Line.OPTIONS
 
     def transform(self, xoffset: float, yoffset: float, scale: float) -> None:
         """Perform the transformation of the entity into paper space."""
@@ -85,6 +116,14 @@ class Line(Entity):
         self.x2 *= scale
         self.y2 *= scale
 
+    def distance(self, x: float, y: float) -> float:
+        """Compute distance of point [x, y] from the entity."""
+        return GeometryUtils.segment_distance(x, y, self.x1, self.y1, self.x2, self.y2)
+
+    def snap_points(self) -> list[tuple[float, float]]:
+        """Return both endpoints of the line."""
+        return [(self.x1, self.y1), (self.x2, self.y2)]
+
     def get_bounds(self) -> Bounds:
         """Compute bounds for given entity."""
         return Bounds(
@@ -93,3 +132,9 @@ class Line(Entity):
             max(self.x1, self.x2),
             max(self.y1, self.y2),
         )
+
+    def transformed(self, transform: AffineTransform) -> "Line":
+        """Return copy of the entity transformed by given affine transformation."""
+        x1, y1 = transform.apply(self.x1, self.y1)
+        x2, y2 = transform.apply(self.x2, self.y2)
+        return Line(x1, y1, x2, y2, self.color, self.layer)
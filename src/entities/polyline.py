@@ -12,17 +12,28 @@
 #      Pavel Tisnovsky
 #
 
+import math
 import sys
 from typing import Optional
 
 from entities.entity import Entity
+from geometry.affine_transform import AffineTransform
 from geometry.bounds import Bounds
+from geometry.utils import GeometryUtils
 from gui.canvas import Canvas
 
 
 class Polyline(Entity):
     """Class that represents the two dimensional polyline entity."""
 
+    __slots__ = (
+        "points_x",
+        "points_y",
+        "color",
+        "layer",
+        "_id",
+    )
+
     def __init__(
         self,
         points_x: list[float],
@@ -71,16 +82,14 @@ class Polyline(Entity):
             points.append(y)
         # special polyline used for selecting room
         if self.layer is not None and self.layer == "CKPOPISM_PLOCHA":
-            new_object = canvas.create_polygon(
-                points, fill="", width=2, activeoutline="red", outline="green"
-            )
-            self._id = new_object
-            canvas.tag_bind(
-                new_object,
-                "<ButtonPress-1>",
-                lambda event, new_object=new_object: canvas.on_polygon_for_room_click(
-                    new_object
-                ),
+            # click is handled by binding of the tag on canvas
+            self._id = canvas.create_polygon(
+                points,
+                fill="",
+                width=2,
+                activeoutline="red",
+                outline="green",
+                tags="room_select",
             )
         # just a regular polyline
         else:
@@ -88,13 +97,27 @@ class Polyline(Entity):
 
     def transform(self, xoffset: float, yoffset: float, scale: float) -> None:
         """Perform the transformation of the entity into paper space."""
-        for i in range(len(self.points_x)):
-            # step 1: translate
-            self.points_x[i] = self.points_x[i] + xoffset
-            self.points_y[i] = self.points_y[i] + yoffset
-            # step 2: scale
-            self.points_x[i] *= scale
-            self.points_y[i] *= scale
+        # translate and scale, vertex lists are updated in place
+        self.points_x[:] = [(x + xoffset) * scale for x in self.points_x]
+        self.points_y[:] = [(y + yoffset) * scale for y in self.points_y]
+
+    def distance(self, x: float, y: float) -> float:
+        """Compute distance of point [x, y] from the entity, polylines are drawn as closed."""
+        points_x = self.points_x
+        points_y = self.points_y
+        if not points_x:
+            return math.inf
+        # the last edge closes the polygon
+        return min(
+            GeometryUtils.segment_distance(
+                x, y, points_x[i - 1], points_y[i - 1], points_x[i], points_y[i]
+            )
+            for i in range(len(points_x))
+        )
+
+    def snap_points(self) -> list[tuple[float, float]]:
+        """Return all vertexes of the polyline."""
+        return list(zip(self.points_x, self.points_y))
 
     def get_bounds(self) -> Bounds:
         """Compute bounds for given entity."""
@@ -118,3 +141,13 @@ class Polyline(Entity):
                 ymax = y
 
         return Bounds(xmin, ymin, xmax, ymax)
+
+    def transformed(self, transform: AffineTransform) -> "Polyline":
+        """Return copy of the entity transformed by given affine transformation."""
+        points_x = []
+        points_y = []
+        for x, y in zip(self.points_x, self.points_y):
+            x, y = transform.apply(x, y)
+            points_x.append(x)
+            points_y.append(y)
+        return Polyline(points_x, points_y, self.color, self.layer)
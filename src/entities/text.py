@@ -13,9 +13,11 @@
 #
 
 
-from typing import Optional
+import math
+from typing import Any, Optional
 
 from entities.entity import Entity
+from geometry.affine_transform import AffineTransform
 from geometry.bounds import Bounds
 from gui.canvas import Canvas
 
@@ -23,6 +25,15 @@ from gui.canvas import Canvas
 class Text(Entity):
     """Class that represents the two dimensional text entity."""
 
+    __slots__ = (
+        "x",
+        "y",
+        "text",
+        "color",
+        "layer",
+        "_id",
+    )
+
     def __init__(
         self, x: float, y: float, text: str, color: Optional[int], layer: Optional[str]
     ) -> None:
@@ -58,13 +69,20 @@ class Text(Entity):
 
     def draw(self, canvas: Canvas, xoffset: int, yoffset: int, scale: int) -> None:
         """Draw the entity onto canvas."""
+        _, coords, options = self.canvas_item(xoffset, yoffset, scale)
+        self._id = canvas.create_text(*coords, **options)
+
+    def canvas_item(
+        self, xoffset: float, yoffset: float, scale: float
+    ) -> tuple[str, tuple[float, ...], dict[str, Any]]:
+        """Return type, coordinates, and options of canvas item that represents the text."""
         # step 1: translate
         x = self.x + xoffset
         y = self.y + yoffset
         # step 2: scale
         x *= scale
         y *= scale
-        self._id = canvas.create_text(x, y, text=self.text, fill="blue", tags="drawing")
+        return "text", (x, y), {"text": self.text, "fill": "blue", "tags": "drawing"}
 
     def transform(self, xoffset: float, yoffset: float, scale: float) -> None:
         """Perform the transformation of the entity into paper space."""
@@ -75,6 +93,15 @@ class Text(Entity):
         self.x *= scale
         self.y *= scale
 
+    def distance(self, x: float, y: float) -> float:
+        """Compute distance of point [x, y] from the text anchor."""
+        return math.hypot(x - self.x, y - self.y)
+
     def get_bounds(self) -> Bounds:
         """Compute bounds for given entity."""
         return Bounds(self.x, self.y, self.x, self.y)
+
+    def transformed(self, transform: AffineTransform) -> "Text":
+        """Return copy of the entity transformed by given affine transformation."""
+        x, y = transform.apply(self.x, self.y)
+        return Text(x, y, self.text, self.color, self.layer)
@@ -16,6 +16,7 @@ from datetime import datetime
 from io import TextIOWrapper
 
 from drawing import Drawing
+from entities.insert import Insert
 from geometry.bounds import Bounds
 from geometry.rescaler import Rescaler
 
@@ -42,7 +43,8 @@ class DrawingExporter:
     def __init__(self, filename: str, drawing: Drawing) -> None:
         """Initialize the exporter, set the filename to be created and a sequence of entities."""
         self.filename = filename
-        self.entities = drawing.entities
+        # the format does not support blocks, so inserts are exploded
+        self.entities = list(Insert.expand_all(drawing.entities))
         self.rooms = drawing.rooms
         self.drawing_id = drawing.drawing_id
 
@@ -16,6 +16,7 @@
 import json
 from datetime import datetime
 
+from entities.insert import Insert
 from geometry.bounds import Bounds
 from geometry.rescaler import Rescaler
 
@@ -38,7 +39,8 @@ class JSONExporter:
     def __init__(self, filename, drawing) -> None:
         """Initialize the exporter, set the filename to be created and a sequence of entities."""
         self.filename = filename
-        self.entities = drawing.entities
+        # the format does not support blocks, so inserts are exploded
+        self.entities = list(Insert.expand_all(drawing.entities))
         self.rooms = drawing.rooms
 
     @staticmethod
@@ -91,7 +93,7 @@ class JSONExporter:
             "entities_count": len(self.entities),
             "rooms_count": len(self.rooms),
             "entities": entities_list,
-            "rooms": self.rooms,
+            "rooms": self.rooms.as_dicts(),
         }
 
     def as_string(self):
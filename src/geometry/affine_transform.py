@@ -0,0 +1,89 @@
+"""Module with class that represents two dimensional affine transformation."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import math
+
+
+class AffineTransform:
+    """Class that represents two dimensional affine transformation.
+
+    Point [x, y] is transformed into [a*x + c*y + e, b*x + d*y + f].
+    """
+
+    def __init__(
+        self,
+        a: float = 1.0,
+        b: float = 0.0,
+        c: float = 0.0,
+        d: float = 1.0,
+        e: float = 0.0,
+        f: float = 0.0,
+    ) -> None:
+        """Construct new transformation, identity is constructed by default."""
+        self.a = a
+        self.b = b
+        self.c = c
+        self.d = d
+        self.e = e
+        self.f = f
+
+    @staticmethod
+    def translation(dx: float, dy: float) -> "AffineTransform":
+        """Construct the translation by given offsets."""
+        return AffineTransform(e=dx, f=dy)
+
+    @staticmethod
+    def scaling(sx: float, sy: float) -> "AffineTransform":
+        """Construct the scaling by given factors."""
+        return AffineTransform(a=sx, d=sy)
+
+    @staticmethod
+    def rotation(angle: float) -> "AffineTransform":
+        """Construct the rotation by given angle (in radians)."""
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+        return AffineTransform(cos, sin, -sin, cos)
+
+    def __repr__(self) -> str:
+        """Return textual representation of the transformation."""
+        return f"[{self.a}, {self.b}, {self.c}, {self.d}, {self.e}, {self.f}]"
+
+    def compose(self, other: "AffineTransform") -> "AffineTransform":
+        """Return transformation that applies other transformation first and then this one."""
+        return AffineTransform(
+            self.a * other.a + self.c * other.b,
+            self.b * other.a + self.d * other.b,
+            self.a * other.c + self.c * other.d,
+            self.b * other.c + self.d * other.d,
+            self.a * other.e + self.c * other.f + self.e,
+            self.b * other.e + self.d * other.f + self.f,
+        )
+
+    def apply(self, x: float, y: float) -> tuple[float, float]:
+        """Transform the point [x, y]."""
+        return self.a * x + self.c * y + self.e, self.b * x + self.d * y + self.f
+
+    def apply_vector(self, x: float, y: float) -> tuple[float, float]:
+        """Transform the vector [x, y], ie. without translation."""
+        return self.a * x + self.c * y, self.b * x + self.d * y
+
+    @property
+    def determinant(self) -> float:
+        """Determinant of the linear part, negative value means mirroring."""
+        return self.a * self.d - self.b * self.c
+
+    @property
+    def scale_factor(self) -> float:
+        """Scale factor for lengths (exact for uniform scaling)."""
+        return math.sqrt(abs(self.determinant))
@@ -39,6 +39,15 @@ class Bounds:
         self.xmax = max(self.xmax, other.xmax)
         self.ymax = max(self.ymax, other.ymax)
 
+    def contains(self, other: "Bounds") -> bool:
+        """Check if the other bounds lie inside this area."""
+        return (
+            self.xmin <= other.xmin
+            and self.ymin <= other.ymin
+            and self.xmax >= other.xmax
+            and self.ymax >= other.ymax
+        )
+
     def __repr__(self) -> str:
         """Return textual representation of the bound."""
         return f"[{self.xmin}, {self.ymin}] - [{self.xmax}, {self.ymax}]"
@@ -47,7 +56,17 @@ class Bounds:
     def compute_bounds(entities: list[Any]) -> "Bounds":
         """Compute bounds for all given entities."""
         # initial settings - empty bounds area
-        bounds = Bounds()
+        xmin = ymin = sys.float_info.max
+        xmax = ymax = -sys.float_info.max
+        # the result is accumulated in local variables, not by enlarge() calls
         for entity in entities:
-            bounds.enlarge(entity.get_bounds())
-        return bounds
+            bounds = entity.get_bounds()
+            if bounds.xmin < xmin:
+                xmin = bounds.xmin
+            if bounds.ymin < ymin:
+                ymin = bounds.ymin
+            if bounds.xmax > xmax:
+                xmax = bounds.xmax
+            if bounds.ymax > ymax:
+                ymax = bounds.ymax
+        return Bounds(xmin, ymin, xmax, ymax)
@@ -0,0 +1,121 @@
+"""Index of points that the cursor snaps to (endpoints and vertexes of entities)."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import math
+from array import array
+from collections.abc import Iterable
+from typing import Optional
+
+from entities.entity import Entity
+from geometry.bounds import Bounds
+from geometry.spatial_index import SpatialIndex
+from geometry.view_transform import ViewTransform
+
+
+class SnapIndex:
+    """Index of points that the cursor snaps to (endpoints and vertexes of entities).
+
+    Points are stored in world coordinates in flat arrays and hashed into
+    square cells, queries in canvas coordinates are transformed by the view,
+    so the index is not rebuilt when the view is zoomed or moved.
+    """
+
+    # average number of points in one cell
+    POINTS_PER_CELL = 4
+
+    def __init__(self, cell_size: float) -> None:
+        """Construct empty index with given size of cells (in world coordinates)."""
+        self.cell_size = cell_size
+        self.points_x = array("d")
+        self.points_y = array("d")
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        # range of cells that contain at least one point
+        self.cell_min = [math.inf, math.inf]
+        self.cell_max = [-math.inf, -math.inf]
+
+    @staticmethod
+    def build(entities: Iterable[Entity], bounds: Bounds) -> "SnapIndex":
+        """Build the index for snap points of all entities."""
+        points = [point for entity in entities for point in entity.snap_points()]
+        area = (bounds.xmax - bounds.xmin) * (bounds.ymax - bounds.ymin)
+        if points and area > 0.0:
+            cell_size = math.sqrt(area * SnapIndex.POINTS_PER_CELL / len(points))
+        else:
+            cell_size = max(bounds.xmax - bounds.xmin, bounds.ymax - bounds.ymin, 1.0)
+        index = SnapIndex(cell_size)
+        for x, y in points:
+            index.add(x, y)
+        return index
+
+    def __len__(self) -> int:
+        """Return number of points in index."""
+        return len(self.points_x)
+
+    def add(self, x: float, y: float) -> None:
+        """Add new snap point."""
+        cx, cy = math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+        self.cell_min = [min(self.cell_min[0], cx), min(self.cell_min[1], cy)]
+        self.cell_max = [max(self.cell_max[0], cx), max(self.cell_max[1], cy)]
+        cell_key = (cx, cy)
+        cell = self.cells.get(cell_key)
+        if cell is None:
+            self.cells[cell_key] = [len(self.points_x)]
+        else:
+            cell.append(len(self.points_x))
+        self.points_x.append(x)
+        self.points_y.append(y)
+
+    def nearest(self, x: float, y: float, max_distance: float) -> Optional[tuple[float, float]]:
+        """Return the nearest snap point within given distance from point [x, y]."""
+        points_x = self.points_x
+        points_y = self.points_y
+        best = None
+        best_distance = max_distance
+        if not self.cells:
+            return None
+        cx, cy = math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+        # rings outside the populated part of grid are empty
+        (xmin, ymin), (xmax, ymax) = self.cell_min, self.cell_max
+        last = max(cx - xmin, xmax - cx, cy - ymin, ymax - cy)
+        radius = max(0, cx - xmax, xmin - cx, cy - ymax, ymin - cy)
+        # only cells that are not farther than max_distance need to be visited
+        if max_distance < math.inf:
+            last = min(last, math.ceil(max_distance / self.cell_size))
+        while radius <= last:
+            # points in next rings are farther than radius * cell_size
+            if radius > 0 and (radius - 1) * self.cell_size > best_distance:
+                break
+            for cell_key in SpatialIndex.ring(cx, cy, radius):
+                cell = self.cells.get(cell_key)
+                if cell is not None:
+                    for i in cell:
+                        d = math.hypot(points_x[i] - x, points_y[i] - y)
+                        if d <= best_distance:
+                            best, best_distance = i, d
+            radius += 1
+        return None if best is None else (points_x[best], points_y[best])
+
+    def nearest_in_view(
+        self, x: float, y: float, view: ViewTransform, tolerance: float
+    ) -> Optional[tuple[float, float, float, float]]:
+        """Return the nearest snap point for canvas coordinates [x, y] and tolerance in pixels.
+
+        The point is returned both in canvas and world coordinates.
+        """
+        world_x, world_y = view.inverse(x, y)
+        point = self.nearest(world_x, world_y, tolerance / view.scale)
+        if point is None:
+            return None
+        canvas_x, canvas_y = view.apply(*point)
+        return canvas_x, canvas_y, point[0], point[1]
@@ -0,0 +1,232 @@
+"""Spatial index over bounds of drawing entities (uniform grid)."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import math
+from array import array
+from collections.abc import Callable, Iterable
+from typing import Optional
+
+from geometry.bounds import Bounds
+
+
+class SpatialIndex:
+    """Spatial index over bounds of drawing entities (uniform grid).
+
+    Entities are identified by keys (their positions in drawing), the plane is
+    divided into square cells and each cell contains keys of all entities whose
+    bounds intersect the cell. Distances to entities are computed by callbacks,
+    so the index does not depend on entity types.
+    """
+
+    # average number of entities in one cell
+    ENTITIES_PER_CELL = 4
+
+    # entities that span more cells are not stored in cells, they are always tested
+    MAX_CELLS = 64
+
+    def __init__(self, bounds: Bounds, count: int) -> None:
+        """Construct empty index, cell size is derived from drawing bounds and size."""
+        width = bounds.xmax - bounds.xmin
+        height = bounds.ymax - bounds.ymin
+        area = width * height
+        if count > 0 and area > 0.0:
+            self.cell_size = math.sqrt(area * SpatialIndex.ENTITIES_PER_CELL / count)
+        else:
+            self.cell_size = max(width, height, 1.0)
+        self.cells: dict[tuple[int, int], list[int]] = {}
+        # keys of entities spanning too many cells
+        self.large: set[int] = set()
+        # bounds of all entities, four values for each key, NaN for keys not in index
+        self.boxes = array("d")
+        self.size = 0
+        # range of cells that contain at least one entity
+        self.cell_min = [math.inf, math.inf]
+        self.cell_max = [-math.inf, -math.inf]
+
+    @staticmethod
+    def build(boxes: Iterable[Bounds], bounds: Bounds, count: int) -> "SpatialIndex":
+        """Build the index for bounds of all entities, keys are assigned in order."""
+        index = SpatialIndex(bounds, count)
+        for key, box in enumerate(boxes):
+            index.insert(key, box)
+        return index
+
+    def __len__(self) -> int:
+        """Return number of entities in index."""
+        return self.size
+
+    def cell_range(
+        self, xmin: float, ymin: float, xmax: float, ymax: float
+    ) -> tuple[int, int, int, int]:
+        """Return range of cells that intersect given rectangle."""
+        size = self.cell_size
+        return (
+            math.floor(xmin / size),
+            math.floor(ymin / size),
+            math.floor(xmax / size),
+            math.floor(ymax / size),
+        )
+
+    def box(self, key: int) -> Optional[tuple[float, float, float, float]]:
+        """Return bounds of entity with given key, None when the entity is not in index."""
+        if 4 * key >= len(self.boxes) or math.isnan(self.boxes[4 * key]):
+            return None
+        return tuple(self.boxes[4 * key : 4 * key + 4])
+
+    def insert(self, key: int, bounds: Bounds) -> None:
+        """Insert entity with given key and bounds, entities without bounds are ignored."""
+        if bounds.xmin > bounds.xmax or bounds.ymin > bounds.ymax:
+            return
+        missing = 4 * (key + 1) - len(self.boxes)
+        if missing > 0:
+            self.boxes.extend([math.nan] * missing)
+        self.boxes[4 * key : 4 * key + 4] = array(
+            "d", (bounds.xmin, bounds.ymin, bounds.xmax, bounds.ymax)
+        )
+        self.size += 1
+        x1, y1, x2, y2 = self.cell_range(bounds.xmin, bounds.ymin, bounds.xmax, bounds.ymax)
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > SpatialIndex.MAX_CELLS:
+            self.large.add(key)
+            return
+        self.cell_min = [min(self.cell_min[0], x1), min(self.cell_min[1], y1)]
+        self.cell_max = [max(self.cell_max[0], x2), max(self.cell_max[1], y2)]
+        cells = self.cells
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                cell = cells.get((cx, cy))
+                if cell is None:
+                    cells[(cx, cy)] = [key]
+                else:
+                    cell.append(key)
+
+    def remove(self, key: int) -> None:
+        """Remove entity with given key from index."""
+        box = self.box(key)
+        if box is None:
+            return
+        self.boxes[4 * key : 4 * key + 4] = array("d", [math.nan] * 4)
+        self.size -= 1
+        if key in self.large:
+            self.large.discard(key)
+            return
+        x1, y1, x2, y2 = self.cell_range(*box)
+        for cx in range(x1, x2 + 1):
+            for cy in range(y1, y2 + 1):
+                cell = self.cells[(cx, cy)]
+                cell.remove(key)
+                if not cell:
+                    del self.cells[(cx, cy)]
+
+    def update(self, key: int, bounds: Bounds) -> None:
+        """Update bounds of entity that has been changed."""
+        self.remove(key)
+        self.insert(key, bounds)
+
+    def intersects(self, key: int, xmin: float, ymin: float, xmax: float, ymax: float) -> bool:
+        """Check if bounds of entity intersect given rectangle."""
+        boxes = self.boxes
+        i = 4 * key
+        return boxes[i] <= xmax and boxes[i + 2] >= xmin and boxes[i + 1] <= ymax and boxes[
+            i + 3
+        ] >= ymin
+
+    def in_rectangle(self, rectangle: Bounds) -> list[int]:
+        """Return keys of all entities whose bounds intersect given rectangle, in key order."""
+        xmin, ymin, xmax, ymax = rectangle.xmin, rectangle.ymin, rectangle.xmax, rectangle.ymax
+        x1, y1, x2, y2 = self.cell_range(xmin, ymin, xmax, ymax)
+        # the rectangle is clipped to cells that contain anything
+        x1 = max(x1, self.cell_min[0])
+        y1 = max(y1, self.cell_min[1])
+        x2 = min(x2, self.cell_max[0])
+        y2 = min(y2, self.cell_max[1])
+        found = {key for key in self.large if self.intersects(key, xmin, ymin, xmax, ymax)}
+        cells = self.cells
+        if (x2 - x1 + 1) * (y2 - y1 + 1) > len(cells):
+            # the rectangle is larger than the populated part of grid
+            candidates: Iterable[tuple[int, int]] = (
+                cell for cell in cells if x1 <= cell[0] <= x2 and y1 <= cell[1] <= y2
+            )
+        else:
+            candidates = ((cx, cy) for cx in range(x1, x2 + 1) for cy in range(y1, y2 + 1))
+        for cell_key in candidates:
+            cell = cells.get(cell_key)
+            if cell is not None:
+                for key in cell:
+                    if key not in found and self.intersects(key, xmin, ymin, xmax, ymax):
+                        found.add(key)
+        return sorted(found)
+
+    @staticmethod
+    def ring(cx: int, cy: int, radius: int) -> Iterable[tuple[int, int]]:
+        """Generate cells in given Chebyshev distance from the cell [cx, cy]."""
+        if radius == 0:
+            yield cx, cy
+            return
+        for x in range(cx - radius, cx + radius + 1):
+            yield x, cy - radius
+            yield x, cy + radius
+        for y in range(cy - radius + 1, cy + radius):
+            yield cx - radius, y
+            yield cx + radius, y
+
+    def nearest(
+        self,
+        x: float,
+        y: float,
+        distance: Callable[[int], float],
+        max_distance: float = math.inf,
+        accept: Optional[Callable[[int], bool]] = None,
+    ) -> Optional[int]:
+        """Return key of the nearest accepted entity within given distance from point [x, y]."""
+        best = None
+        best_distance = max_distance
+        seen: set[int] = set()
+
+        def visit(key: int) -> None:
+            nonlocal best, best_distance
+            seen.add(key)
+            if accept is not None and not accept(key):
+                return
+            d = distance(key)
+            if d <= best_distance:
+                best, best_distance = key, d
+
+        for key in self.large:
+            visit(key)
+        if not self.cells:
+            return best
+        cx, cy = math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+        # rings outside the populated part of grid are empty
+        (xmin, ymin), (xmax, ymax) = self.cell_min, self.cell_max
+        last = max(cx - xmin, xmax - cx, cy - ymin, ymax - cy)
+        radius = max(0, cx - xmax, xmin - cx, cy - ymax, ymin - cy)
+        while radius <= last:
+            # entities in next rings are farther than radius * cell_size
+            if radius > 0 and (radius - 1) * self.cell_size > best_distance:
+                break
+            for cell_key in SpatialIndex.ring(cx, cy, radius):
+                cell = self.cells.get(cell_key)
+                if cell is not None:
+                    for key in cell:
+                        if key not in seen:
+                            visit(key)
+            radius += 1
+        return best
+
+    def at_point(
+        self, x: float, y: float, tolerance: float, distance: Callable[[int], float]
+    ) -> list[int]:
+        """Return keys of all entities within given tolerance from point [x, y], in key order."""
+        rectangle = Bounds(x - tolerance, y - tolerance, x + tolerance, y + tolerance)
+        return [key for key in self.in_rectangle(rectangle) if distance(key) <= tolerance]
@@ -12,6 +12,8 @@
 #      Pavel Tisnovsky
 #
 
+import math
+
 
 class GeometryUtils:
     """Class with various geometry related utility functions."""
@@ -20,3 +22,17 @@ class GeometryUtils:
     def square_length(x1: float, y1: float, x2: float, y2: float) -> float:
         """Compute square length."""
         return (x1 - x2) ** 2 + (y1 - y2) ** 2
+
+    @staticmethod
+    def segment_distance(
+        x: float, y: float, x1: float, y1: float, x2: float, y2: float
+    ) -> float:
+        """Compute distance of point [x, y] from line segment [x1, y1] - [x2, y2]."""
+        dx = x2 - x1
+        dy = y2 - y1
+        length = dx * dx + dy * dy
+        if length == 0.0:
+            return math.hypot(x - x1, y - y1)
+        # parameter of the nearest point on segment, clamped to segment endpoints
+        t = max(0.0, min(1.0, ((x - x1) * dx + (y - y1) * dy) / length))
+        return math.hypot(x - x1 - t * dx, y - y1 - t * dy)
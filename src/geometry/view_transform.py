@@ -0,0 +1,66 @@
+"""Transformation of world coordinates of drawing into canvas coordinates."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from geometry.affine_transform import AffineTransform
+from geometry.bounds import Bounds
+from geometry.rescaler import Rescaler
+
+
+class ViewTransform:
+    """Transformation of world coordinates of drawing into canvas coordinates.
+
+    World coordinates of entities are never changed, point [x, y] is displayed
+    on canvas at [(x + xoffset) * scale, (y + yoffset) * scale].
+    """
+
+    def __init__(self, xoffset: float = 0.0, yoffset: float = 0.0, scale: float = 1.0) -> None:
+        """Construct new transformation, identity is constructed by default."""
+        self.xoffset = xoffset
+        self.yoffset = yoffset
+        self.scale = scale
+
+    @staticmethod
+    def fit(bounds: Bounds, width: int, height: int) -> "ViewTransform":
+        """Construct the transformation that fits given bounds into canvas."""
+        return ViewTransform(*Rescaler.compute_scale(bounds, width, height))
+
+    def __repr__(self) -> str:
+        """Return textual representation of the transformation."""
+        return f"[{self.xoffset}, {self.yoffset}] * {self.scale}"
+
+    def apply(self, x: float, y: float) -> tuple[float, float]:
+        """Transform the point [x, y] from world into canvas coordinates."""
+        return (x + self.xoffset) * self.scale, (y + self.yoffset) * self.scale
+
+    def inverse(self, x: float, y: float) -> tuple[float, float]:
+        """Transform the point [x, y] from canvas into world coordinates."""
+        return x / self.scale - self.xoffset, y / self.scale - self.yoffset
+
+    def apply_polygon(self, polygon: list[tuple[float, float]]) -> list[tuple[float, float]]:
+        """Transform all vertexes of polygon into canvas coordinates."""
+        return [self.apply(x, y) for x, y in polygon]
+
+    def zoom(self, factor: float, x: float, y: float) -> None:
+        """Zoom the view by given factor, point [x, y] on canvas stays on its place."""
+        scale = self.scale * factor
+        # entities are not touched, so zooming doesn't accumulate errors in their coordinates
+        self.xoffset += x * (1.0 - factor) / scale
+        self.yoffset += y * (1.0 - factor) / scale
+        self.scale = scale
+
+    def as_affine(self) -> AffineTransform:
+        """Return the same transformation represented as general affine transformation."""
+        return AffineTransform(
+            self.scale, 0.0, 0.0, self.scale, self.xoffset * self.scale, self.yoffset * self.scale
+        )
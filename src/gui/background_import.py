@@ -0,0 +1,99 @@
+"""Import of drawing that runs in worker thread, so the GUI is not blocked."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import threading
+import tkinter
+from collections.abc import Callable
+from typing import Optional
+
+from drawing import Drawing
+from geometry.bounds import Bounds
+from importers.drawing_loader import DrawingLoader
+from importers.import_progress import ImportCancelledError, ImportProgress
+
+
+class BackgroundImport:
+    """Import of drawing that runs in worker thread, so the GUI is not blocked.
+
+    The drawing is imported and its bounds and indexes are computed in
+    worker thread, world coordinates of entities are not changed. The Tk loop
+    polls the progress queue by after() and calls callbacks.
+    """
+
+    # interval between two polls of progress queue (in milliseconds)
+    POLL_INTERVAL = 50
+
+    def __init__(
+        self,
+        root: tkinter.Tk,
+        loader: DrawingLoader,
+        filename: str,
+        on_progress: Callable[[int, int], None],
+        on_finish: Callable[[Optional[Drawing], Optional[Bounds], Optional[Exception]], None],
+    ) -> None:
+        """Initialize the import, callbacks are called in GUI thread."""
+        self.root = root
+        self.loader = loader
+        self.filename = filename
+        self.on_progress = on_progress
+        # called with imported drawing and its bounds, or with the error that stopped
+        # the import (ImportCancelledError when the import was cancelled)
+        self.on_finish = on_finish
+        self.progress = ImportProgress()
+        self.thread = threading.Thread(target=self.run, daemon=True)
+
+    def start(self) -> None:
+        """Start the worker thread and polling of its progress."""
+        self.thread.start()
+        self.root.after(BackgroundImport.POLL_INTERVAL, self.poll)
+
+    def cancel(self) -> None:
+        """Request the cancellation of import, the worker thread stops as soon as possible."""
+        self.progress.cancel()
+
+    def run(self) -> None:
+        """Import the drawing and prepare it for displaying, this method runs in worker thread."""
+        try:
+            drawing = self.loader.load(self.filename, self.progress)
+            bounds = None
+            if drawing is not None:
+                self.progress.check()
+                # bounds are needed to fit the view, so they are computed just once
+                bounds = drawing.get_bounds()
+                self.progress.check()
+                # redraw and snapping need the indexes, so it's better to build them here
+                drawing.build_indexes()
+            self.progress.finish((drawing, bounds))
+        except ImportCancelledError:
+            self.progress.finish_cancelled()
+        except Exception as e:
+            self.progress.fail(e)
+
+    def poll(self) -> None:
+        """Process all messages from worker thread, this method runs in GUI thread."""
+        for message in self.progress.messages():
+            kind = message[0]
+            if kind == ImportProgress.PROGRESS:
+                self.on_progress(message[1], message[2])
+            elif kind == ImportProgress.FINISHED:
+                drawing, bounds = message[1]
+                self.on_finish(drawing, bounds, None)
+                return
+            elif kind == ImportProgress.CANCELLED:
+                self.on_finish(None, None, ImportCancelledError())
+                return
+            elif kind == ImportProgress.FAILED:
+                self.on_finish(None, None, message[1])
+                return
+        self.root.after(BackgroundImport.POLL_INTERVAL, self.poll)
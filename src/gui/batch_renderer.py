@@ -0,0 +1,122 @@
+"""Creation of canvas items for many entities by few calls of Tcl interpreter."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from typing import Any, Optional
+
+from entities.entity import Entity
+
+
+class BatchRenderer:
+    """Creation of canvas items for many entities by few calls of Tcl interpreter.
+
+    Each create_* call of tkinter canvas converts its options and goes through
+    the interpreter separately. The batch renderer collects items of many
+    entities and passes them as one Tcl list to a procedure that creates all
+    of them, so the overhead is paid once per chunk and not once per entity.
+    """
+
+    # number of items created by one call of Tcl interpreter
+    CHUNK_SIZE = 10000
+
+    # Tcl procedure that creates canvas items, the list contains type, coordinates and options
+    PROCEDURE = "chainring_create_items"
+    SCRIPT = """
+proc chainring_create_items {canvas items} {
+    set ids {}
+    foreach {type coords options} $items {
+        lappend ids [$canvas create $type {*}$coords {*}$options]
+    }
+    return $ids
+}
+"""
+
+    def __init__(self, canvas) -> None:
+        """Initialize the renderer for given canvas, the Tcl procedure is defined when needed."""
+        self.canvas = canvas
+        # entities waiting for creation of their items
+        self.entities: list[Entity] = []
+        # flat list with type, coordinates, and options of each item
+        self.items: list[Any] = []
+        # IDs of items created by previous chunks
+        self.ids: list[int] = []
+        # options shared by consecutive items (class constants) are converted just once
+        self.last_options: Optional[dict[str, Any]] = None
+        self.last_tags: Optional[tuple[str, ...]] = None
+        self.last_tcl_options: tuple[Any, ...] = ()
+
+    def __len__(self) -> int:
+        """Return number of items added since the last flush, including already created chunks."""
+        return len(self.ids) + len(self.entities)
+
+    @staticmethod
+    def tcl_options(options: dict[str, Any]) -> tuple[Any, ...]:
+        """Convert options of canvas item into flat tuple of Tcl options."""
+        result: list[Any] = []
+        for key, value in options.items():
+            result.append("-" + key)
+            result.append(value)
+        return tuple(result)
+
+    def add(
+        self,
+        entity: Entity,
+        xoffset: float,
+        yoffset: float,
+        scale: float,
+        tags: Optional[tuple[str, ...]] = None,
+    ) -> bool:
+        """Add the entity into batch, check if it can be drawn as one canvas item.
+
+        Tags replace tags from options of the item, when they are provided.
+        """
+        item = entity.canvas_item(xoffset, yoffset, scale)
+        if item is None:
+            return False
+        item_type, coords, options = item
+        if options is not self.last_options or tags != self.last_tags:
+            self.last_options = options
+            self.last_tags = tags
+            if tags is not None:
+                options = {**options, "tags": tags}
+            self.last_tcl_options = BatchRenderer.tcl_options(options)
+        self.entities.append(entity)
+        self.items.extend((item_type, coords, self.last_tcl_options))
+        # full chunks are submitted immediately, so the batch doesn't grow with drawing size
+        if len(self.entities) >= BatchRenderer.CHUNK_SIZE:
+            self.submit()
+        return True
+
+    def submit(self) -> None:
+        """Create items of all waiting entities by one call of Tcl interpreter."""
+        if not self.entities:
+            return
+        tk = self.canvas.tk
+        if not tk.call("info", "commands", BatchRenderer.PROCEDURE):
+            tk.eval(BatchRenderer.SCRIPT)
+        result = tk.call(BatchRenderer.PROCEDURE, str(self.canvas), tuple(self.items))
+        ids = [int(item_id) for item_id in tk.splitlist(result)]
+        for entity, item_id in zip(self.entities, ids):
+            entity._id = item_id
+        self.ids.extend(ids)
+        self.entities = []
+        self.items = []
+
+    def flush(self) -> list[int]:
+        """Create all items in batch, return their IDs in order of added entities."""
+        self.submit()
+        ids = self.ids
+        self.ids = []
+        self.last_options = None
+        self.last_tags = None
+        return ids
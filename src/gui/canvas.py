@@ -20,6 +20,7 @@ class Canvas(tkinter.Canvas):
 
     GRID_SIZE = 50
     CROSS_SIZE = 5
+    SNAP_MARKER_SIZE = 4
 
     def __init__(self, parent, width, height, main_window):
         """Initialize canvas."""
@@ -32,6 +33,11 @@ class Canvas(tkinter.Canvas):
         self.height = height
         self.main_window = main_window
         self.selected_room_item = None
+        # marker of snap point, it is moved instead of being created on each mouse move
+        self.snap_marker = None
+        # polygons for selecting room are recreated on each redraw, so the click is bound
+        # to their tag just once
+        self.tag_bind("room_select", "<ButtonPress-1>", self.on_polygon_for_room_click)
 
     def draw_empty_drawing_message(self):
         """Display message when no drawing is opened."""
@@ -54,10 +60,6 @@ class Canvas(tkinter.Canvas):
         else:
             self.hide_grid()
 
-    def draw_scale_line(self):
-        """Draw invisible scale line onto canvas."""
-        self.create_line(0, 0, self.width, 0, tags="scale", fill="white", width=0)
-
     def draw_boundary(self):
         """Draw drawing boundary onto canvas."""
         self.create_line(
@@ -110,16 +112,19 @@ class Canvas(tkinter.Canvas):
         else:
             self.hide_boundary()
 
-    def draw_entities(self, entities, xoffset, yoffset, scale):
-        """Draw all common entities onto canvas."""
-        for entity in entities:
-            entity.draw(self, xoffset, yoffset, scale)
-
-    def draw_rooms(self, rooms, xoffset, yoffset, scale):
-        """Draw all rooms onto canvas."""
+    def draw_rooms(self, rooms, view):
+        """Draw all rooms onto canvas, room polygons are transformed by view."""
         for room in rooms:
             # print(room["room_id"])
-            room["canvas_id"] = self.draw_room(room)
+            room["canvas_id"] = self.draw_room(room, view)
+
+    def move_rooms(self, rooms, view):
+        """Move room polygons into new view, their canvas items are kept."""
+        for room in rooms:
+            if room["canvas_id"] is not None and Canvas.proper_polygon_for_room(room):
+                self.coords(room["canvas_id"], view.apply_polygon(room["polygon"]))
+            else:
+                room["canvas_id"] = self.draw_room(room, view)
 
     def draw_new_room_temporary_line(self, x1, y1, x2, y2):
         """Draw temporary line for room that is being drawn."""
@@ -134,6 +139,22 @@ class Canvas(tkinter.Canvas):
             x, y - Canvas.CROSS_SIZE, x, y + Canvas.CROSS_SIZE, fill="red", tags="cross"
         )
 
+    def draw_snap_marker(self, x, y):
+        """Show marker of the point that the cursor snaps to."""
+        size = Canvas.SNAP_MARKER_SIZE
+        coords = (x - size, y - size, x + size, y + size)
+        # the marker might be deleted together with all other items on canvas
+        if self.snap_marker is not None and self.type(self.snap_marker):
+            self.coords(self.snap_marker, *coords)
+        else:
+            self.snap_marker = self.create_rectangle(*coords, outline="green", width=2)
+
+    def hide_snap_marker(self):
+        """Hide marker of the snap point."""
+        if self.snap_marker is not None:
+            self.delete(self.snap_marker)
+            self.snap_marker = None
+
     def delete_entities_with_tag(self, tag):
         """Delete all entities having given tag."""
         items = self.find_withtag(tag)
@@ -149,21 +170,27 @@ class Canvas(tkinter.Canvas):
         """Delete object specified by its ID."""
         self.delete(object_id)
 
+    def delete_objects_with_ids(self, object_ids):
+        """Delete all objects specified by their IDs by one call."""
+        if object_ids:
+            self.delete(*object_ids)
+
     @staticmethod
     def proper_polygon_for_room(room):
         """Check if room has polygon assigned."""
         return "polygon" in room and len(room["polygon"]) > 0
 
-    def draw_room(self, room):
-        """Draw room polygon onto canvas."""
+    def draw_room(self, room, view):
+        """Draw room polygon onto canvas, the polygon is stored in world coordinates."""
         if Canvas.proper_polygon_for_room(room):
             new_object = self.create_polygon(
-                room["polygon"],
+                view.apply_polygon(room["polygon"]),
                 width=2,
                 fill="",
                 activefill="#ffff80",
                 outline="magenta",
                 stipple="gray50",
+                tags="room",
             )
             self.tag_bind(
                 new_object,
@@ -174,6 +201,12 @@ class Canvas(tkinter.Canvas):
         else:
             return None
 
+    def raise_rooms(self):
+        """Raise room polygons and the room being drawn above entities of drawing."""
+        self.tag_raise("room")
+        self.tag_raise("new_room_temporary")
+        self.tag_raise("cross")
+
     def draw_new_room(self, room):
         """Draw new room into canvas."""
         print(room)
@@ -184,6 +217,7 @@ class Canvas(tkinter.Canvas):
             activefill="#ffff80",
             outline="magenta",
             stipple="gray50",
+            tags="room",
         )
         self.tag_bind(
             new_object,
@@ -196,9 +230,11 @@ class Canvas(tkinter.Canvas):
         """Handle event: click on room."""
         self.main_window.on_room_click_canvas(canvas_object_id)
 
-    def on_polygon_for_room_click(self, canvas_object_id):
+    def on_polygon_for_room_click(self, event=None):
         """Handle event: click on polygon that belongs to room."""
-        self.main_window.on_polygon_for_room_click_canvas(canvas_object_id)
+        items = self.find_withtag("current")
+        if items:
+            self.main_window.on_polygon_for_room_click_canvas(items[0])
 
     def highlight_room(self, room):
         """Highlight the given room and remove highlight for previously selected one."""
@@ -0,0 +1,322 @@
+"""Renderer that creates canvas items just for entities in the visible part of canvas."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from collections.abc import Iterator
+from typing import Optional
+
+from drawing import Drawing
+from entities.entity import Entity
+from entities.insert import Insert
+from entities.line import Line
+from entities.polyline import Polyline
+from entities.text import Text
+from geometry.bounds import Bounds
+from geometry.view_transform import ViewTransform
+from gui.batch_renderer import BatchRenderer
+from gui.level_of_detail import LevelOfDetail
+
+
+class CullingRenderer:
+    """Renderer that creates canvas items just for entities in the visible part of canvas.
+
+    Entities are queried from the spatial index of drawing by the visible world
+    rectangle enlarged by margin. Items of entities that leave the rectangle are
+    deleted, line items are recycled for lines that enter it, so the number of
+    items depends on the screen content and not on the drawing size. Entities
+    that are too small in the view are simplified by the level of detail policy.
+    """
+
+    # margin added to each side of the visible rectangle, relative to its size
+    MARGIN = 0.25
+
+    # number of entities drawn by one step of progressive redraw
+    STEP_SIZE = 500
+
+    def __init__(self, canvas) -> None:
+        """Initialize the renderer for given canvas."""
+        self.canvas = canvas
+        # new items are created by few calls of Tcl interpreter
+        self.batch = BatchRenderer(canvas)
+        # canvas items of drawn entities, indexed by entity positions in drawing
+        self.items: dict[int, list[int]] = {}
+        # items of drawn lines, these can be recycled for other lines
+        self.line_items: dict[int, int] = {}
+        # number of entities that share the same item (merged lines)
+        self.shared: dict[int, int] = {}
+        # world rectangle with all drawn entities
+        self.rectangle: Optional[Bounds] = None
+        # level of detail for current view
+        self.level_of_detail: Optional[LevelOfDetail] = None
+        # view of drawn items, they are transformed when the view is changed
+        self.view: Optional[ViewTransform] = None
+        # canvas tags of layers, layer names can't be used as tags directly
+        self.layer_tags: dict[Optional[str], str] = {}
+        # entities from hidden layers are not drawn
+        self.hidden_layers: set[Optional[str]] = set()
+
+    def clear(self) -> None:
+        """Forget all drawn items, it needs to be called when canvas is cleared."""
+        self.items.clear()
+        self.line_items.clear()
+        self.shared.clear()
+        self.rectangle = None
+        self.level_of_detail = None
+        self.view = None
+
+    def __len__(self) -> int:
+        """Return number of drawn entities."""
+        return len(self.items) + len(self.line_items)
+
+    def visible_rectangle(self, view: ViewTransform, margin: float = 0.0) -> Bounds:
+        """Return world rectangle displayed in canvas window, enlarged by relative margin."""
+        canvas = self.canvas
+        width = max(canvas.winfo_width(), canvas.width)
+        height = max(canvas.winfo_height(), canvas.height)
+        xmin, ymin = view.inverse(canvas.canvasx(0), canvas.canvasy(0))
+        xmax, ymax = view.inverse(canvas.canvasx(width), canvas.canvasy(height))
+        dx = (xmax - xmin) * margin
+        dy = (ymax - ymin) * margin
+        return Bounds(xmin - dx, ymin - dy, xmax + dx, ymax + dy)
+
+    def layer_tag(self, layer: Optional[str]) -> str:
+        """Return canvas tag of layer, new layers are registered."""
+        tag = self.layer_tags.get(layer)
+        if tag is None:
+            tag = f"layer{len(self.layer_tags)}"
+            self.layer_tags[layer] = tag
+        return tag
+
+    def tags(self, entity: Entity) -> tuple[str, str]:
+        """Return canvas tags of items that represent the entity."""
+        return "drawing", self.layer_tag(entity.layer)
+
+    def set_layer_visible(self, layer: Optional[str], visible: bool) -> None:
+        """Show or hide items of layer by one call, entities of hidden layers are not drawn.
+
+        Entities that were skipped while the layer was hidden are drawn by the next render.
+        """
+        if visible:
+            self.hidden_layers.discard(layer)
+            # entities of the layer are missing in the drawn rectangle
+            self.rectangle = None
+        else:
+            self.hidden_layers.add(layer)
+        self.canvas.itemconfigure(self.layer_tag(layer), state="normal" if visible else "hidden")
+
+    def draw_entity(self, entity: Entity, view: ViewTransform, index: dict) -> list[int]:
+        """Draw one entity onto canvas, return IDs of all created items."""
+        if isinstance(entity, Insert):
+            items = []
+            for block_entity in entity.expand():
+                if block_entity.layer not in self.hidden_layers:
+                    items.extend(self.draw_entity(block_entity, view, index))
+            return items
+        entity.draw(self.canvas, view.xoffset, view.yoffset, view.scale)
+        if entity._id is None:
+            return []
+        self.canvas.addtag_withtag(self.layer_tag(entity.layer), entity._id)
+        index[entity._id] = entity
+        return [entity._id]
+
+    @staticmethod
+    def priority(entity: Entity) -> int:
+        """Return drawing priority of entity, walls are drawn first and texts last."""
+        if isinstance(entity, (Line, Polyline)):
+            return 0
+        if isinstance(entity, Text):
+            return 2
+        return 1
+
+    def move_items(self, view: ViewTransform) -> None:
+        """Transform existing items from the previous view into the new one by two calls."""
+        old = self.view
+        if old is None or old.scale == 0.0:
+            return
+        # canvas coordinates are linear in world coordinates, so the transformation is exact
+        factor = view.scale / old.scale
+        dx = (view.xoffset - old.xoffset) * view.scale
+        dy = (view.yoffset - old.yoffset) * view.scale
+        if factor != 1.0:
+            self.canvas.scale("drawing", 0, 0, factor, factor)
+        if dx != 0.0 or dy != 0.0:
+            self.canvas.move("drawing", dx, dy)
+
+    def render_steps(
+        self, drawing: Drawing, view: ViewTransform, view_changed: bool = True
+    ) -> Iterator[None]:
+        """Draw entities in the visible rectangle step by step, other items are recycled.
+
+        The generator yields after each chunk of entities, so the redraw can be
+        split into time slices. Entities are drawn in order of their priority.
+        When the view has been changed, coordinates of all items are not valid, so
+        all items are recycled and the level of detail is decided again. Otherwise
+        (after scroll) nothing is drawn until the window leaves the margin.
+        """
+        if not view_changed and self.covers(view):
+            return
+        rectangle = self.visible_rectangle(view, CullingRenderer.MARGIN)
+        # the rectangle is covered when all steps are done, cancelled redraw covers nothing
+        self.rectangle = None
+        keys = drawing.spatial_index.in_rectangle(rectangle)
+        visible = set(keys)
+        index = drawing.entity_index
+        if view_changed or self.level_of_detail is None:
+            self.level_of_detail = LevelOfDetail(view)
+
+        entities = drawing.entities
+        # line items that can be moved to other lines of the same layer
+        pools: dict[Optional[str], list[int]] = {}
+        deleted = []
+        for key in list(self.line_items):
+            if view_changed or key not in visible:
+                item = self.line_items.pop(key)
+                index.pop(item, None)
+                pools.setdefault(entities[key].layer, []).append(item)
+        for key in list(self.items):
+            if view_changed or key not in visible:
+                for item in self.items.pop(key):
+                    if self.release_item(item):
+                        index.pop(item, None)
+                        deleted.append(item)
+        if deleted:
+            self.canvas.delete(*deleted)
+        if view_changed:
+            # recycled lines stay on the right place until they are moved to other lines
+            self.move_items(view)
+            self.view = ViewTransform(view.xoffset, view.yoffset, view.scale)
+
+        ordered = sorted(
+            (
+                (key, entities[key])
+                for key in keys
+                if key not in self.line_items and key not in self.items
+            ),
+            key=lambda pair: CullingRenderer.priority(pair[1]),
+        )
+        try:
+            step = CullingRenderer.STEP_SIZE
+            for start in range(0, len(ordered), step):
+                self.draw_step(ordered[start : start + step], view, pools, index)
+                yield
+            self.rectangle = rectangle
+        finally:
+            # items that have not been recycled are deleted by one call
+            unused = [item for pool in pools.values() for item in pool]
+            if unused:
+                self.canvas.delete(*unused)
+
+    def draw_step(
+        self,
+        ordered: list[tuple[int, Entity]],
+        view: ViewTransform,
+        pools: dict[Optional[str], list[int]],
+        index: dict,
+    ) -> None:
+        """Draw one chunk of entities, recycled line items are taken from pools of layers."""
+        canvas = self.canvas
+        batch = self.batch
+        # keys of batched entities, entities to be indexed, and flags for line items
+        batched: list[tuple[int, Entity, bool]] = []
+        # short lines that are merged into one polyline
+        chain_keys: list[int] = []
+        chain: list[float] = []
+        chain_entity: Optional[Entity] = None
+        hidden_layers = self.hidden_layers
+        for key, entity in ordered:
+            layer = entity.layer
+            # the layer can be hidden while the progressive redraw runs
+            if layer in hidden_layers:
+                continue
+            pool = pools.get(layer)
+            detail = self.level_of_detail.detail(entity)
+            if detail == LevelOfDetail.MERGED:
+                x1, y1 = view.apply(entity.x1, entity.y1)
+                x2, y2 = view.apply(entity.x2, entity.y2)
+                # just lines of the same layer are merged, so their layer can be hidden
+                if chain and chain_entity.layer != layer:
+                    self.draw_chain(chain_keys, chain, chain_entity, index)
+                    chain_keys, chain, chain_entity = [], [x1, y1, x2, y2], entity
+                elif chain and LevelOfDetail.connected(chain, x1, y1):
+                    chain.extend((x2, y2))
+                elif chain and LevelOfDetail.connected(chain, x2, y2):
+                    chain.extend((x1, y1))
+                else:
+                    self.draw_chain(chain_keys, chain, chain_entity, index)
+                    chain_keys, chain, chain_entity = [], [x1, y1, x2, y2], entity
+                chain_keys.append(key)
+            elif detail == LevelOfDetail.HIDDEN:
+                self.items[key] = []
+            elif detail == LevelOfDetail.CHORD:
+                (x1, y1), (x2, y2) = entity.endpoints()
+                chord = Line(x1, y1, x2, y2, entity.color, entity.layer)
+                if pool:
+                    chord.draw(canvas, view.xoffset, view.yoffset, view.scale, pool.pop())
+                    self.line_items[key] = chord._id
+                    index[chord._id] = entity
+                else:
+                    batch.add(chord, view.xoffset, view.yoffset, view.scale, self.tags(entity))
+                    batched.append((key, entity, True))
+            elif detail == LevelOfDetail.DOT:
+                x, y = view.apply(entity.x, entity.y)
+                item = canvas.create_oval(
+                    x - 1, y - 1, x + 1, y + 1, fill="blue", outline="", tags=self.tags(entity)
+                )
+                self.items[key] = [item]
+                index[item] = entity
+            elif isinstance(entity, Line) and pool:
+                entity.draw(canvas, view.xoffset, view.yoffset, view.scale, pool.pop())
+                self.line_items[key] = entity._id
+                index[entity._id] = entity
+            elif batch.add(entity, view.xoffset, view.yoffset, view.scale, self.tags(entity)):
+                batched.append((key, entity, isinstance(entity, Line)))
+            else:
+                self.items[key] = self.draw_entity(entity, view, index)
+        self.draw_chain(chain_keys, chain, chain_entity, index)
+
+        # IDs of batched items are returned in the same order as entities were added
+        for (key, entity, line), item in zip(batched, batch.flush()):
+            if line:
+                self.line_items[key] = item
+            else:
+                self.items[key] = [item]
+            index[item] = entity
+
+    def draw_chain(
+        self, keys: list[int], points: list[float], entity: Optional[Entity], index: dict
+    ) -> None:
+        """Draw short lines with given keys merged into one polyline, entity is the first line."""
+        if not keys:
+            return
+        item = self.canvas.create_line(*points, fill="black", tags=self.tags(entity))
+        index[item] = entity
+        for key in keys:
+            self.items[key] = [item]
+        # the item is deleted when all merged lines leave the visible rectangle
+        if len(keys) > 1:
+            self.shared[item] = len(keys)
+
+    def release_item(self, item: int) -> bool:
+        """Release the item of entity that is not drawn anymore, check if it can be deleted."""
+        count = self.shared.get(item)
+        if count is None:
+            return True
+        if count > 1:
+            self.shared[item] = count - 1
+            return False
+        del self.shared[item]
+        return True
+
+    def covers(self, view: ViewTransform) -> bool:
+        """Check if drawn entities cover the canvas window, including scrolled one."""
+        return self.rectangle is not None and self.rectangle.contains(self.visible_rectangle(view))
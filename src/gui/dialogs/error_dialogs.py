@@ -13,13 +13,15 @@
 #
 
 from tkinter import messagebox
+from typing import Optional
 
 
-def error_dialog_drawing_load() -> None:
-    """Show dialog when drawing import was not successful."""
-    messagebox.showerror(
-        "Chyba při načítání výkresu", "Při načítání výkresu došlo k neočekávané chybě"
-    )
+def error_dialog_drawing_load(error: Optional[Exception] = None) -> None:
+    """Show dialog when drawing import was not successful, the error is displayed if known."""
+    message = "Při načítání výkresu došlo k neočekávané chybě"
+    if error is not None:
+        message += f":\n\n{error}"
+    messagebox.showerror("Chyba při načítání výkresu", message)
 
 
 def error_dialog_wrong_configuration(message):
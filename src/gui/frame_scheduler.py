@@ -0,0 +1,64 @@
+"""Coalescing of frequent GUI events into at most one update per frame."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import tkinter
+from collections.abc import Callable
+from typing import Optional
+
+
+class FrameScheduler:
+    """Coalescing of frequent GUI events into at most one update per frame.
+
+    Event handlers just record the new state and request the update. The
+    first request in a frame schedules the callback by after(), next requests
+    are ignored until the callback runs, so mouse motion and wheel events that
+    come faster than frames are displayed cause just one update.
+    """
+
+    # interval between two updates (in milliseconds), approximately one frame at 60 FPS
+    FRAME_INTERVAL = 16
+
+    def __init__(self, root: tkinter.Misc, callback: Callable[[], None]) -> None:
+        """Initialize the scheduler for given update callback."""
+        self.root = root
+        self.callback = callback
+        # ID of the scheduled update
+        self.job: Optional[str] = None
+
+    @property
+    def pending(self) -> bool:
+        """Check if the update has been requested and it has not run yet."""
+        return self.job is not None
+
+    def request(self) -> None:
+        """Request the update, it is scheduled just once per frame."""
+        if self.job is None:
+            self.job = self.root.after(FrameScheduler.FRAME_INTERVAL, self.run)
+
+    def cancel(self) -> None:
+        """Cancel the requested update."""
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+
+    def flush(self) -> None:
+        """Run the requested update immediately, it is needed before state of other kind changes."""
+        if self.job is not None:
+            self.cancel()
+            self.callback()
+
+    def run(self) -> None:
+        """Run the update callback, this method is called from Tk loop."""
+        self.job = None
+        self.callback()
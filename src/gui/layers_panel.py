@@ -0,0 +1,53 @@
+"""Panel with layers of drawing, layers can be shown or hidden."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import tkinter
+
+
+class LayersPanel(tkinter.LabelFrame):
+    """Panel with layers of drawing, selected layers are visible."""
+
+    def __init__(self, parent, main_window):
+        """Initialize the panel."""
+        super().__init__(parent, text="Hladiny", padx=5, pady=5)
+        self.main_window = main_window
+        # names of layers displayed in the listbox
+        self.layers = []
+        self.visible = set()
+
+        self.listbox = tkinter.Listbox(
+            self, selectmode=tkinter.MULTIPLE, exportselection=False, width=24
+        )
+        self.scrollbar = tkinter.Scrollbar(self, command=self.listbox.yview)
+        self.listbox.configure(yscrollcommand=self.scrollbar.set)
+        self.scrollbar.pack(side=tkinter.RIGHT, fill=tkinter.Y)
+        self.listbox.pack(fill=tkinter.BOTH, expand=True)
+        self.listbox.bind("<<ListboxSelect>>", self.on_layer_click)
+
+    def fill(self, layers):
+        """Display all layers of drawing, all of them are visible."""
+        self.layers = list(layers)
+        self.visible = set(self.layers)
+        self.listbox.delete(0, tkinter.END)
+        for layer in self.layers:
+            self.listbox.insert(tkinter.END, layer)
+        self.listbox.selection_set(0, tkinter.END)
+
+    def on_layer_click(self, event=None):
+        """Show or hide layers whose selection has been changed."""
+        visible = {self.layers[index] for index in self.listbox.curselection()}
+        for layer in self.layers:
+            if (layer in visible) != (layer in self.visible):
+                self.main_window.set_layer_visible(layer, layer in visible)
+        self.visible = visible
@@ -0,0 +1,113 @@
+"""Level of detail of entities drawn onto canvas."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import math
+
+from entities.arc import Arc
+from entities.circle import Circle
+from entities.entity import Entity
+from entities.line import Line
+from entities.text import Text
+from geometry.view_transform import ViewTransform
+
+
+class LevelOfDetail:
+    """Level of detail of entities drawn onto canvas.
+
+    Entities whose projected size is below pixel thresholds are simplified or
+    skipped. Texts don't have size, so just one text is displayed in a cell of
+    the canvas, other texts in the same cell collapse into dots or nothing. The
+    policy is valid for one view, the full detail returns when the view is zoomed in.
+    """
+
+    # the entity is drawn without changes
+    FULL = 0
+    # the entity is not drawn at all
+    HIDDEN = 1
+    # the arc is drawn as a chord between its endpoints
+    CHORD = 2
+    # the short line is merged with neighbouring short lines into one polyline
+    MERGED = 3
+    # the text is drawn as a dot
+    DOT = 4
+
+    # entities smaller than this size (in pixels) are not drawn
+    HIDDEN_SIZE = 0.5
+
+    # lines shorter than this length (in pixels) are merged
+    MERGE_LENGTH = 3.0
+
+    # maximal gap (in pixels) between merged lines
+    MERGE_GAP = 1.0
+
+    # arcs with smaller radius (in pixels) are drawn as chords
+    CHORD_RADIUS = 3.0
+
+    # size of canvas cell (in pixels) with just one text
+    TEXT_CELL = 16
+
+    # size of canvas cell (in pixels) with just one dot representing text
+    DOT_CELL = 4
+
+    def __init__(self, view: ViewTransform) -> None:
+        """Initialize the policy for given view."""
+        self.view = view
+        # canvas cells that already contain text or dot
+        self.text_cells: set[tuple[int, int]] = set()
+        self.dot_cells: set[tuple[int, int]] = set()
+
+    def detail(self, entity: Entity) -> int:
+        """Decide how the entity is drawn in the view."""
+        scale = self.view.scale
+        if isinstance(entity, Line):
+            length = math.hypot(entity.x2 - entity.x1, entity.y2 - entity.y1) * scale
+            if length < LevelOfDetail.MERGE_LENGTH:
+                return LevelOfDetail.MERGED
+            return LevelOfDetail.FULL
+        if isinstance(entity, Text):
+            return self.text_detail(*self.view.apply(entity.x, entity.y))
+        if isinstance(entity, Arc):
+            radius = entity.radius * scale
+            if radius < LevelOfDetail.HIDDEN_SIZE:
+                return LevelOfDetail.HIDDEN
+            if radius < LevelOfDetail.CHORD_RADIUS:
+                return LevelOfDetail.CHORD
+            return LevelOfDetail.FULL
+        if isinstance(entity, Circle):
+            if entity.radius * scale < LevelOfDetail.HIDDEN_SIZE:
+                return LevelOfDetail.HIDDEN
+            return LevelOfDetail.FULL
+        bounds = entity.get_bounds()
+        size = max(bounds.xmax - bounds.xmin, bounds.ymax - bounds.ymin) * scale
+        return LevelOfDetail.HIDDEN if size < LevelOfDetail.HIDDEN_SIZE else LevelOfDetail.FULL
+
+    def text_detail(self, x: float, y: float) -> int:
+        """Decide how the text displayed at canvas coordinates [x, y] is drawn."""
+        cell = (math.floor(x / LevelOfDetail.TEXT_CELL), math.floor(y / LevelOfDetail.TEXT_CELL))
+        if cell not in self.text_cells:
+            self.text_cells.add(cell)
+            return LevelOfDetail.FULL
+        cell = (math.floor(x / LevelOfDetail.DOT_CELL), math.floor(y / LevelOfDetail.DOT_CELL))
+        if cell not in self.dot_cells:
+            self.dot_cells.add(cell)
+            return LevelOfDetail.DOT
+        return LevelOfDetail.HIDDEN
+
+    @staticmethod
+    def connected(points: list[float], x: float, y: float) -> bool:
+        """Check if the point [x, y] continues the polyline given by flat list of points."""
+        return (
+            abs(points[-2] - x) <= LevelOfDetail.MERGE_GAP
+            and abs(points[-1] - y) <= LevelOfDetail.MERGE_GAP
+        )
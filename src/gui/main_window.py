@@ -18,25 +18,29 @@ from tkinter import messagebox
 from draw_service import DrawServiceInterface
 from exporters.drawing_exporter import DrawingExporter
 from exporters.room_exporter import RoomExporter
-from geometry.bounds import Bounds
-from geometry.rescaler import Rescaler
-from geometry.utils import GeometryUtils
+from geometry.view_transform import ViewTransform
+from gui.background_import import BackgroundImport
 from gui.canvas import Canvas
 from gui.canvas_mode import CanvasMode
+from gui.culling_renderer import CullingRenderer
 from gui.dialogs.error_dialogs import *
 from gui.dialogs.load_dialogs import LoadDialogs
 from gui.dialogs.room_error_dialog import *
 from gui.dialogs.save_dialogs import SaveDialogs
 from gui.dialogs.yes_no_dialogs import *
+from gui.frame_scheduler import FrameScheduler
 from gui.icons import *
+from gui.layers_panel import LayersPanel
 from gui.menubar import *
 from gui.palette import *
+from gui.progressive_redraw import ProgressiveRedraw
 from gui.room import Room
 from gui.status_bar import *
 from gui.toolbar import *
-from importers.drawing_importer import DrawingImporter
-from importers.dxf_importer import DxfImporter
+from importers.drawing_loader import DrawingLoader
+from importers.import_progress import ImportCancelledError
 from importers.room_importer import RoomImporter
+from room_diff import RoomDiff
 
 
 class MainWindow:
@@ -44,10 +48,16 @@ class MainWindow:
 
     SCALE_UP_FACTOR = 1.1
     SCALE_DOWN_FACTOR = 0.9
+    WHEEL_DELTA = 120
+
+    # maximal distance (in pixels) of snap point from mouse cursor
+    SNAP_TOLERANCE = 20
 
     def __init__(self, configuration):
         """Initialize main window."""
         self._drawing = None
+        # transformation of world coordinates of drawing into canvas coordinates
+        self.view = ViewTransform()
         self.root = tkinter.Tk()
         self.root.title("Integrace CAD výkresů do SAP, (c) eLevel system")
 
@@ -61,7 +71,10 @@ class MainWindow:
         window_height = configuration.window_height
 
         self.canvas = Canvas(self.root, window_width, window_height, self)
+        # entities are drawn just in the visible part of canvas
+        self.renderer = CullingRenderer(self.canvas)
         self.palette = Palette(self.root, self)
+        self.layers_panel = LayersPanel(self.root, self)
         self.toolbar = Toolbar(self.root, self, self.canvas)
         self.statusbar = StatusBar(self.root)
 
@@ -71,13 +84,15 @@ class MainWindow:
 
         self.configure_grid()
 
-        self.toolbar.grid(column=1, row=1, columnspan=2, sticky="WE")
+        self.toolbar.grid(column=1, row=1, columnspan=3, sticky="WE")
         self.palette.grid(column=1, row=2, sticky="NWSE")
         self.canvas.grid(column=2, row=2, sticky="NWSE")
-        self.statusbar.grid(column=1, row=3, columnspan=2, sticky="WE")
+        self.layers_panel.grid(column=3, row=2, sticky="NWSE")
+        self.statusbar.grid(column=1, row=3, columnspan=3, sticky="WE")
 
         self.canvas.bind("<ButtonPress-1>", self.on_left_button_pressed)
         self.canvas.bind("<B1-Motion>", self.on_left_button_drag)
+        self.canvas.bind("<Motion>", self.on_mouse_move)
         self.canvas.bind("<ButtonPress-3>", self.on_right_button_pressed)
 
         # scroll on Linux
@@ -89,6 +104,15 @@ class MainWindow:
 
         self.room = Room()
         self.edited_room_id = None
+        # drawing import running in background
+        self.background_import = None
+        self.progressive_redraw = None
+        # pan and zoom events are coalesced into one update per frame
+        self.scroll_position = None
+        self.scroll_update = FrameScheduler(self.root, self.update_scroll)
+        self.view_update = FrameScheduler(self.root, self.update_view)
+        # bounds of drawing are cached for fitting the view and for the scroll region
+        self.drawing_bounds = None
 
     def send_drawing_to_server(self):
         """Send the drawing to server."""
@@ -199,8 +223,6 @@ class MainWindow:
                 self.root, self.configuration
             )
             if rooms_from_sap is not None:
-                deleted = 0
-                inserted = 0
                 # process drawing_id
                 if drawing_id is not None:
                     self.drawing.drawing_id = drawing_id
@@ -209,43 +231,20 @@ class MainWindow:
                         "Nastala chyba",
                         "Nelze zjistit jednoznačný identifikátor výkresu",
                     )
-                if self.drawing.rooms is not None:
-                    # if some room is missing in SAP, remove it from drawing as well
-                    for room in list(self.drawing.rooms):
-                        room_id = room["room_id"]
-                        found = False
-                        for q in rooms_from_sap:
-                            if q["AOID"] == room_id:
-                                found = True
-                                break
-                        if not found:
-                            print("Deleting " + room_id)
-                            deleted += 1
-                            if "canvas_id" in room:
-                                self.canvas.delete_object_with_id(room["canvas_id"])
-                            self.drawing.rooms.remove(room)
-                    # now check for new rooms added into SAP
-                    for q in rooms_from_sap:
-                        sap_id = q["AOID"]
-                        found = False
-                        for room in list(self.drawing.rooms):
-                            if room["room_id"] == sap_id:
-                                found = True
-                                break
-                        if not found:
-                            print("Adding " + sap_id)
-                            inserted += 1
-                            self.drawing.rooms.append(
-                                {"room_id": sap_id, "polygon": []}
-                            )
+                # rooms missing in SAP are removed from drawing, new rooms are added
+                changes = RoomDiff.compute(
+                    self.drawing.rooms, RoomDiff.sap_room_ids(rooms_from_sap)
+                )
+                print(f"Synchronizing rooms with SAP: {changes}")
+                removed_canvas_ids = RoomDiff.apply(changes, self.drawing)
 
-                self.palette.remove_all_rooms()
-                self.drawing.room_counter = len(self.drawing.rooms) + 1
-                self.redraw()
-                self.add_all_rooms_from_drawing()
+                # canvas and palette are updated incrementally
+                self.canvas.delete_objects_with_ids(removed_canvas_ids)
+                self.palette.delete_rooms_from_list(changes.removed)
+                self.palette.add_new_rooms(changes.added)
                 message = (
                     "Přidaných místností: {i}\n" + "Vymazaných místností: {d}"
-                ).format(i=inserted, d=deleted)
+                ).format(i=len(changes.added), d=len(changes.removed))
                 messagebox.showinfo("Výsledek synchronizace", message)
 
     def import_drawing_command(self, filename):
@@ -339,24 +338,44 @@ class MainWindow:
             and drawing_file_name != ""
             and drawing_file_name != ()
         ):
-            if drawing_file_name.endswith(".drw"):
-                importer = DrawingImporter(drawing_file_name)
-                drawing = importer.import_drawing()
-            else:
-                importer = DxfImporter(drawing_file_name)
-                drawing = importer.import_dxf()
-            if drawing is None:
-                error_dialog_drawing_load()
-            else:
-                bounds = Bounds.compute_bounds(drawing.entities)
-                xoffset, yoffset, scale = Rescaler.compute_scale_for_canvas(
-                    bounds, self.canvas
-                )
-                drawing.rescale(xoffset, yoffset, scale)
-                self.drawing = drawing
-                self.redraw()
-                self.add_all_rooms_from_drawing()
-                self.set_ui_items_for_actual_mode()
+            self.start_background_import(drawing_file_name)
+
+    def start_background_import(self, filename):
+        """Import the drawing in worker thread, the GUI is still responsive."""
+        if self.background_import is not None:
+            return
+        self.background_import = BackgroundImport(
+            self.root,
+            DrawingLoader.from_configuration(self.configuration),
+            filename,
+            self.statusbar.set_progress,
+            self.finish_background_import,
+        )
+        self.statusbar.set("Načítání výkresu %s", filename)
+        self.statusbar.show_progress(self.cancel_background_import)
+        self.background_import.start()
+
+    def cancel_background_import(self):
+        """Handle the command to cancel drawing import."""
+        if self.background_import is not None:
+            self.background_import.cancel()
+            self.statusbar.disable_cancel()
+
+    def finish_background_import(self, drawing, bounds, error):
+        """Display the drawing imported in background or the error that stopped the import."""
+        self.background_import = None
+        self.statusbar.hide_progress()
+        if isinstance(error, ImportCancelledError):
+            self.statusbar.set("Načítání výkresu bylo přerušeno")
+        elif drawing is None:
+            self.statusbar.clear()
+            error_dialog_drawing_load(error)
+        else:
+            self.statusbar.clear()
+            self.set_drawing(drawing, bounds)
+            self.redraw()
+            self.add_all_rooms_from_drawing()
+            self.set_ui_items_for_actual_mode()
 
     def save_drawing_command(self, event=None):
         """Handle the command to save drawing."""
@@ -408,16 +427,27 @@ class MainWindow:
 
     def scroll_start(self, event):
         """Handle scrolling event (start)."""
+        # the canvas needs to be scrolled by previous drag before the new one starts
+        self.scroll_update.flush()
         self.canvas.scan_mark(event.x, event.y)
 
     def scroll_move(self, event):
-        """Handle scrolling event (finish)."""
-        self.canvas.scan_dragto(event.x, event.y, gain=1)
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        """Handle scrolling event (finish), the canvas is scrolled once per frame."""
+        self.scroll_position = (event.x, event.y)
+        self.scroll_update.request()
+
+    def update_scroll(self):
+        """Scroll the canvas to the last position of mouse, draw entities that became visible."""
+        x, y = self.scroll_position
+        self.canvas.scan_dragto(x, y, gain=1)
+        if self.drawing is not None:
+            self.start_progressive_redraw(False)
 
-    def get_nearest_entity(self, x, y):
-        """Find nearest entity to specified coordinates [x, y]."""
-        return self.canvas.find_closest(x, y)[0]
+    def find_snap_point(self, x, y):
+        """Find snap point for canvas coordinates [x, y], return canvas and world coordinates."""
+        if self.drawing is None:
+            raise Exception("self.drawing is None")
+        return self.drawing.find_snap_point(x, y, self.view, MainWindow.SNAP_TOLERANCE)
 
     def finish_new_room(self):
         """Finish drawing of new room."""
@@ -435,6 +465,7 @@ class MainWindow:
             )
         self.edited_room_id = None
         self.canvas.delete_temporary_entities()
+        self.canvas.hide_snap_marker()
 
         # update left palette
         r = {"room_id": room_id, "polygon": self.room.polygon_world}
@@ -462,33 +493,6 @@ class MainWindow:
             else:
                 self.finish_new_room()
 
-    def entity_with_endpoints(self, item):
-        """Return the drawing entity for the given canvas item."""
-        # sanity check
-        if item is None:
-            return None
-
-        # first check canvas entity type
-        entity_type = self.canvas.type(item)
-        if entity_type != "line":
-            return None
-
-        # then check the tags associated with the canvas entity
-        tags = self.canvas.gettags(item)
-        if "drawing" not in tags:
-            return None
-
-        if self.drawing is None:
-            raise Exception("self.drawing is None")
-        # third check if canvas entity relates to drawing entity
-        entity = self.drawing.find_entity_by_id(item)
-        if entity is None:
-            return None
-
-        # fourth check drawing entity type
-        # (not needed ATM)
-        return entity
-
     def on_room_click_listbox(self, room_id):
         """Handle the left mouse button press on listbox with list of rooms."""
         if self.drawing is None:
@@ -555,16 +559,6 @@ class MainWindow:
         self.room.last_x = canvas_x
         self.room.last_y = canvas_y
 
-    def nearest_endpoint(self, x, y, item, entity):
-        """Find nearest endpoint for given entity and coordinates [x,y]."""
-        x1, y1, x2, y2 = self.canvas.coords(item)
-        if GeometryUtils.square_length(x1, y1, x, y) < GeometryUtils.square_length(
-            x2, y2, x, y
-        ):
-            return x1, y1, entity.x1, entity.y1
-        else:
-            return x2, y2, entity.x2, entity.y2
-
     def add_vertex(self, canvas_x, canvas_y, world_x, world_y):
         """Add new vertex to polygon."""
         self.canvas.draw_cross(canvas_x, canvas_y)
@@ -578,30 +572,15 @@ class MainWindow:
         # get the coordinates before canvas scroll
         x = self.canvas.canvasx(event.x)
         y = self.canvas.canvasy(event.y)
-        item = self.get_nearest_entity(x, y)
-
-        entity = self.entity_with_endpoints(item)
-        if entity is not None:
-            canvas_x, canvas_y, world_x, world_y = self.nearest_endpoint(
-                x, y, item, entity
-            )
-            self.add_vertex(canvas_x, canvas_y, world_x, world_y)
-
-    def get_scale(self):
-        """Compute scale from the special entity scale-line."""
-        scale_line = self.canvas.find_withtag("scale")[0]
-        x1, y1, x2, y2 = self.canvas.coords(scale_line)
-        len1 = self.canvas.width
-        len2 = x2 - x1
-        return 1.0 * len2 / len1, x1, y1
+        snap_point = self.find_snap_point(x, y)
+        if snap_point is not None:
+            self.add_vertex(*snap_point)
 
     def add_current_vertex_to_room(self, event):
         """Add current vertex to room."""
         canvas_x = self.canvas.canvasx(event.x)
         canvas_y = self.canvas.canvasy(event.y)
-        current_scale, xd, yd = self.get_scale()
-        world_x = (canvas_x - xd) / current_scale
-        world_y = (canvas_y - yd) / current_scale
+        world_x, world_y = self.view.inverse(canvas_x, canvas_y)
         self.add_vertex(canvas_x, canvas_y, world_x, world_y)
 
     def on_left_button_pressed(self, event):
@@ -618,6 +597,18 @@ class MainWindow:
         else:
             self.scroll_start(event)
 
+    def on_mouse_move(self, event):
+        """Handle the mouse move event, the snap point is previewed when room is drawn."""
+        if self.canvas_mode != CanvasMode.DRAW_ROOM or self.drawing is None:
+            return
+        snap_point = self.find_snap_point(
+            self.canvas.canvasx(event.x), self.canvas.canvasy(event.y)
+        )
+        if snap_point is None:
+            self.canvas.hide_snap_marker()
+        else:
+            self.canvas.draw_snap_marker(snap_point[0], snap_point[1])
+
     def on_left_button_drag(self, event):
         """Handle the left mouse button drag event."""
         if (
@@ -628,16 +619,85 @@ class MainWindow:
         else:
             self.scroll_move(event)
 
+    def zoom_view(self, factor, x, y):
+        """Zoom the view by given factor, point [x, y] in window stays on its place.
+
+        Zooms are accumulated in the view transformation, the canvas is updated once per frame.
+        """
+        # window coordinates are converted by the actual scroll position
+        self.scroll_update.flush()
+        self.view.zoom(factor, self.canvas.canvasx(x), self.canvas.canvasy(y))
+        self.view_update.request()
+
+    def update_view(self):
+        """Redraw entities and rooms after the view has been changed, canvas items are recycled."""
+        if self.drawing is None:
+            return
+        self.canvas.move_rooms(self.drawing.rooms, self.view)
+        self.redraw_new_room()
+        self.start_progressive_redraw()
+        self.update_scrollregion()
+
+    def redraw_new_room(self):
+        """Redraw vertexes and lines of the room that is being drawn in the actual view."""
+        if self.canvas_mode != CanvasMode.DRAW_ROOM or self.room.vertexes() == 0:
+            return
+        self.canvas.delete_temporary_entities()
+        self.canvas.hide_snap_marker()
+        # vertexes are stored in world coordinates, canvas coordinates are computed again
+        polygon_world = self.room.polygon_world
+        self.room.cleanup()
+        for world_x, world_y in polygon_world:
+            canvas_x, canvas_y = self.view.apply(world_x, world_y)
+            self.add_vertex(canvas_x, canvas_y, world_x, world_y)
+
+    def start_progressive_redraw(self, view_changed=True):
+        """Draw entities in time slices, rooms are drawn before and raised after all entities."""
+        self.cancel_progressive_redraw()
+        self.progressive_redraw = ProgressiveRedraw(
+            self.root,
+            self.renderer.render_steps(self.drawing, self.view, view_changed),
+            self.canvas.raise_rooms,
+        )
+        self.progressive_redraw.start()
+
+    def set_layer_visible(self, layer, visible):
+        """Show or hide layer, entities skipped while the layer was hidden are drawn."""
+        self.renderer.set_layer_visible(layer, visible)
+        if visible and self.drawing is not None:
+            self.start_progressive_redraw(False)
+
+    def cancel_progressive_redraw(self):
+        """Cancel the redraw that has not been finished yet, it would draw stale view."""
+        if self.progressive_redraw is not None:
+            self.progressive_redraw.cancel()
+            self.progressive_redraw = None
+
+    def update_scrollregion(self):
+        """Set the scroll region to the whole drawing, including parts that are not drawn."""
+        bounds = self.drawing_bounds
+        xmin, ymin = self.view.apply(bounds.xmin, bounds.ymin)
+        xmax, ymax = self.view.apply(bounds.xmax, bounds.ymax)
+        self.canvas.configure(
+            scrollregion=(
+                min(xmin, 0),
+                min(ymin, 0),
+                max(xmax, self.canvas.width),
+                max(ymax, self.canvas.height),
+            )
+        )
+
     # zoom on Windows
     def zoom(self, event):
         """Handle zoom event on Windows."""
         if self.canvas_mode == CanvasMode.DRAW_ROOM:
             return
-        if event.delta > 0:
-            self.canvas.scale("all", event.x, event.y, 1.1, 1.1)
-        elif event.delta < 0:
-            self.canvas.scale("all", event.x, event.y, 0.9, 0.9)
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
+        # one notch of wheel has delta 120, high resolution wheels send its fractions
+        steps = event.delta / MainWindow.WHEEL_DELTA
+        if steps > 0:
+            self.zoom_view(MainWindow.SCALE_UP_FACTOR**steps, event.x, event.y)
+        elif steps < 0:
+            self.zoom_view(MainWindow.SCALE_DOWN_FACTOR ** (-steps), event.x, event.y)
 
     # zoom on Linux
     def zoom_plus(self, event=None):
@@ -645,22 +705,11 @@ class MainWindow:
         if self.canvas_mode == CanvasMode.DRAW_ROOM:
             return
         if event:
-            self.canvas.scale(
-                "all",
-                event.x,
-                event.y,
-                MainWindow.SCALE_UP_FACTOR,
-                MainWindow.SCALE_UP_FACTOR,
-            )
+            self.zoom_view(MainWindow.SCALE_UP_FACTOR, event.x, event.y)
         else:
-            self.canvas.scale(
-                "all",
-                self.canvas.width / 2,
-                self.canvas.height / 2,
-                MainWindow.SCALE_UP_FACTOR,
-                MainWindow.SCALE_UP_FACTOR,
+            self.zoom_view(
+                MainWindow.SCALE_UP_FACTOR, self.canvas.width / 2, self.canvas.height / 2
             )
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     # zoom on Linux
     def zoom_minus(self, event=None):
@@ -668,22 +717,11 @@ class MainWindow:
         if self.canvas_mode == CanvasMode.DRAW_ROOM:
             return
         if event:
-            self.canvas.scale(
-                "all",
-                event.x,
-                event.y,
-                MainWindow.SCALE_DOWN_FACTOR,
-                MainWindow.SCALE_DOWN_FACTOR,
-            )
+            self.zoom_view(MainWindow.SCALE_DOWN_FACTOR, event.x, event.y)
         else:
-            self.canvas.scale(
-                "all",
-                self.canvas.width / 2,
-                self.canvas.height / 2,
-                MainWindow.SCALE_DOWN_FACTOR,
-                MainWindow.SCALE_DOWN_FACTOR,
+            self.zoom_view(
+                MainWindow.SCALE_DOWN_FACTOR, self.canvas.width / 2, self.canvas.height / 2
             )
-        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
     def quit(self):
         """Display message box whether to quit the application."""
@@ -704,21 +742,48 @@ class MainWindow:
 
     @drawing.setter
     def drawing(self, drawing):
-        """Set the current drawing attribute."""
+        """Set the current drawing attribute, the view is fitted to the whole drawing."""
+        self.set_drawing(drawing)
+
+    def set_drawing(self, drawing, bounds=None):
+        """Set the current drawing, its bounds can be computed in advance (in worker thread)."""
         self._drawing = drawing
+        if drawing is not None and bounds is None:
+            bounds = drawing.get_bounds()
+        self.drawing_bounds = bounds
+        # all layers of new drawing are visible
+        self.renderer.hidden_layers.clear()
+        self.layers_panel.fill(drawing.get_layers() if drawing is not None else [])
+        if drawing is not None:
+            self.fit_view()
+
+    def fit_view(self):
+        """Set the view so the whole drawing fits into canvas, world coordinates are kept."""
+        self.view = ViewTransform.fit(
+            self.drawing_bounds,
+            self.canvas.winfo_reqwidth(),
+            self.canvas.winfo_reqheight(),
+        )
 
     def redraw_drawing(self):
         """Redraw the whole drawing."""
         self.canvas.draw_grid()
         self.canvas.draw_boundary()
-        self.canvas.draw_scale_line()
-        self.canvas.draw_entities(self.drawing.entities, 0, 0, 1)
-        self.canvas.draw_rooms(self.drawing.rooms, 0, 0, 1)
+        self.canvas.draw_rooms(self.drawing.rooms, self.view)
+        self.redraw_new_room()
+        self.start_progressive_redraw()
+        self.update_scrollregion()
 
     def redraw(self):
         """Redraw the whole drawing or display message when drawing does not exist."""
+        self.cancel_progressive_redraw()
+        # the whole drawing is drawn by the actual view, so the pending update is not needed
+        self.view_update.cancel()
         self.canvas.delete("all")
+        self.renderer.clear()
         if self.drawing is not None:
+            # IDs of deleted graphics entities are not valid anymore
+            self.drawing.clear_entity_index()
             self.redraw_drawing()
         else:
             self.canvas.draw_empty_drawing_message()
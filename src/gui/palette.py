@@ -184,3 +184,18 @@ class Palette(tkinter.LabelFrame):
         """Handle event: delete room from list."""
         self.listbox.selection_clear(0, tkinter.END)
         self.listbox.delete(index)
+
+    def delete_rooms_from_list(self, room_ids):
+        """Delete rooms with given IDs from listbox, other rooms are kept."""
+        room_ids = set(room_ids)
+        self.listbox.selection_clear(0, tkinter.END)
+        # the listbox is traversed from its end, so indexes of unvisited items are not changed
+        for index, room_id in reversed(list(enumerate(self.listbox.get(0, tkinter.END)))):
+            if room_id in room_ids:
+                self.listbox.delete(index)
+
+    def add_new_rooms(self, room_ids):
+        """Add new rooms at the end of listbox."""
+        if room_ids:
+            self.listbox.insert(tkinter.END, *room_ids)
+            self.button2.config(state="normal")
@@ -0,0 +1,72 @@
+"""Redraw of drawing that runs in time slices, so the GUI is not blocked."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import time
+import tkinter
+from collections.abc import Callable, Iterator
+from typing import Optional
+
+
+class ProgressiveRedraw:
+    """Redraw of drawing that runs in time slices, so the GUI is not blocked.
+
+    Steps of the redraw are generated by renderer, each step draws a chunk of
+    entities. One slice runs steps until its frame budget is exhausted, the
+    next slice is scheduled by after(), so the Tk loop can process events and
+    display the partially drawn drawing in between. A stale redraw is cancelled
+    when a new one starts.
+    """
+
+    # time of one slice (in seconds)
+    FRAME_BUDGET = 0.015
+
+    # interval between two slices (in milliseconds)
+    SLICE_INTERVAL = 1
+
+    def __init__(
+        self,
+        root: tkinter.Misc,
+        steps: Iterator[None],
+        on_finish: Optional[Callable[[], None]] = None,
+    ) -> None:
+        """Initialize the redraw, callback is called when all steps are done."""
+        self.root = root
+        self.steps = steps
+        self.on_finish = on_finish
+        # ID of the scheduled slice
+        self.job: Optional[str] = None
+        self.finished = False
+
+    def start(self) -> None:
+        """Run the first slice immediately, so the drawing appears without delay."""
+        self.run_slice()
+
+    def cancel(self) -> None:
+        """Cancel the scheduled slice, items of unfinished step are cleaned up by renderer."""
+        if self.job is not None:
+            self.root.after_cancel(self.job)
+            self.job = None
+        self.steps.close()
+
+    def run_slice(self) -> None:
+        """Run steps until the frame budget is exhausted, then schedule the next slice."""
+        self.job = None
+        deadline = time.perf_counter() + ProgressiveRedraw.FRAME_BUDGET
+        for _ in self.steps:
+            if time.perf_counter() >= deadline:
+                self.job = self.root.after(ProgressiveRedraw.SLICE_INTERVAL, self.run_slice)
+                return
+        self.finished = True
+        if self.on_finish is not None:
+            self.on_finish()
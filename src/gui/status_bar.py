@@ -13,6 +13,8 @@
 #
 
 import tkinter
+from collections.abc import Callable
+from tkinter import ttk
 
 
 class StatusBar(tkinter.Frame):
@@ -22,7 +24,10 @@ class StatusBar(tkinter.Frame):
         """Initialize the class."""
         tkinter.Frame.__init__(self, master)
         self.label = tkinter.Label(self, bd=1, relief=tkinter.SUNKEN, anchor=tkinter.W)
-        self.label.pack(fill=tkinter.X)
+        self.label.pack(side=tkinter.LEFT, fill=tkinter.X, expand=True)
+        # progress indicator is displayed only while the drawing is being imported
+        self.progressbar = ttk.Progressbar(self, length=200, maximum=100)
+        self.cancel_button = tkinter.Button(self, text="Přerušit")
 
     def set(self, format, *args):
         """Set status bar messages."""
@@ -33,3 +38,24 @@ class StatusBar(tkinter.Frame):
         """Clear status bar content."""
         self.label.config(text="")
         self.label.update_idletasks()
+
+    def show_progress(self, cancel_command: Callable[[], None]) -> None:
+        """Show the progress indicator and button to cancel the operation."""
+        self.progressbar.config(value=0)
+        self.cancel_button.config(command=cancel_command, state=tkinter.NORMAL)
+        self.cancel_button.pack(side=tkinter.RIGHT)
+        self.progressbar.pack(side=tkinter.RIGHT, padx=2)
+
+    def set_progress(self, done: int, total: int) -> None:
+        """Update the progress indicator."""
+        if total > 0:
+            self.progressbar.config(value=100 * done / total)
+
+    def disable_cancel(self) -> None:
+        """Disable the cancel button when the cancellation has been requested."""
+        self.cancel_button.config(state=tkinter.DISABLED)
+
+    def hide_progress(self) -> None:
+        """Hide the progress indicator and the cancel button."""
+        self.progressbar.pack_forget()
+        self.cancel_button.pack_forget()
@@ -0,0 +1,68 @@
+"""Command line tool to inspect or clear the cache of imported drawings."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import argparse
+import time
+from typing import Optional
+
+from configuration import Configuration
+from importers.drawing_loader import DrawingLoader
+from importers.import_cache import ImportCache
+
+
+def list_snapshots(cache: ImportCache) -> None:
+    """Print all snapshots, the least recently used first."""
+    entries = cache.entries()
+    for key, size, accessed in entries:
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(accessed))
+        print(f"{key}  {size:12}  {timestamp}")
+    total = sum(size for _, size, _ in entries)
+    print(f"snapshots: {len(entries)}, size: {total} of {cache.max_size} bytes")
+
+
+def check_files(cache: ImportCache, loader: DrawingLoader, filenames: list[str]) -> None:
+    """Print whether given drawing files are cached with options of the loader."""
+    for filename in filenames:
+        key = loader.cache_key(filename)
+        cached = "cached" if cache.path(key).exists() else "not cached"
+        print(f"{filename}: {cached} ({key})")
+
+
+def main(argv: Optional[list[str]] = None) -> None:
+    """Run the command line tool."""
+    parser = argparse.ArgumentParser(description=__doc__)
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    subparsers.add_parser("list", help="list all cached snapshots")
+    subparsers.add_parser("clear", help="remove all cached snapshots")
+    subparsers.add_parser("evict", help="remove least recently used snapshots over size cap")
+    check = subparsers.add_parser("check", help="check whether drawing files are cached")
+    check.add_argument("filenames", nargs="+", metavar="FILE")
+    args = parser.parse_args(argv)
+
+    configuration = Configuration()
+    cache = ImportCache(configuration.cache_directory, configuration.cache_max_size)
+    print(f"cache directory: {cache.directory}")
+
+    if args.command == "list":
+        list_snapshots(cache)
+    elif args.command == "clear":
+        print(f"removed snapshots: {cache.clear()}")
+    elif args.command == "evict":
+        print(f"removed snapshots: {cache.evict()}")
+    elif args.command == "check":
+        check_files(cache, DrawingLoader.from_configuration(configuration), args.filenames)
+
+
+if __name__ == "__main__":
+    main()
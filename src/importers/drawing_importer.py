@@ -137,7 +137,7 @@ class DrawingImporter:
             color = int(parts[1])
         except Exception as e:
             color = 0
-        layer = parts[2]
+        layer = sys.intern(parts[2])
         x1 = float(parts[3])
         y1 = float(parts[4])
         x2 = float(parts[5])
@@ -151,7 +151,7 @@ class DrawingImporter:
             color = int(parts[1])
         except (ValueError, IndexError):
             color = 0
-        layer = parts[2]
+        layer = sys.intern(parts[2])
         x = float(parts[3])
         y = float(parts[4])
         radius = float(parts[5])
@@ -164,7 +164,7 @@ class DrawingImporter:
             color = int(parts[1])
         except (ValueError, IndexError):
             color = 0
-        layer = parts[2]
+        layer = sys.intern(parts[2])
         x = float(parts[3])
         y = float(parts[4])
         radius = float(parts[5])
@@ -179,7 +179,7 @@ class DrawingImporter:
             color = int(parts[1])
         except (ValueError, IndexError):
             color = 0
-        layer = parts[2]
+        layer = sys.intern(parts[2])
         x = float(parts[3])
         y = float(parts[4])
         text = " ".join(parts[5:]).strip()
@@ -193,7 +193,7 @@ class DrawingImporter:
             color = int(parts[1])
         except (ValueError, IndexError):
             color = 0
-        layer = parts[2]
+        layer = sys.intern(parts[2])
         vertexes = int(parts[3])
         coordinates = parts[4:]
         # first half of coordinates
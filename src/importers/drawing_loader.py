@@ -0,0 +1,99 @@
+"""Loader of drawings from DXF and DRW files with import cache."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from typing import Optional
+
+from configuration import Configuration
+from drawing import Drawing
+from importers.drawing_importer import DrawingImporter
+from importers.dxf_import_filter import DxfImportFilter
+from importers.dxf_importer import DxfImporter
+from importers.import_cache import ImportCache
+from importers.import_progress import ImportProgress
+
+
+class DrawingLoader:
+    """Loader of drawings from DXF and DRW files with import cache."""
+
+    def __init__(
+        self,
+        cache: Optional[ImportCache] = None,
+        columnar: bool = False,
+        workers: int = 1,
+        import_filter: Optional[DxfImportFilter] = None,
+    ) -> None:
+        """Initialize the loader, None means that imported drawings are not cached."""
+        self.cache = cache
+        # entities imported from DXF are stored by types in contiguous arrays
+        self.columnar = columnar
+        # number of worker processes that parse ENTITIES section of DXF
+        self.workers = workers
+        self.import_filter = import_filter
+
+    @staticmethod
+    def from_configuration(configuration: Configuration) -> "DrawingLoader":
+        """Construct the loader with cache set up by configuration."""
+        columnar = configuration.columnar_storage
+        workers = configuration.import_workers
+        if not configuration.cache_enabled:
+            return DrawingLoader(columnar=columnar, workers=workers)
+        cache = ImportCache(configuration.cache_directory, configuration.cache_max_size)
+        return DrawingLoader(cache, columnar, workers)
+
+    @staticmethod
+    def importer_name(filename: str) -> str:
+        """Return name of importer used for given file."""
+        return "drw" if filename.endswith(".drw") else "dxf"
+
+    def import_drawing(
+        self, filename: str, progress: Optional[ImportProgress] = None
+    ) -> Optional[Drawing]:
+        """Import the drawing from file, the cache is not used."""
+        if DrawingLoader.importer_name(filename) == "drw":
+            return DrawingImporter(filename).import_drawing()
+        return DxfImporter(
+            filename,
+            workers=self.workers,
+            import_filter=self.import_filter,
+            progress=progress,
+            columnar=self.columnar,
+        ).import_dxf()
+
+    def cache_key(self, filename: str) -> str:
+        """Return key of the drawing in import cache, options of import are part of the key."""
+        import_filter = self.import_filter.key() if self.import_filter is not None else ""
+        options = f"columnar={self.columnar};filter={import_filter}"
+        return ImportCache.key(filename, DrawingLoader.importer_name(filename), options)
+
+    def load(
+        self, filename: str, progress: Optional[ImportProgress] = None
+    ) -> Optional[Drawing]:
+        """Load the drawing from cache or import it from file, progress is reported optionally."""
+        if self.cache is None:
+            return self.import_drawing(filename, progress)
+
+        key = self.cache_key(filename)
+        drawing = self.cache.load(key)
+        if drawing is not None:
+            print(f"Drawing loaded from cache: {filename}")
+            return drawing
+
+        drawing = self.import_drawing(filename, progress)
+        if drawing is not None:
+            try:
+                self.cache.store(key, drawing)
+            except OSError as e:
+                # the drawing is imported properly, so it can be used anyway
+                print(f"Drawing can't be cached: {e}")
+        return drawing
@@ -0,0 +1,180 @@
+"""Tokenizer that reads pairs code+value from binary DXF file."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import mmap
+import struct
+from collections.abc import Iterator
+
+from importers.dxf_codes import DxfCodes
+from importers.dxf_decoder import DxfDecoder
+from importers.dxf_mmap_tokenizer import DxfMmapTokenizer
+
+
+class DxfBinaryTokenizer:
+    """Tokenizer that reads pairs code+value from binary DXF file.
+
+    Values are not converted into strings, the state machine gets them as
+    str, float, or int directly.
+    """
+
+    # binary DXF files start with this sentinel
+    SENTINEL = b"AutoCAD Binary DXF\r\n\x1a\x00"
+
+    # types of values stored in binary DXF file
+    STRING = 0
+    DOUBLE = 1
+    INT16 = 2
+    INT32 = 3
+    INT64 = 4
+    BOOLEAN = 5
+    BINARY_CHUNK = 6
+
+    # ranges of group codes (inclusive) and types of their values
+    VALUE_TYPES = (
+        (0, 9, STRING),
+        (10, 59, DOUBLE),
+        (60, 79, INT16),
+        (90, 99, INT32),
+        (100, 109, STRING),
+        (110, 149, DOUBLE),
+        (160, 169, INT64),
+        (170, 179, INT16),
+        (210, 239, DOUBLE),
+        (270, 289, INT16),
+        (290, 299, BOOLEAN),
+        (300, 309, STRING),
+        (310, 319, BINARY_CHUNK),
+        (320, 369, STRING),
+        (370, 389, INT16),
+        (390, 399, STRING),
+        (400, 409, INT16),
+        (410, 419, STRING),
+        (420, 429, INT32),
+        (430, 439, STRING),
+        (440, 459, INT32),
+        (460, 469, DOUBLE),
+        (470, 481, STRING),
+        (999, 1003, STRING),
+        (1004, 1004, BINARY_CHUNK),
+        (1005, 1009, STRING),
+        (1010, 1059, DOUBLE),
+        (1060, 1070, INT16),
+        (1071, 1071, INT32),
+    )
+
+    # escape used by old versions that store group codes in one byte
+    EXTENDED_CODE = 255
+
+    def __init__(self, buffer: mmap.mmap, decoder: DxfDecoder) -> None:
+        """Initialize the tokenizer for memory-mapped binary DXF file."""
+        self.buffer = buffer
+        self.decoder = decoder
+        # position of the first byte that was not tokenized yet
+        self.position = 0
+
+    @staticmethod
+    def is_binary(prefix: bytes) -> bool:
+        """Check if the file prefix contains the binary DXF sentinel."""
+        return prefix.startswith(DxfBinaryTokenizer.SENTINEL)
+
+    @staticmethod
+    def value_type(code: int) -> int:
+        """Return the type of value stored for given group code."""
+        for first, last, value_type in DxfBinaryTokenizer.VALUE_TYPES:
+            if first <= code <= last:
+                return value_type
+        raise Exception(f"unknown group code {code} in binary DXF")
+
+    @staticmethod
+    def has_wide_codes(first_code: bytes) -> bool:
+        """Check if group codes are stored in two bytes (since R13) or in one byte."""
+        if len(first_code) < 2:
+            return True
+        # one byte code is either zero followed by section name, or escape of longer code
+        if first_code[0] == 0:
+            return first_code[1] == 0
+        return first_code[0] != DxfBinaryTokenizer.EXTENDED_CODE
+
+    def pairs(self) -> Iterator[tuple[int, str | float | int]]:
+        """Generate pair dxf_code + dxf_value for each iteration."""
+        buffer = self.buffer
+        decode = self.decoder.decode
+        unpack_int16 = struct.Struct("<h").unpack_from
+        unpack_uint16 = struct.Struct("<H").unpack_from
+        unpack_int32 = struct.Struct("<i").unpack_from
+        unpack_int64 = struct.Struct("<q").unpack_from
+        unpack_double = struct.Struct("<d").unpack_from
+        decoded_codes = DxfMmapTokenizer.DECODED_CODES
+        value_types: dict[int, int] = {}
+        end = len(buffer)
+        position = len(DxfBinaryTokenizer.SENTINEL)
+        wide_codes = DxfBinaryTokenizer.has_wide_codes(buffer[position : position + 2])
+
+        while position < end:
+            if wide_codes:
+                code = unpack_uint16(buffer, position)[0]
+                position += 2
+            else:
+                code = buffer[position]
+                position += 1
+                if code == DxfBinaryTokenizer.EXTENDED_CODE:
+                    code = unpack_uint16(buffer, position)[0]
+                    position += 2
+
+            value_type = value_types.get(code)
+            if value_type is None:
+                value_type = DxfBinaryTokenizer.value_type(code)
+                value_types[code] = value_type
+
+            if value_type == DxfBinaryTokenizer.STRING:
+                terminator = buffer.find(b"\x00", position)
+                if terminator == -1:
+                    terminator = end
+                # strings not used by the state machine are not decoded at all
+                value = decode(buffer[position:terminator]) if code in decoded_codes else ""
+                position = terminator + 1
+            elif value_type == DxfBinaryTokenizer.DOUBLE:
+                value = unpack_double(buffer, position)[0]
+                position += 8
+            elif value_type == DxfBinaryTokenizer.INT16:
+                value = unpack_int16(buffer, position)[0]
+                position += 2
+            elif value_type == DxfBinaryTokenizer.INT32:
+                value = unpack_int32(buffer, position)[0]
+                position += 4
+            elif value_type == DxfBinaryTokenizer.INT64:
+                value = unpack_int64(buffer, position)[0]
+                position += 8
+            elif value_type == DxfBinaryTokenizer.BOOLEAN:
+                value = buffer[position]
+                position += 1
+            else:
+                # binary chunk is prefixed by its length, the data are not used at all
+                position += buffer[position] + 1
+                value = ""
+            self.position = position
+            yield code, value
+
+    def section_pairs(self, name: str) -> Iterator[tuple[int, str | float | int]]:
+        """Generate pairs code + value from the body of given section only."""
+        inside = False
+        section_start = False
+        for code, value in self.pairs():
+            if code == DxfCodes.TEXT_STRING and value == "ENDSEC":
+                inside = False
+            if inside:
+                yield code, value
+            elif section_start and code == DxfCodes.NAME:
+                inside = value == name
+            section_start = code == DxfCodes.TEXT_STRING and value == "SECTION"
@@ -38,9 +38,12 @@ class DxfCodes:
     ELEVATION = 38
     THICKNESS = 39
     RADIUS = 40  # 41-48 other floating point values
+    XSCALE = 41
+    YSCALE = 42
     ANGLE1 = 50
     ANGLE2 = 51  # 52-58 other angles
     VISIBILITY = 60
+    FLAGS = 70  # 70-78 other integer values
     COLOR = 62
     COMMENT = 999
     MIRROR = 230
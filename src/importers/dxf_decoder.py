@@ -0,0 +1,140 @@
+"""Decoder of text data stored in DXF files with detection of the character encoding."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import codecs
+import re
+from typing import Optional
+
+from importers.dxf_encoding_strategy import DxfEncodingStrategy
+
+
+class DxfDecoder:
+    """Decoder of text data stored in DXF files with detection of the character encoding."""
+
+    # encodings that are tried in this order
+    ENCODINGS = ["utf-8", "windows-1250", "windows-1252"]
+
+    # size of file prefix used to detect the encoding
+    PREFIX_SIZE = 64 * 1024
+
+    # DXF files written by AutoCAD 2007 (AC1021) and newer are always encoded in UTF-8
+    UTF8_VERSION = "AC1021"
+
+    CODEPAGE_PATTERN = re.compile(rb"\$DWGCODEPAGE[ \t]*\r?\n[ \t]*3[ \t]*\r?\n([^\r\n]*)")
+    VERSION_PATTERN = re.compile(rb"\$ACADVER[ \t]*\r?\n[ \t]*1[ \t]*\r?\n([^\r\n]*)")
+    CODEPAGE_NUMBER_PATTERN = re.compile(r"(?:ANSI_|DOS)(\d+)")
+
+    # the same variables in binary DXF (zero terminated strings, one or two bytes long codes)
+    BINARY_CODEPAGE_PATTERN = re.compile(rb"\$DWGCODEPAGE\x00\x03\x00?([^\x00]*)\x00")
+    BINARY_VERSION_PATTERN = re.compile(rb"\$ACADVER\x00\x01\x00?([^\x00]*)\x00")
+
+    def __init__(self) -> None:
+        """Initialize the decoder, the encoding needs to be detected later."""
+        self.encoding = DxfDecoder.ENCODINGS[0]
+        self.strategy = DxfEncodingStrategy.PREFIX_SAMPLE
+
+    @staticmethod
+    def codepage_to_encoding(codepage: str) -> Optional[str]:
+        """Convert the DXF code page name (ANSI_1250 etc.) into Python encoding name."""
+        if codepage.upper() in ("UTF8", "UTF-8"):
+            return "utf-8"
+        match = DxfDecoder.CODEPAGE_NUMBER_PATTERN.fullmatch(codepage.upper())
+        if match is None:
+            return None
+        encoding = "cp" + match.group(1)
+        try:
+            codecs.lookup(encoding)
+        except LookupError:
+            return None
+        return encoding
+
+    @staticmethod
+    def header_variable(prefix: bytes, pattern: re.Pattern) -> Optional[str]:
+        """Try to find the value of header variable in the file prefix."""
+        match = pattern.search(prefix)
+        if match is None:
+            return None
+        return match.group(1).decode("ascii", errors="ignore").strip()
+
+    @staticmethod
+    def sample_encoding(prefix: bytes) -> Optional[str]:
+        """Find the first encoding that is able to decode the file prefix."""
+        for encoding in DxfDecoder.ENCODINGS:
+            # the prefix might end in the middle of multibyte sequence
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                decoder.decode(prefix, final=False)
+            except UnicodeDecodeError:
+                # ok, we expect some errors ;)
+                pass
+            else:
+                return encoding
+        return None
+
+    def detect(self, prefix: bytes, binary: bool = False) -> str:
+        """Detect the encoding from header variables or from the file prefix."""
+        if binary:
+            version = DxfDecoder.header_variable(prefix, DxfDecoder.BINARY_VERSION_PATTERN)
+            codepage = DxfDecoder.header_variable(prefix, DxfDecoder.BINARY_CODEPAGE_PATTERN)
+        else:
+            version = DxfDecoder.header_variable(prefix, DxfDecoder.VERSION_PATTERN)
+            codepage = DxfDecoder.header_variable(prefix, DxfDecoder.CODEPAGE_PATTERN)
+        encoding = None
+
+        if version is not None and version >= DxfDecoder.UTF8_VERSION:
+            encoding = "utf-8"
+            self.strategy = DxfEncodingStrategy.HEADER_VERSION
+        elif codepage is not None:
+            encoding = DxfDecoder.codepage_to_encoding(codepage)
+            self.strategy = DxfEncodingStrategy.HEADER_CODEPAGE
+
+        if encoding is None and binary:
+            # strings are mixed with numbers, so the prefix can't be sampled,
+            # the encoding will be switched by decoder when needed
+            encoding = DxfDecoder.ENCODINGS[0]
+            self.strategy = DxfEncodingStrategy.DECODER_SWITCH
+        elif encoding is None:
+            encoding = DxfDecoder.sample_encoding(prefix) or DxfDecoder.ENCODINGS[-1]
+            self.strategy = DxfEncodingStrategy.PREFIX_SAMPLE
+
+        self.encoding = encoding
+        print(f"Encoding: {self.encoding} ({self.strategy.name})")
+        return encoding
+
+    def switch_encoding(self, data: bytes) -> Optional[str]:
+        """Switch to the next encoding that is able to decode given data."""
+        encodings = DxfDecoder.ENCODINGS
+        start = encodings.index(self.encoding) + 1 if self.encoding in encodings else 0
+        for encoding in encodings[start:]:
+            try:
+                text = data.decode(encoding)
+            except UnicodeDecodeError:
+                pass
+            else:
+                print(f"Encoding switched: {self.encoding} -> {encoding}")
+                self.encoding = encoding
+                self.strategy = DxfEncodingStrategy.DECODER_SWITCH
+                return text
+        return None
+
+    def decode(self, data: bytes) -> str:
+        """Decode data read from DXF file, switch the encoding on the fly when needed."""
+        try:
+            return data.decode(self.encoding)
+        except UnicodeDecodeError:
+            text = self.switch_encoding(data)
+            if text is None:
+                # nothing helped, but we don't want to stop reading the file
+                text = data.decode(self.encoding, errors="replace")
+            return text
@@ -0,0 +1,24 @@
+"""Strategy used to resolve the character encoding of DXF file."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from enum import Enum
+
+
+class DxfEncodingStrategy(Enum):
+    """Strategy used to resolve the character encoding of DXF file."""
+
+    HEADER_CODEPAGE = (1,)
+    HEADER_VERSION = (2,)
+    PREFIX_SAMPLE = (3,)
+    DECODER_SWITCH = 4
@@ -0,0 +1,145 @@
+"""Attributes of one entity that is being read from DXF file."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import sys
+from typing import Optional
+
+from entities.drawing_entity_type import DrawingEntityType
+
+
+class DxfEntityRecord:
+    """Attributes of one entity that is being read from DXF file."""
+
+    __slots__ = (
+        "entity_type",
+        "layer",
+        "color",
+        "x1",
+        "y1",
+        "x2",
+        "y2",
+        "radius",
+        "angle1",
+        "angle2",
+        "text",
+        "name",
+        "xscale",
+        "yscale",
+        "mirror",
+        "points_x",
+        "points_y",
+    )
+
+    def __init__(self, entity_type: DrawingEntityType) -> None:
+        """Initialize the record for entity of given type."""
+        self.entity_type = entity_type
+        self.layer: Optional[str] = None
+        self.color: Optional[int] = None
+        self.x1 = 0.0
+        self.y1 = 0.0
+        self.x2 = 0.0
+        self.y2 = 0.0
+        self.radius = 0.0
+        self.angle1 = 0.0
+        self.angle2 = 0.0
+        self.text = ""
+        self.name = ""
+        self.xscale = 1.0
+        self.yscale = 1.0
+        self.mirror = 1
+        self.points_x: list[float] = []
+        self.points_y: list[float] = []
+
+    # handlers for all group codes, they are called from precompiled dispatch tables
+
+    @staticmethod
+    def set_layer(record: "DxfEntityRecord", data: str) -> None:
+        """Set the layer name, spaces are not allowed in layer names."""
+        # layer names are interned, so all entities share the same string objects
+        record.layer = sys.intern(data.replace(" ", "_"))
+
+    @staticmethod
+    def set_color(record: "DxfEntityRecord", data: str) -> None:
+        """Set the color code."""
+        record.color = int(data)
+
+    @staticmethod
+    def set_x1(record: "DxfEntityRecord", data: str) -> None:
+        """Set the x coordinate of first point."""
+        record.x1 = float(data)
+
+    @staticmethod
+    def set_y1(record: "DxfEntityRecord", data: str) -> None:
+        """Set the y coordinate of first point."""
+        record.y1 = float(data)
+
+    @staticmethod
+    def set_x2(record: "DxfEntityRecord", data: str) -> None:
+        """Set the x coordinate of second point."""
+        record.x2 = float(data)
+
+    @staticmethod
+    def set_y2(record: "DxfEntityRecord", data: str) -> None:
+        """Set the y coordinate of second point."""
+        record.y2 = float(data)
+
+    @staticmethod
+    def set_radius(record: "DxfEntityRecord", data: str) -> None:
+        """Set the radius."""
+        record.radius = float(data)
+
+    @staticmethod
+    def set_angle1(record: "DxfEntityRecord", data: str) -> None:
+        """Set the start angle."""
+        record.angle1 = float(data)
+
+    @staticmethod
+    def set_angle2(record: "DxfEntityRecord", data: str) -> None:
+        """Set the end angle."""
+        record.angle2 = float(data)
+
+    @staticmethod
+    def set_text(record: "DxfEntityRecord", data: str) -> None:
+        """Set the text string."""
+        record.text = data
+
+    @staticmethod
+    def set_name(record: "DxfEntityRecord", data: str) -> None:
+        """Set the name of referenced block."""
+        record.name = data
+
+    @staticmethod
+    def set_xscale(record: "DxfEntityRecord", data: str) -> None:
+        """Set the scale factor in x direction."""
+        record.xscale = float(data)
+
+    @staticmethod
+    def set_yscale(record: "DxfEntityRecord", data: str) -> None:
+        """Set the scale factor in y direction."""
+        record.yscale = float(data)
+
+    @staticmethod
+    def set_mirror(record: "DxfEntityRecord", data: str) -> None:
+        """Set the mirror flag (Z axis of extrusion direction)."""
+        record.mirror = int(float(data))
+
+    @staticmethod
+    def add_point_x(record: "DxfEntityRecord", data: str) -> None:
+        """Add x coordinate of next polyline vertex."""
+        record.points_x.append(float(data))
+
+    @staticmethod
+    def add_point_y(record: "DxfEntityRecord", data: str) -> None:
+        """Add y coordinate of next polyline vertex."""
+        record.points_y.append(float(data))
@@ -0,0 +1,72 @@
+"""Filter for layers and entity types that are imported from DXF files."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from collections.abc import Iterable
+from typing import Optional
+
+from entities.drawing_entity_type import DrawingEntityType
+
+
+class DxfImportFilter:
+    """Filter for layers and entity types that are imported from DXF files."""
+
+    def __init__(
+        self,
+        include_layers: Optional[Iterable[str]] = None,
+        exclude_layers: Optional[Iterable[str]] = None,
+        include_types: Optional[Iterable[DrawingEntityType]] = None,
+        exclude_types: Optional[Iterable[DrawingEntityType]] = None,
+    ) -> None:
+        """Initialize the filter, None means that the given list is not used at all."""
+        self.include_layers = DxfImportFilter.layer_set(include_layers)
+        self.exclude_layers = DxfImportFilter.layer_set(exclude_layers) or set()
+        self.include_types = set(include_types) if include_types is not None else None
+        self.exclude_types = set(exclude_types or ())
+
+    @staticmethod
+    def layer_set(layers: Optional[Iterable[str]]) -> Optional[set[str]]:
+        """Convert layer names into set, spaces are replaced the same way as in importer."""
+        if layers is None:
+            return None
+        return {layer.replace(" ", "_") for layer in layers}
+
+    def key(self) -> str:
+        """Return stable description of the filter, it is used in keys of import cache."""
+
+        def names(values: Optional[Iterable]) -> str:
+            if values is None:
+                return "*"
+            return ",".join(sorted(getattr(value, "name", value) for value in values))
+
+        return (
+            f"layers+{names(self.include_layers)}-{names(self.exclude_layers)}"
+            f" types+{names(self.include_types)}-{names(self.exclude_types)}"
+        )
+
+    @property
+    def filters_layers(self) -> bool:
+        """Check if the filter needs to check layer of all entities."""
+        return self.include_layers is not None or len(self.exclude_layers) > 0
+
+    def accepts_entity_type(self, entity_type: DrawingEntityType) -> bool:
+        """Check if the entity of given type needs to be imported."""
+        if entity_type in self.exclude_types:
+            return False
+        return self.include_types is None or entity_type in self.include_types
+
+    def accepts_layer(self, layer: Optional[str]) -> bool:
+        """Check if the entity placed in given layer needs to be imported."""
+        if layer in self.exclude_layers:
+            return False
+        return self.include_layers is None or layer in self.include_layers
@@ -12,27 +12,61 @@
 #      Pavel Tisnovsky
 #
 
-from collections.abc import Iterator
-from io import TextIOWrapper
+import math
+import mmap
+import os
+from collections.abc import Callable, Iterator
+from concurrent.futures import ProcessPoolExecutor
+from io import BufferedReader
 from typing import Optional
 
 from drawing import Drawing
 from entities.arc import Arc
+from entities.block import Block
 from entities.circle import Circle
+from entities.columnar_entities import ColumnarEntities
 from entities.drawing_entity_type import DrawingEntityType
+from entities.insert import Insert
 from entities.line import Line
 from entities.polyline import Polyline
 from entities.text import Text
+from geometry.affine_transform import AffineTransform
+from geometry.bounds import Bounds
+from importers.dxf_binary_tokenizer import DxfBinaryTokenizer
 from importers.dxf_codes import DxfCodes
+from importers.dxf_decoder import DxfDecoder
+from importers.dxf_entity_record import DxfEntityRecord
+from importers.dxf_import_filter import DxfImportFilter
+from importers.dxf_mmap_tokenizer import DxfMmapTokenizer
 from importers.dxf_reader_state import DxfReaderState
+from importers.dxf_tokenizer_type import DxfTokenizerType
+from importers.import_progress import ImportCancelledError, ImportProgress
 
 
 class DxfImporter:
     """Importer for drawings stored in a DXF format."""
 
-    def __init__(self, filename: str) -> None:
-        """Initialize the importer."""
+    # ENTITIES sections smaller than this size are always parsed sequentially
+    PARALLEL_MIN_SIZE = 256 * 1024
+
+    def __init__(
+        self,
+        filename: str,
+        tokenizer: DxfTokenizerType = DxfTokenizerType.TEXT,
+        workers: int = 1,
+        import_filter: Optional[DxfImportFilter] = None,
+        progress: Optional[ImportProgress] = None,
+        columnar: bool = False,
+    ) -> None:
+        """Initialize the importer, select the tokenizer, number of worker processes, and filter."""
         self.filename = filename
+        self.tokenizer = tokenizer
+        self.workers = workers
+        self.import_filter = import_filter
+        # import progress is reported only when the import runs in background
+        self.progress = progress
+        # entities of drawing can be stored by types in contiguous arrays
+        self.columnar = columnar
         self.state_switcher = {
             DxfReaderState.BEGINNING: DxfImporter.process_beginning,
             DxfReaderState.BEGINNING_SECTION: DxfImporter.process_beginning_section,
@@ -43,34 +77,52 @@ class DxfImporter:
             DxfReaderState.SECTION_OBJECTS: DxfImporter.process_section_objects,
             DxfReaderState.SECTION_CLASSES: DxfImporter.process_section_classes,
             DxfReaderState.SECTION_BLOCK: DxfImporter.process_section_block,
+            DxfReaderState.SECTION_BLOCK_ENTITY: DxfImporter.process_section_block_entity,
             DxfReaderState.ENTITY: DxfImporter.process_entity,
         }
 
-    def dxf_entry(self, fin: TextIOWrapper) -> Iterator[tuple[int, str]]:
+    def dxf_entry(self, fin: BufferedReader) -> Iterator[tuple[int, str]]:
         """Generate pair dxf_code + dxf_data for each iteration."""
-        linenumber = 0
+        decode = self.decoder.decode
         while True:
-            line1 = None
-            line2 = None
-            linenumber += 1
             line1 = fin.readline()
-            try:
-                linenumber += 1
-                line2 = fin.readline()
-            except Exception as e:
-                print(f"Error on line: {linenumber}")
-                line2 = ""
+            line2 = fin.readline()
             if not line1 or not line2:
                 break
-            code = int(line1.strip())
-            data = line2.strip()
+            # int() is able to parse bytes and it ignores whitespaces
+            code = int(line1)
+            data = decode(line2).strip()
             yield code, data
+            if self.skip_requested:
+                # the rest of section is not needed, so its lines are not even decoded
+                self.skip_requested = False
+                if self.skip_section(fin):
+                    yield DxfCodes.TEXT_STRING, "ENDSEC"
+
+    def skip_section(self, fin: BufferedReader) -> bool:
+        """Fast forward to the end of section, return False when the file ends earlier."""
+        while True:
+            line1 = fin.readline()
+            line2 = fin.readline()
+            if not line1 or not line2:
+                return False
+            if line2.strip() == b"ENDSEC" and line1.strip() == b"0":
+                return True
+            self.skipped_pairs += 1
 
     def init_import(self) -> None:
         """Initialize the object state before import."""
         self.state = DxfReaderState.BEGINNING
-        self.entity_type = DrawingEntityType.UNKNOWN
-        self.blockName : Optional[str] = None
+        # pairs from sections that were skipped without processing
+        self.skipped_pairs = 0
+        self.skip_requested = False
+        # values of header variables, values are stored under their codes
+        self.header: dict[str, dict[int, str]] = {}
+        self.header_variable: Optional[str] = None
+        # all block definitions and the block that is being read
+        self.blocks : dict[str, Block] = {}
+        self.block : Optional[Block] = None
+        self.decoder = DxfDecoder()
         self.statistic = {
             DrawingEntityType.UNKNOWN: 0,
             DrawingEntityType.LINE: 0,
@@ -78,42 +130,287 @@ class DxfImporter:
             DrawingEntityType.ARC: 0,
             DrawingEntityType.TEXT: 0,
             DrawingEntityType.POLYLINE: 0,
+            DrawingEntityType.INSERT: 0,
         }
-        self.entities :list = []
-
-    def detect_encoding(self) -> Optional[str]:
-        """Detect the encoding of DXF file."""
-        encodings = ["utf-8", "windows-1250", "windows-1252"]
-        for encoding in encodings:
-            try:
-                with open(self.filename, encoding=encoding) as fin:
-                    fin.readlines()
-                    fin.seek(0)
-            except UnicodeDecodeError as e:
-                # ok, we expect some errors ;)
-                pass
-            else:
-                print(f"Encoding: {encoding}")
-                return encoding
-        return None
+        self.entities : list | ColumnarEntities = ColumnarEntities() if self.columnar else []
+        # entities are stored into drawing or into block definition
+        self.container = self.entities
+        # entity that is being read
+        self.entity : Optional[DxfEntityRecord] = None
+        self.entity_handlers : dict = {}
+        # entity types and layers that are accepted by import filter
+        self.entity_types = DxfImporter.ENTITY_TYPES
+        self.accepts_layer = None
+        if self.import_filter is not None:
+            self.entity_types = {
+                name: entity_type
+                for name, entity_type in DxfImporter.ENTITY_TYPES.items()
+                if self.import_filter.accepts_entity_type(entity_type)
+            }
+            if self.import_filter.filters_layers:
+                self.accepts_layer = self.import_filter.accepts_layer
+
+    def detect_encoding(self, fin: BufferedReader) -> str:
+        """Detect the encoding of DXF file from its prefix without consuming it."""
+        prefix = fin.peek(DxfDecoder.PREFIX_SIZE)[: DxfDecoder.PREFIX_SIZE]
+        return self.decoder.detect(prefix)
+
+    def process_pairs(self, pairs: Iterator[tuple[int, str]]) -> int:
+        """Feed all pairs code+data into the state machine, return number of pairs."""
+        lines = 0
+        state = None
+        function = DxfImporter.process_nothing
+        for code, data in pairs:
+            # hashing of enum values is slow, so the state function is looked up
+            # only when the state changes
+            if self.state is not state:
+                state = self.state
+                function = self.state_switcher.get(state, DxfImporter.process_nothing)
+            function(self, code, data)
+            lines += 1
+        return lines
+
+    def monitored(
+        self, pairs: Iterator[tuple[int, str]], position: Callable[[], int], total: int
+    ) -> Iterator[tuple[int, str]]:
+        """Report the import progress when it is requested, the pairs are not changed."""
+        if self.progress is None:
+            return pairs
+        return self.progress.monitor(pairs, position, total)
+
+    def process_nothing(self, code: int, data: str) -> None:
+        """Part of the DXF import state machine for states without any processing."""
+
+    def import_text(self, fin: BufferedReader) -> int:
+        """Import the DXF file using text tokenizer."""
+        self.detect_encoding(fin)
+        total = os.fstat(fin.fileno()).st_size
+        return self.process_pairs(self.monitored(self.dxf_entry(fin), fin.tell, total))
+
+    def import_mmap(self, fin: BufferedReader) -> int:
+        """Import the DXF file using tokenizer working with memory-mapped file."""
+        # empty file can't be memory-mapped
+        if os.fstat(fin.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            self.decoder.detect(buffer[: DxfDecoder.PREFIX_SIZE])
+            return self.import_mmap_range(buffer, 0)
+
+    def import_mmap_range(self, buffer: mmap.mmap, start: int, end: Optional[int] = None) -> int:
+        """Import part of memory-mapped file, unneeded sections are skipped."""
+        tokenizer = DxfMmapTokenizer(
+            buffer, self.decoder, start, end, DxfImporter.SKIPPED_SECTIONS
+        )
+        pairs = self.monitored(tokenizer.pairs(), lambda: tokenizer.position, len(buffer))
+        lines = self.process_pairs(pairs)
+        self.skipped_pairs += tokenizer.skipped_pairs
+        return lines
+
+    def import_binary(self, fin: BufferedReader) -> int:
+        """Import the binary DXF file, values are decoded directly from bytes."""
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            self.decoder.detect(buffer[: DxfDecoder.PREFIX_SIZE], binary=True)
+            tokenizer = DxfBinaryTokenizer(buffer, self.decoder)
+            pairs = self.monitored(tokenizer.pairs(), lambda: tokenizer.position, len(buffer))
+            return self.process_pairs(pairs)
+
+    def import_entities_range(self, buffer: mmap.mmap, start: int, end: int) -> int:
+        """Import entities from part of ENTITIES section that starts on entity boundary."""
+        self.state = DxfReaderState.SECTION_ENTITIES
+        tokenizer = DxfMmapTokenizer(buffer, self.decoder, start, end)
+        lines = self.process_pairs(tokenizer.pairs())
+        # the last entity is not followed by next entity or by ENDSEC
+        if self.state == DxfReaderState.ENTITY:
+            self.finish_entity()
+            self.state = DxfReaderState.SECTION_ENTITIES
+        return lines
+
+    def import_parallel(self, fin: BufferedReader) -> int:
+        """Import the DXF file, ENTITIES section is parsed by pool of worker processes."""
+        # empty file can't be memory-mapped
+        if os.fstat(fin.fileno()).st_size == 0:
+            return 0
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            self.decoder.detect(buffer[: DxfDecoder.PREFIX_SIZE])
+            section = DxfMmapTokenizer.find_section(buffer, "ENTITIES")
+            if section is None or section[1] - section[0] < DxfImporter.PARALLEL_MIN_SIZE:
+                return self.import_mmap_range(buffer, 0)
+
+            start, end = section
+            chunks = DxfMmapTokenizer.split_section(buffer, start, end, self.workers)
+
+            # everything before the ENTITIES section body
+            lines = self.import_mmap_range(buffer, 0, start)
+
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                if self.progress is not None:
+                    # the whole file prefix has been read at this moment
+                    self.progress.report(start, len(buffer))
+                futures = [
+                    executor.submit(
+                        import_entities_chunk,
+                        self.filename,
+                        chunk_start,
+                        chunk_end,
+                        self.decoder.encoding,
+                        self.import_filter,
+                        self.columnar,
+                    )
+                    for chunk_start, chunk_end in chunks
+                ]
+                # results are merged in the file order
+                for future, (_, chunk_end) in zip(futures, chunks):
+                    entities, statistic, chunk_lines = future.result()
+                    self.entities.extend(entities)
+                    for entity_type, count in statistic.items():
+                        self.statistic[entity_type] += count
+                    lines += chunk_lines
+                    if self.progress is not None:
+                        try:
+                            self.progress.report(chunk_end, len(buffer))
+                        except ImportCancelledError:
+                            executor.shutdown(cancel_futures=True)
+                            raise
+
+            # ENDSEC of ENTITIES section and everything after it
+            self.state = DxfReaderState.SECTION_ENTITIES
+            lines += self.import_mmap_range(buffer, end)
+            return lines
 
     def import_dxf(self) -> Drawing:
         """Import the DXF file and return structure containing all entities."""
         self.init_import()
 
-        encoding = self.detect_encoding()
-
-        with open(self.filename, encoding=encoding) as fin:
-            lines = 0
-            for code, data in self.dxf_entry(fin):
-                function = self.state_switcher.get(
-                    self.state, lambda self, code, data: "nothing"
-                )
-                function(self, code, data)
-                lines += 1
+        # the file is read just once, encoding is detected from its prefix
+        with open(self.filename, "rb", buffering=DxfDecoder.PREFIX_SIZE) as fin:
+            binary = DxfBinaryTokenizer.is_binary(fin.peek(len(DxfBinaryTokenizer.SENTINEL)))
+            if binary:
+                lines = self.import_binary(fin)
+            elif self.workers > 1:
+                lines = self.import_parallel(fin)
+            elif self.tokenizer == DxfTokenizerType.MMAP:
+                lines = self.import_mmap(fin)
+            else:
+                lines = self.import_text(fin)
         # print(lines)
         # print(self.statistic)
-        return Drawing(self.entities, self.statistic, lines)
+        metadata = {
+            "encoding": self.decoder.encoding,
+            "encoding_strategy": self.decoder.strategy.name,
+            "format": "binary" if binary else "ascii",
+            **self.header_metadata(),
+        }
+        self.resolve_blocks()
+        drawing = Drawing(self.entities, self.statistic, lines + self.skipped_pairs, metadata)
+        drawing.blocks = self.blocks
+        drawing.bounds = self.header_bounds()
+        return drawing
+
+    def header_value(self, variable: str, code: int) -> Optional[str]:
+        """Return value of header variable as string."""
+        value = self.header.get(variable, {}).get(code)
+        return None if value is None else str(value).strip()
+
+    def header_point(self, variable: str) -> Optional[tuple[float, float]]:
+        """Return 2D point stored in header variable."""
+        try:
+            x = float(self.header[variable][DxfCodes.X1])
+            y = float(self.header[variable][DxfCodes.Y1])
+        except (KeyError, ValueError):
+            return None
+        if not (math.isfinite(x) and math.isfinite(y)):
+            return None
+        return x, y
+
+    def header_metadata(self) -> dict[str, str]:
+        """Convert useful header variables into drawing metadata."""
+        metadata = {}
+        version = self.header_value("$ACADVER", DxfCodes.PRIMARY_TEXT)
+        if version is not None:
+            metadata["version"] = version
+        codepage = self.header_value("$DWGCODEPAGE", DxfCodes.TEXT2)
+        if codepage is not None:
+            metadata["codepage"] = codepage
+        units = self.header_value("$INSUNITS", DxfCodes.FLAGS)
+        if units is not None:
+            metadata["units"] = DxfImporter.UNITS.get(units, units)
+        for variable, key in (("$EXTMIN", "extmin"), ("$EXTMAX", "extmax")):
+            point = self.header_point(variable)
+            if point is not None:
+                metadata[key] = f"{point[0]} {point[1]}"
+        return metadata
+
+    def header_bounds(self) -> Optional[Bounds]:
+        """Return drawing extents from header when they are trustworthy."""
+        # extents are computed for the whole drawing, not for filtered entities
+        if self.import_filter is not None or not self.entities:
+            return None
+        extmin = self.header_point("$EXTMIN")
+        extmax = self.header_point("$EXTMAX")
+        if extmin is None or extmax is None:
+            return None
+        xmin, ymin = extmin
+        xmax, ymax = extmax
+        # empty drawings have extents set to +1e20 and -1e20
+        limit = DxfImporter.EXTENTS_LIMIT
+        if max(abs(xmin), abs(ymin), abs(xmax), abs(ymax)) >= limit:
+            return None
+        if xmin >= xmax or ymin >= ymax:
+            return None
+        # y coordinates are flipped
+        bounds = Bounds(xmin, -ymax, xmax, -ymin)
+
+        # extents are not updated by all CAD programs, so they are checked by sample of entities
+        tolerance = DxfImporter.EXTENTS_TOLERANCE * max(xmax - xmin, ymax - ymin)
+        step = max(1, len(self.entities) // DxfImporter.EXTENTS_SAMPLE_SIZE)
+        for entity in self.entities[::step]:
+            entity_bounds = entity.get_bounds()
+            if (
+                entity_bounds.xmin < bounds.xmin - tolerance
+                or entity_bounds.ymin < bounds.ymin - tolerance
+                or entity_bounds.xmax > bounds.xmax + tolerance
+                or entity_bounds.ymax > bounds.ymax + tolerance
+            ):
+                print("drawing extents from header are not valid")
+                return None
+        print(f"drawing extents from header: {bounds}")
+        return bounds
+
+    def resolve_blocks(self) -> None:
+        """Assign block definitions to all inserts, including inserts in blocks."""
+        for entities in [self.entities, *(block.entities for block in self.blocks.values())]:
+            for entity in entities:
+                if isinstance(entity, Insert):
+                    entity.block = self.blocks.get(entity.block_name)
+                    if entity.block is None:
+                        print(f"unknown block '{entity.block_name}'")
+
+    def scan_layers(self) -> dict[str, int]:
+        """Quickly count supported entities in all layers without importing them."""
+        layers: dict[str, int] = {}
+        with open(self.filename, "rb") as fin:
+            # empty file can't be memory-mapped
+            if os.fstat(fin.fileno()).st_size == 0:
+                return layers
+            with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+                decoder = DxfDecoder()
+                if DxfBinaryTokenizer.is_binary(buffer[: len(DxfBinaryTokenizer.SENTINEL)]):
+                    # binary file can't be searched by patterns, but it is fast to read anyway
+                    decoder.detect(buffer[: DxfDecoder.PREFIX_SIZE], binary=True)
+                    pairs = DxfBinaryTokenizer(buffer, decoder).section_pairs("ENTITIES")
+                else:
+                    decoder.detect(buffer[: DxfDecoder.PREFIX_SIZE])
+                    start, end = DxfMmapTokenizer.find_section(buffer, "ENTITIES") or (0, None)
+                    pairs = DxfMmapTokenizer(buffer, decoder, start, end).pairs()
+                supported = False
+                for code, data in pairs:
+                    if code == DxfCodes.TEXT_STRING:
+                        supported = data in DxfImporter.ENTITY_TYPES
+                    elif code == DxfCodes.LAYER_NAME and supported:
+                        layer = data.replace(" ", "_")
+                        layers[layer] = layers.get(layer, 0) + 1
+                        supported = False
+        return dict(sorted(layers.items()))
 
     def process_beginning(self, code: int, data: str) -> None:
         """Part of the DXF import state machine."""
@@ -136,6 +433,7 @@ class DxfImporter:
             print("    section header")
         elif data == "TABLES":
             self.state = DxfReaderState.SECTION_TABLES
+            self.skip_requested = True
             print("    section tables")
         elif data == "BLOCKS":
             self.state = DxfReaderState.SECTION_BLOCKS
@@ -145,9 +443,11 @@ class DxfImporter:
             print("    section entities")
         elif data == "OBJECTS":
             self.state = DxfReaderState.SECTION_OBJECTS
+            self.skip_requested = True
             print("    section objects")
         elif data == "CLASSES":
             self.state = DxfReaderState.SECTION_CLASSES
+            self.skip_requested = True
             print("    section classes")
         else:
             raise Exception(
@@ -169,6 +469,11 @@ class DxfImporter:
             if data == "ENDSEC":
                 self.state = DxfReaderState.BEGINNING
                 print("    end section header")
+        elif code == DxfCodes.VARIABLE_NAME:
+            # just few variables are needed
+            self.header_variable = data if data in DxfImporter.HEADER_VARIABLES else None
+        elif self.header_variable is not None:
+            self.header.setdefault(self.header_variable, {})[code] = data
 
     def process_section_tables(self, code: int, data: str) -> None:
         """Part of the DXF import state machine."""
@@ -182,6 +487,8 @@ class DxfImporter:
         if code == DxfCodes.TEXT_STRING:
             if data == "BLOCK":
                 self.state = DxfReaderState.SECTION_BLOCK
+                self.block = Block()
+                self.container = self.block.entities
                 # print("    block")
             elif data == "ENDSEC":
                 self.state = DxfReaderState.BEGINNING
@@ -190,44 +497,64 @@ class DxfImporter:
     def process_section_block(self, code: int, data: str) -> None:
         """Part of the DXF import state machine."""
         if code == DxfCodes.TEXT_STRING:
-            if data == "ENDBLK":
-                # print("        end block")
-                self.state = DxfReaderState.SECTION_BLOCKS
+            self.start_entity(data)
         elif code == DxfCodes.NAME:
             self.state = DxfReaderState.SECTION_BLOCK
-            self.blockName = data
-            # print("        begin block '{b}'".format(b=self.blockName))
+            self.block.name = data
+            # print("        begin block '{b}'".format(b=self.block.name))
+        elif code == DxfCodes.X1:
+            self.block.base_x = float(data)
+        elif code == DxfCodes.Y1:
+            self.block.base_y = -float(data)
 
-    def process_section_entities_entity_type(self, code: int, data: str) -> None:
+    def process_section_block_entity(self, code: int, data: str) -> None:
+        """Part of the DXF import state machine, unsupported entity in block is skipped."""
+        if code == DxfCodes.TEXT_STRING:
+            self.start_entity(data)
+
+    def finish_block(self) -> None:
+        """Store the block definition that has been read completely."""
+        block = self.block
+        block.move_to_base_point()
+        if block.name is not None:
+            self.blocks[block.name] = block
+        self.block = None
+        self.container = self.entities
+
+    def start_entity(self, data: str) -> None:
         """Change the state according to entity type code read from DXF."""
-        self.polyline_points_x : list[float] = []
-        self.polyline_points_y : list[float] = []
-        if data == "LINE":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.LINE
-        elif data == "CIRCLE":
+        # entity types rejected by import filter are skipped as unsupported ones
+        entity_type = self.entity_types.get(data)
+        if entity_type is not None:
             self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.CIRCLE
-        elif data == "ARC":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.ARC
-        elif data == "LWPOLYLINE":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.POLYLINE
-        elif data == "MTEXT" or data == "TEXT":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.TEXT
+            self.entity = DxfEntityRecord(entity_type)
+            self.entity_handlers = DxfImporter.ENTITY_HANDLERS[entity_type]
+        elif self.block is not None:
+            if data == "ENDBLK":
+                # print("        end block")
+                self.finish_block()
+                self.state = DxfReaderState.SECTION_BLOCKS
+            else:
+                # unsupported entity in block, all its attributes will be skipped
+                self.state = DxfReaderState.SECTION_BLOCK_ENTITY
+        elif data == "ENDSEC":
+            self.state = DxfReaderState.BEGINNING
+            print("    end entities")
+        else:
+            # unsupported entity, all its attributes will be skipped
+            self.state = DxfReaderState.SECTION_ENTITIES
 
     def process_section_entities(self, code: int, data: str) -> None:
         """Part of the DXF import state machine."""
         if code == DxfCodes.TEXT_STRING:
-            self.process_section_entities_entity_type(code, data)
+            self.start_entity(data)
 
     def process_section_objects(self, code: int, data: str) -> None:
         """Part of the DXF import state machine."""
         if code == DxfCodes.TEXT_STRING:
             if data == "ENDSEC":
                 print("    end section objects")
+                self.state = DxfReaderState.BEGINNING
 
     def process_section_classes(self, code, data) -> None:
         """Part of the DXF import state machine."""
@@ -238,127 +565,205 @@ class DxfImporter:
 
     def process_entity_type_attribute(self, code: int, data: str) -> None:
         """Store the previously read entity and try to process next one."""
-        self.statistic[self.entityType] += 1
-        self.store_entity()
-        self.state = DxfReaderState.SECTION_ENTITIES
-        self.entityType = DrawingEntityType.UNKNOWN
-        self.layer : Optional[str] = None
-        self.color : Optional[int] = None
-        self.polyline_points_x = []
-        self.polyline_points_y = []
-        self.mirror = 1
-        if data == "LINE":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.LINE
-        elif data == "CIRCLE":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.CIRCLE
-        elif data == "ARC":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.ARC
-        elif data == "LWPOLYLINE":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.POLYLINE
-        elif data == "MTEXT" or data == "TEXT":
-            self.state = DxfReaderState.ENTITY
-            self.entityType = DrawingEntityType.TEXT
-        elif data == "ENDSEC":
-            self.state = DxfReaderState.BEGINNING
-            self.entityType = DrawingEntityType.UNKNOWN
-            print("    end entities")
+        self.finish_entity()
+        self.start_entity(data)
 
     def process_entity(self, code: int, data: str) -> None:
         """Part of the DXF import state machine."""
-        if code == DxfCodes.LAYER_NAME:
-            self.layer = data.replace(" ", "_")
-        elif code == DxfCodes.X1:
-            self.x1 = float(data)
-            if self.entityType == DrawingEntityType.POLYLINE:
-                self.polyline_points_x.append(self.x1)
-        elif code == DxfCodes.Y1:
-            self.y1 = float(data)
-            if self.entityType == DrawingEntityType.POLYLINE:
-                self.polyline_points_y.append(self.y1)
-        elif code == DxfCodes.X2:
-            self.x2 = float(data)
-        elif code == DxfCodes.Y2:
-            self.y2 = float(data)
-        elif code == DxfCodes.RADIUS:
-            self.radius = float(data)
-        elif code == DxfCodes.ANGLE1:
-            self.angle1 = float(data)
-        elif code == DxfCodes.ANGLE2:
-            self.angle2 = float(data)
-        elif code == DxfCodes.COLOR:
-            self.color = int(data)
-        elif code == DxfCodes.PRIMARY_TEXT:
-            self.text = data
-        elif code == DxfCodes.MIRROR:
-            self.mirror = int(float(data))
-        elif code == DxfCodes.TEXT_STRING:
+        if code == DxfCodes.TEXT_STRING:
             self.process_entity_type_attribute(code, data)
-
-    def store_entity(self) -> None:
-        """Store entity read from DXF file."""
-        if self.entityType == DrawingEntityType.LINE:
-            self.store_line()
-        elif self.entityType == DrawingEntityType.CIRCLE:
-            self.store_circle()
-        elif self.entityType == DrawingEntityType.ARC:
-            self.store_arc()
-        elif self.entityType == DrawingEntityType.POLYLINE:
-            self.store_polyline()
-        elif self.entityType == DrawingEntityType.TEXT:
-            self.store_text()
         else:
-            print("unknown entity?")
-
-    def store_line(self) -> None:
+            handler = self.entity_handlers.get(code)
+            if handler is not None:
+                handler(self.entity, data)
+
+    def finish_entity(self) -> None:
+        """Store the entity that has been read completely."""
+        entity = self.entity
+        self.entity = None
+        # entities in block definitions inherit layer from inserts
+        if self.block is not None:
+            DxfImporter.STORE_FUNCTIONS[entity.entity_type](self, entity)
+            return
+        # layer is known at the end of entity, but still before the entity object is created
+        if self.accepts_layer is not None and not self.accepts_layer(entity.layer):
+            return
+        self.statistic[entity.entity_type] += 1
+        DxfImporter.STORE_FUNCTIONS[entity.entity_type](self, entity)
+
+    def store_line(self, entity: DxfEntityRecord) -> None:
         """Store line read from DXF file."""
-        self.entities.append(
-            Line(self.x1, -self.y1, self.x2, -self.y2, self.color, self.layer)
+        self.container.append(
+            Line(entity.x1, -entity.y1, entity.x2, -entity.y2, entity.color, entity.layer)
         )
 
-    def store_polyline(self) -> None:
+    def store_polyline(self, entity: DxfEntityRecord) -> None:
         """Store polyline read from DXF file."""
-        for i in range(len(self.polyline_points_y)):
-            self.polyline_points_y[i] = -self.polyline_points_y[i]
-        self.entities.append(
-            Polyline(
-                self.polyline_points_x, self.polyline_points_y, self.color, self.layer
-            )
+        points_y = [-y for y in entity.points_y]
+        self.container.append(
+            Polyline(entity.points_x, points_y, entity.color, entity.layer)
         )
-        self.polyline_points_x = []
-        self.polyline_points_y = []
 
-    def store_circle(self) -> None:
+    def store_circle(self, entity: DxfEntityRecord) -> None:
         """Store circle read from DXF file."""
-        if self.mirror == -1:
+        if entity.mirror == -1:
             print("MIRROR")
-            self.x1 = -self.x1
-        self.entities.append(
-            Circle(self.x1, -self.y1, self.radius, self.color, self.layer)
+            entity.x1 = -entity.x1
+        self.container.append(
+            Circle(entity.x1, -entity.y1, entity.radius, entity.color, entity.layer)
         )
 
-    def store_arc(self) -> None:
+    def store_arc(self, entity: DxfEntityRecord) -> None:
         """Store arc read from DXF file."""
-        self.entities.append(
+        self.container.append(
             Arc(
-                self.x1,
-                -self.y1,
-                self.radius,
-                self.angle1,
-                self.angle2,
-                self.color,
-                self.layer,
+                entity.x1,
+                -entity.y1,
+                entity.radius,
+                entity.angle1,
+                entity.angle2,
+                entity.color,
+                entity.layer,
             )
         )
 
-    def store_text(self) -> None:
+    def store_text(self, entity: DxfEntityRecord) -> None:
         """Store text read from DXF file."""
-        if self.text:
-            self.text = self.text.replace("\\U+00B2", "\u00B2")
-        self.entities.append(Text(self.x1, -self.y1, self.text, self.color, self.layer))
+        text = entity.text.replace("\\U+00B2", "\u00B2")
+        self.container.append(Text(entity.x1, -entity.y1, text, entity.color, entity.layer))
+
+    def store_insert(self, entity: DxfEntityRecord) -> None:
+        """Store reference to block read from DXF file."""
+        # the rotation is clockwise due to flipped y axis
+        angle = math.radians(entity.angle1)
+        cos = math.cos(angle)
+        sin = math.sin(angle)
+        transform = AffineTransform(
+            entity.xscale * cos,
+            -entity.xscale * sin,
+            entity.yscale * sin,
+            entity.yscale * cos,
+            entity.x1,
+            -entity.y1,
+        )
+        self.container.append(Insert(entity.name, transform, entity.color, entity.layer))
+
+    # sections that are not needed at all, they are skipped by fast forward scan
+    SKIPPED_SECTIONS = frozenset(("TABLES", "OBJECTS", "CLASSES"))
+
+    # header variables stored in drawing metadata
+    HEADER_VARIABLES = frozenset(("$ACADVER", "$DWGCODEPAGE", "$INSUNITS", "$EXTMIN", "$EXTMAX"))
+
+    # names of units used by $INSUNITS header variable
+    UNITS = {
+        "0": "unitless",
+        "1": "in",
+        "2": "ft",
+        "4": "mm",
+        "5": "cm",
+        "6": "m",
+        "7": "km",
+    }
+
+    # extents with larger coordinates are not valid
+    EXTENTS_LIMIT = 1e19
+
+    # number of entities checked against extents read from header
+    EXTENTS_SAMPLE_SIZE = 64
+
+    # entities can be outside extents by this fraction of drawing size
+    EXTENTS_TOLERANCE = 0.01
+
+    # entity names used in DXF files
+    ENTITY_TYPES = {
+        "LINE": DrawingEntityType.LINE,
+        "CIRCLE": DrawingEntityType.CIRCLE,
+        "ARC": DrawingEntityType.ARC,
+        "LWPOLYLINE": DrawingEntityType.POLYLINE,
+        "MTEXT": DrawingEntityType.TEXT,
+        "TEXT": DrawingEntityType.TEXT,
+        "INSERT": DrawingEntityType.INSERT,
+    }
+
+    # precompiled dispatch tables: entity type -> group code -> handler
+    COMMON_HANDLERS = {
+        DxfCodes.LAYER_NAME: DxfEntityRecord.set_layer,
+        DxfCodes.COLOR: DxfEntityRecord.set_color,
+    }
+
+    ENTITY_HANDLERS = {
+        DrawingEntityType.LINE: {
+            **COMMON_HANDLERS,
+            DxfCodes.X1: DxfEntityRecord.set_x1,
+            DxfCodes.Y1: DxfEntityRecord.set_y1,
+            DxfCodes.X2: DxfEntityRecord.set_x2,
+            DxfCodes.Y2: DxfEntityRecord.set_y2,
+        },
+        DrawingEntityType.CIRCLE: {
+            **COMMON_HANDLERS,
+            DxfCodes.X1: DxfEntityRecord.set_x1,
+            DxfCodes.Y1: DxfEntityRecord.set_y1,
+            DxfCodes.RADIUS: DxfEntityRecord.set_radius,
+            DxfCodes.MIRROR: DxfEntityRecord.set_mirror,
+        },
+        DrawingEntityType.ARC: {
+            **COMMON_HANDLERS,
+            DxfCodes.X1: DxfEntityRecord.set_x1,
+            DxfCodes.Y1: DxfEntityRecord.set_y1,
+            DxfCodes.RADIUS: DxfEntityRecord.set_radius,
+            DxfCodes.ANGLE1: DxfEntityRecord.set_angle1,
+            DxfCodes.ANGLE2: DxfEntityRecord.set_angle2,
+        },
+        DrawingEntityType.POLYLINE: {
+            **COMMON_HANDLERS,
+            DxfCodes.X1: DxfEntityRecord.add_point_x,
+            DxfCodes.Y1: DxfEntityRecord.add_point_y,
+        },
+        DrawingEntityType.TEXT: {
+            **COMMON_HANDLERS,
+            DxfCodes.X1: DxfEntityRecord.set_x1,
+            DxfCodes.Y1: DxfEntityRecord.set_y1,
+            DxfCodes.PRIMARY_TEXT: DxfEntityRecord.set_text,
+        },
+        DrawingEntityType.INSERT: {
+            **COMMON_HANDLERS,
+            DxfCodes.NAME: DxfEntityRecord.set_name,
+            DxfCodes.X1: DxfEntityRecord.set_x1,
+            DxfCodes.Y1: DxfEntityRecord.set_y1,
+            DxfCodes.XSCALE: DxfEntityRecord.set_xscale,
+            DxfCodes.YSCALE: DxfEntityRecord.set_yscale,
+            DxfCodes.ANGLE1: DxfEntityRecord.set_angle1,
+        },
+    }
+
+    STORE_FUNCTIONS = {
+        DrawingEntityType.LINE: store_line,
+        DrawingEntityType.CIRCLE: store_circle,
+        DrawingEntityType.ARC: store_arc,
+        DrawingEntityType.POLYLINE: store_polyline,
+        DrawingEntityType.TEXT: store_text,
+        DrawingEntityType.INSERT: store_insert,
+    }
+
+
+def import_entities_chunk(
+    filename: str,
+    start: int,
+    end: int,
+    encoding: str,
+    import_filter: Optional[DxfImportFilter] = None,
+    columnar: bool = False,
+) -> tuple[list | ColumnarEntities, dict[DrawingEntityType, int], int]:
+    """Import entities from part of ENTITIES section, this function is run by worker process."""
+    importer = DxfImporter(
+        filename, DxfTokenizerType.MMAP, import_filter=import_filter, columnar=columnar
+    )
+    importer.init_import()
+    importer.decoder.encoding = encoding
+    with open(filename, "rb") as fin:
+        with mmap.mmap(fin.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            lines = importer.import_entities_range(buffer, start, end)
+    return importer.entities, importer.statistic, lines
 
 
 if __name__ == "__main__":
@@ -0,0 +1,195 @@
+"""Tokenizer that reads pairs code+data from memory-mapped DXF file."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import mmap
+import re
+from collections.abc import Iterator
+from typing import Optional
+
+from importers.dxf_codes import DxfCodes
+from importers.dxf_decoder import DxfDecoder
+
+
+class DxfMmapTokenizer:
+    """Tokenizer that reads pairs code+data from memory-mapped DXF file."""
+
+    # number of bytes split into lines at once
+    BLOCK_SIZE = 1024 * 1024
+
+    # only data for these codes are decoded, the state machine ignores all others
+    DECODED_CODES = frozenset(
+        (
+            DxfCodes.TEXT_STRING,
+            DxfCodes.PRIMARY_TEXT,
+            DxfCodes.NAME,
+            DxfCodes.TEXT2,
+            DxfCodes.LAYER_NAME,
+            DxfCodes.VARIABLE_NAME,
+            DxfCodes.X1,
+            DxfCodes.Y1,
+            DxfCodes.X2,
+            DxfCodes.Y2,
+            DxfCodes.RADIUS,
+            DxfCodes.XSCALE,
+            DxfCodes.YSCALE,
+            DxfCodes.ANGLE1,
+            DxfCodes.ANGLE2,
+            DxfCodes.COLOR,
+            DxfCodes.FLAGS,
+            DxfCodes.MIRROR,
+            DxfCodes.COMMENT,
+        )
+    )
+
+    # code 0 followed by entity type, section name etc. (value can't be a number)
+    ENTITY_BOUNDARY_PATTERN = re.compile(rb"\n[ \t]*0[ \t]*\r?\n(?=[A-Za-z_])")
+
+    ENDSEC_PATTERN = re.compile(rb"\n[ \t]*0[ \t]*\r?\nENDSEC[ \t]*\r?\n")
+
+    # beginning of section with its name, the pattern starts with literal to be fast,
+    # so the line with code 0 needs to be checked separately
+    SECTION_PATTERN = re.compile(rb"\nSECTION[ \t]*\r?\n[ \t]*2[ \t]*\r?\n([^\r\n]*)")
+
+    def __init__(
+        self,
+        buffer: mmap.mmap,
+        decoder: DxfDecoder,
+        start: int = 0,
+        end: Optional[int] = None,
+        skipped_sections: frozenset[str] = frozenset(),
+    ) -> None:
+        """Initialize the tokenizer for given part of memory-mapped file."""
+        self.buffer = buffer
+        self.decoder = decoder
+        self.start = start
+        self.end = len(buffer) if end is None else end
+        # position of the first byte that was not tokenized yet
+        self.position = start
+        # sections with these names are not tokenized at all
+        self.skipped_sections = frozenset(name.encode() for name in skipped_sections)
+        self.skipped_pairs = 0
+
+    def skipped_spans(self) -> list[tuple[int, int]]:
+        """Find all skipped sections, return offsets of their first and last byte + 1."""
+        buffer = self.buffer
+        spans: list[tuple[int, int]] = []
+        position = self.start
+        while True:
+            # match objects refer to the buffer, so they must not outlive this method
+            match = DxfMmapTokenizer.SECTION_PATTERN.search(buffer, position, self.end)
+            if match is None:
+                return spans
+            position = match.end(1)
+            if match.group(1).strip() not in self.skipped_sections:
+                continue
+            start = buffer.rfind(b"\n", 0, match.start()) + 1
+            if buffer[start : match.start()].strip() != b"0":
+                continue
+            match = DxfMmapTokenizer.ENDSEC_PATTERN.search(buffer, position, self.end)
+            if match is None:
+                return spans
+            position = match.end()
+            spans.append((start, position))
+
+    def ranges(self) -> Iterator[tuple[int, int]]:
+        """Generate parts of the buffer that need to be tokenized, skipped sections are left out."""
+        position = self.start
+        if self.skipped_sections:
+            for start, end in self.skipped_spans():
+                yield position, start
+                # number of lines is needed for the statistic anyway
+                self.skipped_pairs += self.buffer[start:end].count(b"\n") // 2
+                position = end
+        yield position, self.end
+
+    def lines(self) -> Iterator[bytes]:
+        """Generate raw lines, the buffer is split into lines by larger blocks."""
+        for start, end in self.ranges():
+            yield from self.range_lines(start, end)
+
+    def range_lines(self, start: int, end: int) -> Iterator[bytes]:
+        """Generate raw lines from given part of buffer."""
+        buffer = self.buffer
+        position = start
+        while position < end:
+            block_end = min(position + DxfMmapTokenizer.BLOCK_SIZE, end)
+            if block_end < end:
+                # the block needs to end on line boundary
+                newline = buffer.rfind(b"\n", position, block_end)
+                if newline == -1:
+                    newline = buffer.find(b"\n", block_end, end)
+                    if newline == -1:
+                        newline = end - 1
+                block_end = newline + 1
+            lines = buffer[position:block_end].split(b"\n")
+            # the last item is an empty string after the trailing newline
+            if lines[-1] == b"":
+                lines.pop()
+            position = block_end
+            self.position = position
+            yield from lines
+
+    def pairs(self) -> Iterator[tuple[int, str]]:
+        """Generate pair dxf_code + dxf_data for each iteration."""
+        decode = self.decoder.decode
+        decoded_codes = DxfMmapTokenizer.DECODED_CODES
+        # group codes are repeated a lot, so it is cheaper to cache them
+        codes: dict[bytes, int] = {}
+        lines = self.lines()
+        for line1, line2 in zip(lines, lines):
+            code = codes.get(line1)
+            if code is None:
+                code = int(line1)
+                codes[line1] = code
+            if code in decoded_codes:
+                yield code, decode(line2).strip()
+            else:
+                yield code, ""
+
+    @staticmethod
+    def find_section(buffer: mmap.mmap, name: str) -> Optional[tuple[int, int]]:
+        """Find the body of given section, return offsets of its first and ENDSEC line."""
+        pattern = re.compile(
+            rb"(?:^|\n)[ \t]*2[ \t]*\r?\n" + re.escape(name.encode()) + rb"[ \t]*\r?\n"
+        )
+        match = pattern.search(buffer)
+        if match is None:
+            return None
+        start = match.end()
+        match = DxfMmapTokenizer.ENDSEC_PATTERN.search(buffer, start - 1)
+        if match is None:
+            return None
+        return start, match.start() + 1
+
+    @staticmethod
+    def find_entity_boundary(buffer: mmap.mmap, start: int, end: int) -> int:
+        """Find the first line with code 0 starting at or after the given offset."""
+        match = DxfMmapTokenizer.ENTITY_BOUNDARY_PATTERN.search(buffer, start - 1, end)
+        if match is None:
+            return end
+        return match.start() + 1
+
+    @staticmethod
+    def split_section(
+        buffer: mmap.mmap, start: int, end: int, parts: int
+    ) -> list[tuple[int, int]]:
+        """Split the section body into parts of similar size on entity boundaries."""
+        offsets = [start]
+        for part in range(1, parts):
+            offset = start + (end - start) * part // parts
+            boundary = DxfMmapTokenizer.find_entity_boundary(buffer, offset, end)
+            if offsets[-1] < boundary < end:
+                offsets.append(boundary)
+        offsets.append(end)
+        return list(zip(offsets[:-1], offsets[1:]))
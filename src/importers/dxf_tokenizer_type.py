@@ -0,0 +1,22 @@
+"""Tokenizers that can be used to read pairs code+data from DXF files."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from enum import Enum
+
+
+class DxfTokenizerType(Enum):
+    """Tokenizers that can be used to read pairs code+data from DXF files."""
+
+    TEXT = (1,)
+    MMAP = 2
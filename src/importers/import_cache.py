@@ -0,0 +1,153 @@
+"""On-disk cache of imported drawings keyed by the content of drawing files."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from typing import Optional
+
+from drawing import Drawing
+
+
+class ImportCache:
+    """On-disk cache of imported drawings keyed by the content of drawing files.
+
+    Snapshots are evicted in LRU order when the cache is larger than its size cap,
+    the modification time of snapshot file is used as the time of last access.
+    """
+
+    # needs to be changed when importers produce different drawings for the same input
+    # or when pickled classes of snapshot are changed
+    # 3: ColumnarEntities storage
+    # 4: entities with slots
+    # 5: rooms stored in RoomStore
+    IMPORTER_VERSION = 5
+
+    SNAPSHOT_SUFFIX = ".snapshot"
+
+    # files are hashed by blocks of this size
+    HASH_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(self, directory: str, max_size: int) -> None:
+        """Initialize the cache stored in given directory with size cap in bytes."""
+        self.directory = Path(directory).expanduser()
+        self.max_size = max_size
+
+    @staticmethod
+    def key(filename: str, importer: str, options: str = "") -> str:
+        """Compute the cache key from the file content, importer name, version, and options.
+
+        Options describe everything else that changes the imported drawing, e.g. storage
+        of entities or import filter.
+        """
+        digest = hashlib.sha256(
+            f"{importer}:{ImportCache.IMPORTER_VERSION}:{options}:".encode()
+        )
+        with open(filename, "rb") as fin:
+            while block := fin.read(ImportCache.HASH_BLOCK_SIZE):
+                digest.update(block)
+        return digest.hexdigest()
+
+    def path(self, key: str) -> Path:
+        """Return path to the snapshot file for given key."""
+        return self.directory / (key + ImportCache.SNAPSHOT_SUFFIX)
+
+    def load(self, key: str) -> Optional[Drawing]:
+        """Load the drawing snapshot, return None when it is not cached."""
+        path = self.path(key)
+        try:
+            with open(path, "rb") as fin:
+                snapshot = pickle.load(fin)
+        except FileNotFoundError:
+            return None
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError) as e:
+            print(f"broken snapshot {path.name}: {e}")
+            path.unlink(missing_ok=True)
+            return None
+        # mark the snapshot as recently used
+        os.utime(path)
+        drawing = Drawing(
+            snapshot["entities"],
+            snapshot["statistic"],
+            snapshot["lines"],
+            snapshot["metadata"],
+        )
+        drawing.blocks = snapshot["blocks"]
+        drawing.bounds = snapshot["bounds"]
+        drawing.rooms = snapshot["rooms"]
+        drawing.drawing_id = snapshot["drawing_id"]
+        drawing.room_counter = snapshot["room_counter"]
+        return drawing
+
+    def store(self, key: str, drawing: Drawing) -> None:
+        """Store snapshot of imported drawing, the drawing must not be rescaled yet."""
+        snapshot = {
+            "entities": drawing.entities,
+            "statistic": drawing.statistic,
+            "lines": drawing.lines,
+            "metadata": drawing.metadata,
+            "blocks": drawing.blocks,
+            "bounds": drawing.bounds,
+            "rooms": drawing.rooms,
+            "drawing_id": drawing.drawing_id,
+            "room_counter": drawing.room_counter,
+        }
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # the snapshot is written into temporary file first, so other
+        # processes never see incomplete snapshot
+        fd, temporary = tempfile.mkstemp(dir=self.directory)
+        try:
+            with os.fdopen(fd, "wb") as fout:
+                pickle.dump(snapshot, fout, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporary, self.path(key))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+        self.evict()
+
+    def entries(self) -> list[tuple[str, int, float]]:
+        """Return key, size, and time of last access for all snapshots, oldest first."""
+        if not self.directory.is_dir():
+            return []
+        entries = []
+        for path in self.directory.glob("*" + ImportCache.SNAPSHOT_SUFFIX):
+            stat = path.stat()
+            entries.append((path.stem, stat.st_size, stat.st_mtime))
+        return sorted(entries, key=lambda entry: entry[2])
+
+    def size(self) -> int:
+        """Return total size of all snapshots in bytes."""
+        return sum(size for _, size, _ in self.entries())
+
+    def evict(self) -> int:
+        """Remove least recently used snapshots over the size cap, return their count."""
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        removed = 0
+        for key, size, _ in entries:
+            if total <= self.max_size:
+                break
+            self.path(key).unlink(missing_ok=True)
+            total -= size
+            removed += 1
+        return removed
+
+    def clear(self) -> int:
+        """Remove all snapshots, return their count."""
+        entries = self.entries()
+        for key, _, _ in entries:
+            self.path(key).unlink(missing_ok=True)
+        return len(entries)
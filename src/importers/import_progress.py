@@ -0,0 +1,95 @@
+"""Progress of drawing import that runs in worker thread."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+import queue
+import threading
+from collections.abc import Callable, Iterator
+from typing import Any
+
+
+class ImportCancelledError(Exception):
+    """Exception raised by importer when the import is cancelled by user."""
+
+
+class ImportProgress:
+    """Progress of drawing import that runs in worker thread.
+
+    The worker thread puts messages into thread-safe queue, the GUI thread
+    reads them and it can request the cancellation of import.
+    """
+
+    # kinds of messages put into the queue
+    PROGRESS = "progress"
+    FINISHED = "finished"
+    CANCELLED = "cancelled"
+    FAILED = "failed"
+
+    # number of pairs code+data read between two progress reports
+    REPORT_INTERVAL = 8192
+
+    def __init__(self) -> None:
+        """Initialize the queue with messages and the cancellation flag."""
+        self.queue: queue.Queue = queue.Queue()
+        self.cancel_event = threading.Event()
+
+    def cancel(self) -> None:
+        """Request the cancellation of import, it is called from GUI thread."""
+        self.cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Check if the cancellation of import has been requested."""
+        return self.cancel_event.is_set()
+
+    def check(self) -> None:
+        """Stop the import by exception when the cancellation has been requested."""
+        if self.cancel_event.is_set():
+            raise ImportCancelledError()
+
+    def report(self, consumed: int, total: int) -> None:
+        """Report number of bytes consumed by importer and check for cancellation."""
+        self.check()
+        self.queue.put((ImportProgress.PROGRESS, consumed, total))
+
+    def monitor(
+        self, pairs: Iterator[Any], position: Callable[[], int], total: int
+    ) -> Iterator[Any]:
+        """Pass all pairs code+data through, report the position in file regularly."""
+        count = 0
+        for pair in pairs:
+            yield pair
+            count += 1
+            if count == ImportProgress.REPORT_INTERVAL:
+                count = 0
+                self.report(position(), total)
+
+    def finish(self, result: Any) -> None:
+        """Send the result of successful import."""
+        self.queue.put((ImportProgress.FINISHED, result))
+
+    def finish_cancelled(self) -> None:
+        """Send the message that the import has been cancelled."""
+        self.queue.put((ImportProgress.CANCELLED,))
+
+    def fail(self, error: Exception) -> None:
+        """Send the error that stopped the import."""
+        self.queue.put((ImportProgress.FAILED, error))
+
+    def messages(self) -> Iterator[tuple]:
+        """Generate all messages that are waiting in the queue, it never blocks."""
+        while True:
+            try:
+                yield self.queue.get_nowait()
+            except queue.Empty:
+                return
@@ -0,0 +1,76 @@
+"""Differences between rooms on drawing and rooms read from SAP."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from collections.abc import Iterable, Mapping
+from typing import Any
+
+from drawing import Drawing
+
+
+class RoomChanges:
+    """Report with IDs of added, removed, and unchanged rooms."""
+
+    def __init__(self, added: list[str], removed: list[str], unchanged: list[str]) -> None:
+        """Construct the report, room IDs are kept in order of drawing and SAP."""
+        self.added = added
+        self.removed = removed
+        self.unchanged = unchanged
+
+    def __repr__(self) -> str:
+        """Return textual representation of the report."""
+        return (
+            f"added: {len(self.added)}, removed: {len(self.removed)}, "
+            f"unchanged: {len(self.unchanged)}"
+        )
+
+
+class RoomDiff:
+    """Differences between rooms on drawing and rooms read from SAP.
+
+    Room IDs are compared by hash sets, so the time is linear in number of rooms.
+    """
+
+    @staticmethod
+    def sap_room_ids(rooms_from_sap: Iterable[Mapping[str, Any]]) -> list[str]:
+        """Return IDs of rooms read from SAP, duplicates are removed."""
+        return list(dict.fromkeys(room["AOID"] for room in rooms_from_sap))
+
+    @staticmethod
+    def compute(
+        rooms: Iterable[Mapping[str, Any]], sap_room_ids: Iterable[str]
+    ) -> RoomChanges:
+        """Compare rooms on drawing with IDs of rooms from SAP."""
+        room_ids = [room["room_id"] for room in rooms]
+        sap_room_ids = list(dict.fromkeys(sap_room_ids))
+        existing = set(room_ids)
+        expected = set(sap_room_ids)
+        return RoomChanges(
+            [room_id for room_id in sap_room_ids if room_id not in existing],
+            [room_id for room_id in room_ids if room_id not in expected],
+            [room_id for room_id in room_ids if room_id in expected],
+        )
+
+    @staticmethod
+    def apply(changes: RoomChanges, drawing: Drawing) -> list[int]:
+        """Apply changes to rooms on drawing, return canvas IDs of removed room polygons."""
+        canvas_ids = []
+        for room_id in changes.removed:
+            room = drawing.rooms.find_by_room_id(room_id)
+            if room is not None and room["canvas_id"] is not None:
+                canvas_ids.append(room["canvas_id"])
+            drawing.rooms.delete(room_id)
+        for room_id in changes.added:
+            drawing.rooms.add(room_id, [])
+        drawing.room_counter = len(drawing.rooms) + 1
+        return canvas_ids
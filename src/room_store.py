@@ -0,0 +1,195 @@
+"""Registry of rooms on drawing with indexes by room ID and canvas ID."""
+
+#
+#  (C) Copyright 2017, 2018  Pavel Tisnovsky
+#
+#  All rights reserved. This program and the accompanying materials
+#  are made available under the terms of the Eclipse Public License v1.0
+#  which accompanies this distribution, and is available at
+#  http://www.eclipse.org/legal/epl-v10.html
+#
+#  Contributors:
+#      Pavel Tisnovsky
+#
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from typing import Any, Optional
+
+
+class RoomRecord:
+    """Room stored in room store, it can be read and updated like a dictionary.
+
+    Keys "room_id", "canvas_id", "polygon", and "type" are supported, a key
+    is contained in the record only when its value is not None.
+    """
+
+    __slots__ = ("_store", "room_id", "canvas_id", "type", "_start", "_count")
+
+    KEYS = ("room_id", "canvas_id", "polygon", "type")
+
+    def __init__(self, store: "RoomStore", room_id: str) -> None:
+        """Construct new room without polygon and canvas ID."""
+        self._store = store
+        self.room_id = room_id
+        self.canvas_id: Optional[int] = None
+        self.type: Optional[str] = None
+        # polygon vertexes are stored in flat arrays of room store, None means no polygon
+        self._start: Optional[int] = None
+        self._count = 0
+
+    @property
+    def polygon(self) -> Optional[list[tuple[float, float]]]:
+        """Copy of polygon vertexes, or None when the room is not drawn."""
+        if self._start is None:
+            return None
+        end = self._start + self._count
+        return list(
+            zip(self._store.points_x[self._start : end], self._store.points_y[self._start : end])
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        """Return value stored under given key."""
+        if key not in RoomRecord.KEYS:
+            raise KeyError(key)
+        return getattr(self, key)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        """Change value stored under given key, indexes are updated."""
+        if key == "canvas_id":
+            self._store.set_canvas_id(self, value)
+        elif key == "polygon":
+            self._store.set_polygon(self, value)
+        elif key == "type":
+            self.type = value
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key: object) -> bool:
+        """Check if the value stored under given key is set."""
+        return key in RoomRecord.KEYS and getattr(self, str(key)) is not None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return value stored under given key, default value is returned for unset keys."""
+        return self[key] if key in self else default
+
+    def as_dict(self) -> dict[str, Any]:
+        """Convert the room into dictionary with all keys that are set."""
+        return {key: self[key] for key in RoomRecord.KEYS if key in self}
+
+    def __repr__(self) -> str:
+        """Return textual representation of the room."""
+        return repr(self.as_dict())
+
+
+class RoomStore:
+    """Registry of rooms on drawing with indexes by room ID and canvas ID.
+
+    Rooms are kept in the insertion order. Lookup, add, update, and delete of
+    one room take constant time, vertexes of all polygons are stored in flat
+    coordinate arrays.
+    """
+
+    def __init__(self, rooms: Iterable[Mapping[str, Any]] = ()) -> None:
+        """Construct the store, optionally filled by rooms represented as dictionaries."""
+        self.by_room_id: dict[str, RoomRecord] = {}
+        self.by_canvas_id: dict[int, RoomRecord] = {}
+        self.points_x = array("d")
+        self.points_y = array("d")
+        # number of vertexes in arrays that don't belong to any room
+        self.garbage = 0
+        for room in rooms:
+            self.append(room)
+
+    def __len__(self) -> int:
+        """Return number of rooms."""
+        return len(self.by_room_id)
+
+    def __iter__(self) -> Iterator[RoomRecord]:
+        """Iterate over all rooms in insertion order."""
+        # copy of the list allows to delete rooms during iteration
+        return iter(list(self.by_room_id.values()))
+
+    def add(
+        self,
+        room_id: str,
+        polygon: Optional[Iterable[tuple[float, float]]] = None,
+        canvas_id: Optional[int] = None,
+        typ: Optional[str] = None,
+    ) -> RoomRecord:
+        """Add new room, a room with the same ID is replaced."""
+        self.delete(room_id)
+        room = RoomRecord(self, room_id)
+        room.type = typ
+        self.by_room_id[room_id] = room
+        self.set_polygon(room, polygon)
+        self.set_canvas_id(room, canvas_id)
+        return room
+
+    def append(self, room: Mapping[str, Any]) -> RoomRecord:
+        """Add new room represented as dictionary."""
+        return self.add(
+            room["room_id"], room.get("polygon"), room.get("canvas_id"), room.get("type")
+        )
+
+    def find_by_room_id(self, room_id: str) -> Optional[RoomRecord]:
+        """Find room by its ID."""
+        return self.by_room_id.get(room_id)
+
+    def find_by_canvas_id(self, canvas_id: int) -> Optional[RoomRecord]:
+        """Find room by ID of its polygon drawn on canvas."""
+        return self.by_canvas_id.get(canvas_id)
+
+    def set_canvas_id(self, room: RoomRecord, canvas_id: Optional[int]) -> None:
+        """Change ID of the room polygon drawn on canvas."""
+        if room.canvas_id is not None and self.by_canvas_id.get(room.canvas_id) is room:
+            del self.by_canvas_id[room.canvas_id]
+        room.canvas_id = canvas_id
+        if canvas_id is not None:
+            self.by_canvas_id[canvas_id] = room
+
+    def set_polygon(
+        self, room: RoomRecord, polygon: Optional[Iterable[tuple[float, float]]]
+    ) -> None:
+        """Replace the room polygon, new vertexes are appended to coordinate arrays."""
+        self.garbage += room._count
+        room._start = None
+        room._count = 0
+        if polygon is not None:
+            room._start = len(self.points_x)
+            for x, y in polygon:
+                self.points_x.append(x)
+                self.points_y.append(y)
+            room._count = len(self.points_x) - room._start
+        if self.garbage > len(self.points_x) // 2:
+            self.compact()
+
+    def remove(self, room: RoomRecord) -> None:
+        """Delete given room."""
+        self.delete(room.room_id)
+
+    def delete(self, room_id: str) -> None:
+        """Delete room with given ID, unknown rooms are ignored."""
+        room = self.by_room_id.pop(room_id, None)
+        if room is not None:
+            self.set_canvas_id(room, None)
+            self.garbage += room._count
+
+    def compact(self) -> None:
+        """Remove vertexes of deleted or replaced polygons from coordinate arrays."""
+        points_x = array("d")
+        points_y = array("d")
+        for room in self.by_room_id.values():
+            if room._start is not None:
+                end = room._start + room._count
+                start = len(points_x)
+                points_x.extend(self.points_x[room._start : end])
+                points_y.extend(self.points_y[room._start : end])
+                room._start = start
+        self.points_x = points_x
+        self.points_y = points_y
+        self.garbage = 0
+
+    def as_dicts(self) -> list[dict[str, Any]]:
+        """Convert all rooms into dictionaries, for example to be exported into JSON."""
+        return [room.as_dict() for room in self.by_room_id.values()]
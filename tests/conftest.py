@@ -0,0 +1,8 @@
+"""Configuration for unit tests."""
+
+import sys
+from pathlib import Path
+
+# modules in src/ import each other as top-level modules (the same as when
+# Chainring is started from src/ directory)
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
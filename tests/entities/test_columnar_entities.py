@@ -0,0 +1,78 @@
+"""Unit tests for entities stored by types in contiguous arrays."""
+
+import tracemalloc
+from pathlib import Path
+
+import pytest
+
+from entities import columnar_entities
+from entities.arc import Arc
+from entities.circle import Circle
+from entities.columnar_entities import ColumnarEntities
+from entities.line import Line
+from entities.polyline import Polyline
+from entities.text import Text
+from importers.dxf_importer import DxfImporter
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+def entities_as_text(entities):
+    """Return textual representation of all entities."""
+    return [entity.str() for entity in entities]
+
+
+def test_views_behave_like_entities():
+    """Test that views to stored entities behave like original entities."""
+    entities = [
+        Line(1.0, 2.0, 3.0, 4.0, 1, "walls"),
+        Circle(5.0, 6.0, 2.0, None, "doors"),
+        Arc(0.0, 0.0, 1.0, 0.0, 90.0, 3, None),
+        Text(7.0, 8.0, "room", 4, "walls"),
+        Polyline([0.0, 1.0, 1.0], [0.0, 0.0, 1.0], 5, "rooms"),
+    ]
+    store = ColumnarEntities(entities)
+    assert len(store) == len(entities)
+    assert entities_as_text(store) == entities_as_text(entities)
+    assert store[-1].str() == entities[-1].str()
+    assert store.layer_names == [None, "walls", "doors", "rooms"]
+
+    store[0]._id = 42
+    store[1].color = 7
+    assert store[0]._id == 42
+    assert store[1].color == 7
+    assert store[2]._id is None
+
+
+@pytest.mark.parametrize("filename", sorted(TEST_DATA.glob("*.dxf")), ids=lambda path: path.name)
+@pytest.mark.parametrize("vectorized", [True, False], ids=["numpy", "python"])
+def test_transform_and_bounds(monkeypatch, filename, vectorized):
+    """Test that bulk transformation and bounds match per-entity computation."""
+    if not vectorized:
+        monkeypatch.setattr(columnar_entities, "numpy", None)
+    elif columnar_entities.numpy is None:
+        pytest.skip("NumPy is not installed")
+    expected = DxfImporter(str(filename)).import_dxf()
+    drawing = DxfImporter(str(filename), columnar=True).import_dxf()
+    assert isinstance(drawing.entities, ColumnarEntities)
+    assert entities_as_text(drawing.entities) == entities_as_text(expected.entities)
+
+    drawing.bounds = expected.bounds = None
+    assert repr(drawing.get_bounds()) == repr(expected.get_bounds())
+    drawing.rescale(10.0, -20.0, 0.5)
+    expected.rescale(10.0, -20.0, 0.5)
+    assert entities_as_text(drawing.entities) == entities_as_text(expected.entities)
+    assert repr(drawing.get_bounds()) == repr(expected.get_bounds())
+
+
+def test_memory_usage():
+    """Test that columnar storage needs much less memory than entity objects."""
+    filename = str(TEST_DATA / "Building_3np.dxf")
+    sizes = []
+    for columnar in (False, True):
+        tracemalloc.start()
+        drawing = DxfImporter(filename, columnar=columnar).import_dxf()
+        sizes.append(tracemalloc.get_traced_memory()[0])
+        tracemalloc.stop()
+        del drawing
+    assert sizes[1] * 3 < sizes[0]
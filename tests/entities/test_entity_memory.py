@@ -0,0 +1,52 @@
+"""Unit tests for memory consumed by entities, it is reported by entity memory benchmark."""
+
+import sys
+import tracemalloc
+from pathlib import Path
+
+from entities.arc import Arc
+from entities.circle import Circle
+from entities.line import Line
+from entities.polyline import Polyline
+from entities.text import Text
+from importers.drawing_importer import DrawingImporter
+
+TEST_DRAWINGS = Path(__file__).parent.parent.parent / "test-drawings"
+
+
+def memory_per_entity(create_entities):
+    """Measure memory allocated by created entities, return size per entity in bytes."""
+    tracemalloc.start()
+    try:
+        entities = create_entities()
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return size / len(entities), entities
+
+
+def test_entities_have_no_instance_dict():
+    """Test that entities store their attributes in slots only."""
+    entities = [
+        Line(1.0, 2.0, 3.0, 4.0, 1, "walls"),
+        Circle(5.0, 6.0, 2.0, None, "doors"),
+        Arc(0.0, 0.0, 1.0, 0.0, 90.0, 3, None),
+        Text(7.0, 8.0, "room", 4, "walls"),
+        Polyline([0.0, 1.0], [0.0, 0.0], 5, "rooms"),
+    ]
+    for entity in entities:
+        assert not hasattr(entity, "__dict__")
+    # object header, GC header, and seven slots
+    assert sys.getsizeof(entities[0]) <= 88
+
+
+def test_memory_per_entity_drawing():
+    """Test memory per entity for drawing with rooms, layer names have to be shared."""
+    filename = str(TEST_DRAWINGS / "input_with_15_rooms.drw")
+    size, drawing = memory_per_entity(
+        lambda: DrawingImporter(filename).import_drawing().entities
+    )
+    layers = {}
+    for entity in drawing:
+        assert layers.setdefault(entity.layer, entity.layer) is entity.layer
+    assert size < 240
@@ -0,0 +1,86 @@
+"""Unit tests for the index of snap points."""
+
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from entities.arc import Arc
+from geometry.snap_index import SnapIndex
+from geometry.spatial_index import SpatialIndex
+from geometry.view_transform import ViewTransform
+from importers.dxf_importer import DxfImporter
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["objects", "columnar"])
+def drawing(request):
+    """Drawing with all kinds of entities."""
+    return DxfImporter(str(TEST_DATA / "Building_3np.dxf"), columnar=request.param).import_dxf()
+
+
+def test_arc_snap_points():
+    """Test that arc endpoints are computed in world coordinates with flipped y axis."""
+    arc = Arc(10.0, 20.0, 5.0, 0.0, 90.0, None, "0")
+    (x1, y1), (x2, y2) = arc.snap_points()
+    assert (x1, y1) == pytest.approx((15.0, 20.0))
+    assert (x2, y2) == pytest.approx((10.0, 15.0))
+
+
+def test_nearest_snap_point(drawing):
+    """Test that the nearest snap point is the same as found by brute force."""
+    points = [point for entity in drawing.entities for point in entity.snap_points()]
+    index = drawing.snap_index
+    assert len(index) == len(points)
+
+    bounds = drawing.get_bounds()
+    generator = random.Random(42)
+    for _ in range(200):
+        x = generator.uniform(bounds.xmin, bounds.xmax)
+        y = generator.uniform(bounds.ymin, bounds.ymax)
+        expected = min(math.hypot(px - x, py - y) for px, py in points)
+        found = index.nearest(x, y, 100.0)
+        if expected > 100.0:
+            assert found is None
+        else:
+            assert math.hypot(found[0] - x, found[1] - y) == pytest.approx(expected)
+
+
+def test_empty_cells_are_not_visited(monkeypatch):
+    """Test that rings outside the populated part of grid are skipped by the search."""
+    index = SnapIndex(1.0)
+    for x, y in ((0.0, 0.0), (10.0, 10.0)):
+        index.add(x, y)
+    rings = []
+    ring = SpatialIndex.ring
+    monkeypatch.setattr(
+        SpatialIndex, "ring", lambda cx, cy, radius: rings.append(radius) or ring(cx, cy, radius)
+    )
+
+    # point far away from all snap points with large distance
+    assert index.nearest(1000.0, 1000.0, 100000.0) == (10.0, 10.0)
+    assert rings == list(range(990, 1001))
+    rings.clear()
+    assert index.nearest(1000.0, 1000.0, 10.0) is None
+    assert not rings
+    assert index.nearest(1.0, 1.0, math.inf) == (0.0, 0.0)
+    assert SnapIndex(1.0).nearest(0.0, 0.0, 10.0) is None
+
+
+def test_snap_point_in_view(drawing):
+    """Test that the tolerance is given in pixels and the point is returned in both spaces."""
+    bounds = drawing.get_bounds()
+    view = ViewTransform.fit(bounds, 1000, 700)
+    x, y = drawing.entities[0].snap_points()[0]
+    canvas_x, canvas_y = view.apply(x, y)
+
+    snap_point = drawing.find_snap_point(canvas_x + 3.0, canvas_y - 4.0, view, 10)
+    assert snap_point is not None
+    snap_x, snap_y, world_x, world_y = snap_point
+    assert (snap_x, snap_y) == pytest.approx(view.apply(world_x, world_y))
+    assert math.hypot(snap_x - canvas_x - 3.0, snap_y - canvas_y + 4.0) <= 5.0
+
+    view.zoom(100.0, canvas_x, canvas_y)
+    assert drawing.find_snap_point(canvas_x, canvas_y, view, 1)[2:] == pytest.approx((x, y))
@@ -0,0 +1,133 @@
+"""Unit tests for the spatial index over drawing entities."""
+
+import math
+import random
+from pathlib import Path
+
+import pytest
+
+from entities.line import Line
+from geometry.bounds import Bounds
+from importers.dxf_importer import DxfImporter
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+@pytest.fixture(scope="module", params=[False, True], ids=["objects", "columnar"])
+def drawing(request):
+    """Drawing with all kinds of entities."""
+    return DxfImporter(str(TEST_DATA / "Building_3np.dxf"), columnar=request.param).import_dxf()
+
+
+def random_points(bounds, count):
+    """Generate random points in and around given bounds."""
+    generator = random.Random(42)
+    width = bounds.xmax - bounds.xmin
+    height = bounds.ymax - bounds.ymin
+    for _ in range(count):
+        yield (
+            generator.uniform(bounds.xmin - width / 10, bounds.xmax + width / 10),
+            generator.uniform(bounds.ymin - height / 10, bounds.ymax + height / 10),
+        )
+
+
+def find_nearest(drawing, x, y, max_distance=math.inf, accept=None):
+    """Find entity nearest to the point [x, y] by the spatial index."""
+    entities = drawing.entities
+    key = drawing.spatial_index.nearest(
+        x,
+        y,
+        lambda key: entities[key].distance(x, y),
+        max_distance,
+        None if accept is None else lambda key: accept(entities[key]),
+    )
+    return None if key is None else entities[key]
+
+
+def test_nearest_entity(drawing):
+    """Test that the nearest entity is the same as found by brute force."""
+    entities = list(drawing.entities)
+    for x, y in random_points(drawing.get_bounds(), 50):
+        found = find_nearest(drawing, x, y)
+        assert found.distance(x, y) == pytest.approx(min(e.distance(x, y) for e in entities))
+
+
+def test_nearest_line_within_distance(drawing):
+    """Test that only accepted entities within given distance are found."""
+    lines = [entity for entity in drawing.entities if isinstance(entity, Line)]
+    for x, y in random_points(drawing.get_bounds(), 50):
+        found = find_nearest(drawing, x, y, 50.0, lambda e: isinstance(e, Line))
+        expected = min(line.distance(x, y) for line in lines)
+        if expected > 50.0:
+            assert found is None
+        else:
+            assert isinstance(found, Line)
+            assert found.distance(x, y) == pytest.approx(expected)
+
+
+def test_entities_in_rectangle(drawing):
+    """Test that entities intersecting rectangle are the same as found by brute force."""
+    entities = list(drawing.entities)
+    bounds = drawing.get_bounds()
+    points = list(random_points(bounds, 20))
+    for (x1, y1), (x2, y2) in zip(points[::2], points[1::2]):
+        rectangle = Bounds(min(x1, x2), min(y1, y2), max(x1, x2), max(y1, y2))
+        expected = []
+        for entity in entities:
+            box = entity.get_bounds()
+            if (
+                box.xmin <= rectangle.xmax
+                and box.xmax >= rectangle.xmin
+                and box.ymin <= rectangle.ymax
+                and box.ymax >= rectangle.ymin
+            ):
+                expected.append(entity.str())
+        found = [entities[key].str() for key in drawing.spatial_index.in_rectangle(rectangle)]
+        assert found == expected
+    assert len(drawing.spatial_index.in_rectangle(bounds)) == len(entities)
+
+
+def test_entities_at_point(drawing):
+    """Test that entities are found at their endpoints."""
+    entities = drawing.entities
+    lines = [entity for entity in entities if isinstance(entity, Line)]
+    for line in lines[::50]:
+        x, y = line.x1, line.y1
+        keys = drawing.spatial_index.at_point(x, y, 0.001, lambda key: entities[key].distance(x, y))
+        found = [entities[key] for key in keys]
+        assert line.str() in [entity.str() for entity in found]
+        assert all(entity.distance(x, y) <= 0.001 for entity in found)
+
+
+def test_incremental_update():
+    """Test that added and changed entities are found without rebuilding the index."""
+    drawing = DxfImporter(str(TEST_DATA / "Building_3np.dxf")).import_dxf()
+    index = drawing.spatial_index
+    bounds = drawing.get_bounds()
+
+    line = Line(
+        bounds.xmax + 1000.0, bounds.ymax + 1000.0, bounds.xmax + 1010.0, bounds.ymax, None, "0"
+    )
+    drawing.entities.append(line)
+    index.insert(len(drawing.entities) - 1, line.get_bounds())
+    assert find_nearest(drawing, bounds.xmax + 1005.0, bounds.ymax + 1000.0) is line
+    assert len(index) == len(drawing.entities)
+
+    line.x1 = line.x2 = bounds.xmin - 1000.0
+    index.update(len(drawing.entities) - 1, line.get_bounds())
+    assert drawing.spatial_index is index
+    assert find_nearest(drawing, bounds.xmin - 1000.0, bounds.ymax + 500.0) is line
+    assert find_nearest(drawing, bounds.xmax + 1005.0, bounds.ymax + 1000.0) is not line
+
+
+def test_indexes_built_in_advance():
+    """Test that indexes built in advance are used and not rebuilt."""
+    drawing = DxfImporter(str(TEST_DATA / "Building_3np.dxf")).import_dxf()
+    drawing.build_indexes()
+    index = drawing.spatial_index
+    snap_index = drawing.snap_index
+    assert len(index) == len(drawing.entities)
+    assert len(snap_index) > 0
+    drawing.build_indexes()
+    assert drawing.spatial_index is index
+    assert drawing.snap_index is snap_index
@@ -0,0 +1,35 @@
+"""Unit tests for the transformation of world coordinates into canvas coordinates."""
+
+import pytest
+
+from geometry.bounds import Bounds
+from geometry.view_transform import ViewTransform
+
+
+def test_fit_bounds_into_canvas():
+    """Test that the fitted view maps drawing bounds into canvas."""
+    view = ViewTransform.fit(Bounds(100.0, -50.0, 300.0, 50.0), 1000, 700)
+    xmin, ymin = view.apply(100.0, -50.0)
+    xmax, ymax = view.apply(300.0, 50.0)
+    assert (xmin, ymin) == (0.0, 0.0)
+    assert xmax == pytest.approx(990.0)
+    assert ymax == pytest.approx(495.0)
+
+
+def test_inverse_transformation():
+    """Test that canvas coordinates are transformed back into world coordinates."""
+    view = ViewTransform(-10.0, 20.0, 2.5)
+    assert view.inverse(*view.apply(12.0, -34.0)) == pytest.approx((12.0, -34.0))
+    assert view.as_affine().apply(12.0, -34.0) == pytest.approx(view.apply(12.0, -34.0))
+
+
+def test_zoom_keeps_point_on_canvas():
+    """Test that zooming keeps the selected point on its place and world points intact."""
+    view = ViewTransform(-10.0, 20.0, 2.5)
+    world = view.inverse(400.0, 300.0)
+    for _ in range(50):
+        view.zoom(1.1, 400.0, 300.0)
+    for _ in range(50):
+        view.zoom(1 / 1.1, 400.0, 300.0)
+    assert view.apply(*world) == pytest.approx((400.0, 300.0))
+    assert view.scale == pytest.approx(2.5)
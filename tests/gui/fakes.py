@@ -0,0 +1,125 @@
+"""Replacements of Tk objects and helpers shared by unit tests of GUI."""
+
+import itertools
+import tkinter
+
+
+class FakeCanvas:
+    """Canvas replacement that keeps the set of existing items and scroll position.
+
+    Tcl interpreter without Tk is used, the canvas widget is replaced by Tcl command.
+    """
+
+    PATH = ".canvas"
+
+    def __init__(self, width, height):
+        """Initialize empty canvas with given window size."""
+        self.width = width
+        self.height = height
+        self.ids = itertools.count(1)
+        self.existing = set()
+        self.created = 0
+        self.scroll_x = 0
+        self.scroll_y = 0
+        self.tk = tkinter.Tcl()
+        self.tk.createcommand(FakeCanvas.PATH, self.widget_command)
+        # arguments of items created by Tcl command
+        self.tcl_items = []
+        # tags and options configured by itemconfigure
+        self.configured = []
+        # tags of items created by methods of canvas
+        self.item_tags = {}
+        # event bindings of items and tags
+        self.bindings = []
+
+    def __str__(self):
+        """Return path of the canvas widget."""
+        return FakeCanvas.PATH
+
+    def widget_command(self, operation, *args):
+        """Handle command of canvas widget called from Tcl."""
+        assert operation == "create"
+        self.tcl_items.append(args)
+        return self.create_item()
+
+    def winfo_width(self):
+        """Return width of canvas window."""
+        return self.width
+
+    def winfo_height(self):
+        """Return height of canvas window."""
+        return self.height
+
+    def canvasx(self, x):
+        """Convert window coordinate into canvas coordinate."""
+        return x + self.scroll_x
+
+    def canvasy(self, y):
+        """Convert window coordinate into canvas coordinate."""
+        return y + self.scroll_y
+
+    def create_item(self, *args, **kwargs):
+        """Create new graphics entity, return its ID."""
+        item = next(self.ids)
+        self.existing.add(item)
+        self.created += 1
+        self.item_tags[item] = kwargs.get("tags")
+        return item
+
+    create_line = create_oval = create_arc = create_text = create_polygon = create_item
+
+    def coords(self, item, *coords):
+        """Move existing item."""
+        assert item in self.existing
+
+    def scale(self, tag, xorigin, yorigin, xscale, yscale):
+        """Ignore scaling, coordinates of items are not stored."""
+
+    def move(self, tag, dx, dy):
+        """Ignore moving, coordinates of items are not stored."""
+
+    def delete(self, *items):
+        """Delete given items."""
+        for item in items:
+            self.existing.remove(item)
+
+    def tag_bind(self, *args):
+        """Record event binding."""
+        self.bindings.append(args)
+
+    def addtag_withtag(self, tag, item):
+        """Ignore tags added to items."""
+
+    def itemconfigure(self, tag, **options):
+        """Record options configured for all items with given tag."""
+        self.configured.append((tag, options))
+
+
+class FakeRoot:
+    """Replacement of Tk root window that keeps the scheduled callbacks."""
+
+    def __init__(self):
+        """Initialize the root without scheduled callbacks."""
+        self.ids = itertools.count(1)
+        self.jobs = {}
+
+    def after(self, interval, callback):
+        """Schedule the callback, return ID of the job."""
+        job = f"after#{next(self.ids)}"
+        self.jobs[job] = callback
+        return job
+
+    def after_cancel(self, job):
+        """Cancel the scheduled callback."""
+        del self.jobs[job]
+
+    def run_next(self):
+        """Run the first scheduled callback."""
+        job = next(iter(self.jobs))
+        self.jobs.pop(job)()
+
+
+def render(renderer, drawing, view, view_changed=True):
+    """Run all steps of redraw at once, the same as progressive redraw without time slices."""
+    for _ in renderer.render_steps(drawing, view, view_changed):
+        pass
@@ -0,0 +1,67 @@
+"""Unit tests for the import of drawing that runs in worker thread."""
+
+from pathlib import Path
+
+from gui.background_import import BackgroundImport
+from importers.dxf_importer import DxfImporter
+from importers.import_progress import ImportCancelledError
+from tests.gui.fakes import FakeRoot
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+class FakeLoader:
+    """Loader that imports DXF file without header bounds, or raises the given error."""
+
+    def __init__(self, error=None):
+        """Initialize the loader."""
+        self.error = error
+
+    def load(self, filename, progress=None):
+        """Import the drawing or raise the error."""
+        if self.error is not None:
+            raise self.error
+        drawing = DxfImporter(filename, progress=progress).import_dxf()
+        drawing.bounds = None
+        return drawing
+
+
+def run_import(loader, cancel=False):
+    """Run the import in current thread, return arguments passed to the finish callback."""
+    results = []
+    background_import = BackgroundImport(
+        FakeRoot(),
+        loader,
+        str(TEST_DATA / "Building_3np.dxf"),
+        lambda consumed, total: None,
+        lambda *args: results.append(args),
+    )
+    if cancel:
+        background_import.cancel()
+    background_import.run()
+    background_import.poll()
+    return results
+
+
+def test_bounds_are_passed_to_callback():
+    """Test that bounds are computed in worker thread, but not stored in drawing."""
+    [(drawing, bounds, error)] = run_import(FakeLoader())
+    assert error is None
+    assert drawing.bounds is None
+    expected = drawing.get_bounds()
+    assert (bounds.xmin, bounds.ymin, bounds.xmax, bounds.ymax) == (
+        expected.xmin,
+        expected.ymin,
+        expected.xmax,
+        expected.ymax,
+    )
+
+
+def test_error_is_passed_to_callback():
+    """Test that the error that stopped the import is passed to callback."""
+    failure = ValueError("broken file")
+    assert run_import(FakeLoader(failure)) == [(None, None, failure)]
+
+    [(drawing, bounds, error)] = run_import(FakeLoader(), cancel=True)
+    assert drawing is None
+    assert isinstance(error, ImportCancelledError)
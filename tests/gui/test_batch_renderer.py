@@ -0,0 +1,50 @@
+"""Unit tests for the creation of canvas items by few calls of Tcl interpreter."""
+
+import pytest
+
+from entities.arc import Arc
+from entities.circle import Circle
+from entities.line import Line
+from entities.polyline import Polyline
+from entities.text import Text
+from gui.batch_renderer import BatchRenderer
+from tests.gui.fakes import FakeCanvas
+
+
+def test_items_are_created_in_order(monkeypatch):
+    """Test that IDs are returned in order of entities, also for more chunks."""
+    monkeypatch.setattr(BatchRenderer, "CHUNK_SIZE", 3)
+    canvas = FakeCanvas(1000, 700)
+    batch = BatchRenderer(canvas)
+    entities = [
+        Line(1.0, 2.0, 3.0, 4.0, None, "0"),
+        Circle(5.0, 5.0, 1.0, None, "0"),
+        Arc(5.0, 5.0, 1.0, 0.0, 270.0, None, "0"),
+        Text(1.0, 1.0, "{nested} [text] $x \\ 1", None, "0"),
+        Line(5.0, 6.0, 7.0, 8.0, None, "0"),
+    ]
+    for entity in entities:
+        assert batch.add(entity, 1.0, 0.0, 2.0)
+    assert len(batch) == len(entities)
+
+    ids = batch.flush()
+    assert ids == [1, 2, 3, 4, 5]
+    assert [entity._id for entity in entities] == ids
+    assert len(batch) == 0
+
+    line, circle, arc, text, _ = canvas.tcl_items
+    assert line[0] == "line"
+    assert [float(value) for value in line[1:5]] == [4.0, 4.0, 8.0, 8.0]
+    assert line[5:] == ("-fill", "black", "-tags", "drawing")
+    assert circle[0] == "oval"
+    assert arc[0] == "arc"
+    assert float(arc[arc.index("-extent") + 1]) == pytest.approx(270.0)
+    assert text[0] == "text"
+    assert text[text.index("-text") + 1] == "{nested} [text] $x \\ 1"
+
+
+def test_polylines_are_not_batched():
+    """Test that entities drawn in other way are refused."""
+    batch = BatchRenderer(FakeCanvas(1000, 700))
+    assert not batch.add(Polyline([0.0, 1.0], [0.0, 1.0], None, "0"), 0.0, 0.0, 1.0)
+    assert batch.flush() == []
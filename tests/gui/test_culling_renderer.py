@@ -0,0 +1,102 @@
+"""Unit tests for the renderer that draws just the visible part of drawing."""
+
+from pathlib import Path
+
+import pytest
+
+from drawing import Drawing
+from entities.line import Line
+from entities.polyline import Polyline
+from geometry.view_transform import ViewTransform
+from gui.culling_renderer import CullingRenderer
+from importers.dxf_importer import DxfImporter
+from tests.gui.fakes import FakeCanvas, render
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+@pytest.fixture(params=[False, True], ids=["objects", "columnar"])
+def drawing(request):
+    """Drawing with all kinds of entities."""
+    return DxfImporter(str(TEST_DATA / "Building_3np.dxf"), columnar=request.param).import_dxf()
+
+
+def test_whole_drawing_is_drawn(drawing):
+    """Test that all entities are drawn when the whole drawing is visible."""
+    canvas = FakeCanvas(1000, 700)
+    renderer = CullingRenderer(canvas)
+    render(renderer, drawing, ViewTransform.fit(drawing.get_bounds(), 1000, 700))
+    assert len(renderer) == len(drawing.entities)
+    assert len(drawing.entity_index) == len(canvas.existing)
+
+
+def test_items_are_culled_and_recycled(drawing):
+    """Test that just visible entities are drawn and items are recycled on zoom and scroll."""
+    canvas = FakeCanvas(1000, 700)
+    renderer = CullingRenderer(canvas)
+    view = ViewTransform.fit(drawing.get_bounds(), 1000, 700)
+    view.zoom(20.0, 500, 350)
+    render(renderer, drawing, view)
+
+    rectangle = renderer.visible_rectangle(view, CullingRenderer.MARGIN)
+    expected = drawing.spatial_index.in_rectangle(rectangle)
+    assert 0 < len(renderer) == len(expected) < len(drawing.entities)
+    assert len(drawing.entity_index) == len(canvas.existing)
+
+    # the same entities are drawn after zoom, just line items are moved
+    created = canvas.created
+    render(renderer, drawing, view)
+    assert len(renderer) == len(expected)
+    items = {item for entity_items in renderer.items.values() for item in entity_items}
+    assert canvas.created - created == len(items)
+
+    # small scroll is covered by margin
+    created = canvas.created
+    canvas.scroll_x += 10
+    render(renderer, drawing, view, False)
+    assert canvas.created == created
+
+    # entities that left the window are deleted or recycled
+    canvas.scroll_x += 2000
+    canvas.scroll_y += 1000
+    render(renderer, drawing, view, False)
+    rectangle = renderer.visible_rectangle(view, CullingRenderer.MARGIN)
+    assert len(renderer) == len(drawing.spatial_index.in_rectangle(rectangle))
+    assert len(drawing.entity_index) == len(canvas.existing)
+
+
+def test_hidden_layers_are_not_drawn(drawing):
+    """Test that layer is hidden by one call and its entities are skipped by next render."""
+    canvas = FakeCanvas(1000, 700)
+    renderer = CullingRenderer(canvas)
+    view = ViewTransform.fit(drawing.get_bounds(), 1000, 700)
+    render(renderer, drawing, view)
+    layer = drawing.entities[0].layer
+    tag = renderer.layer_tag(layer)
+    assert ("-tags", f"drawing {tag}") == canvas.tcl_items[0][-2:]
+
+    renderer.set_layer_visible(layer, False)
+    assert canvas.configured == [(tag, {"state": "hidden"})]
+    render(renderer, drawing, view)
+    hidden = sum(entity.layer == layer for entity in drawing.entities)
+    assert len(renderer) == len(drawing.entities) - hidden
+
+    # entities skipped while the layer was hidden are drawn after it is shown
+    renderer.set_layer_visible(layer, True)
+    render(renderer, drawing, view, False)
+    assert len(renderer) == len(drawing.entities)
+    assert len(drawing.entity_index) == len(canvas.existing)
+
+
+def test_room_select_polygons_are_not_bound():
+    """Test that polygons for selecting room are tagged and no binding is created on redraw."""
+    polygon = Polyline([0.0, 100.0, 100.0], [0.0, 0.0, 100.0], None, "CKPOPISM_PLOCHA")
+    drawing = Drawing([polygon, Line(0.0, 0.0, 100.0, 100.0, None, "0")], {})
+    canvas = FakeCanvas(1000, 700)
+    renderer = CullingRenderer(canvas)
+    view = ViewTransform.fit(drawing.get_bounds(), 1000, 700)
+    for _ in range(3):
+        view.zoom(0.5, 500, 350)
+        render(renderer, drawing, view)
+        assert canvas.item_tags[polygon._id] == "room_select"
+    assert not canvas.bindings
@@ -0,0 +1,41 @@
+"""Unit tests for the coalescing of GUI events into one update per frame."""
+
+from gui.frame_scheduler import FrameScheduler
+from tests.gui.fakes import FakeRoot
+
+
+def test_requests_are_coalesced():
+    """Test that many requests in one frame cause just one update."""
+    root = FakeRoot()
+    updates = []
+    scheduler = FrameScheduler(root, lambda: updates.append(True))
+    for _ in range(10):
+        scheduler.request()
+    assert scheduler.pending
+    assert len(root.jobs) == 1
+    root.run_next()
+    assert len(updates) == 1
+    assert not scheduler.pending
+
+    # the next frame is scheduled by the next request
+    scheduler.request()
+    assert len(root.jobs) == 1
+
+
+def test_flush_and_cancel():
+    """Test that the pending update can be run immediately or cancelled."""
+    root = FakeRoot()
+    updates = []
+    scheduler = FrameScheduler(root, lambda: updates.append(True))
+    scheduler.flush()
+    assert not updates
+
+    scheduler.request()
+    scheduler.flush()
+    assert len(updates) == 1
+    assert not root.jobs
+
+    scheduler.request()
+    scheduler.cancel()
+    assert not root.jobs
+    assert len(updates) == 1
@@ -0,0 +1,55 @@
+"""Unit tests for the level of detail of entities drawn onto canvas."""
+
+from pathlib import Path
+
+from entities.arc import Arc
+from entities.line import Line
+from entities.text import Text
+from geometry.view_transform import ViewTransform
+from gui.culling_renderer import CullingRenderer
+from gui.level_of_detail import LevelOfDetail
+from importers.dxf_importer import DxfImporter
+from tests.gui.fakes import FakeCanvas, render
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+def test_small_entities_are_simplified():
+    """Test that entities are simplified according to their projected size."""
+    policy = LevelOfDetail(ViewTransform(0.0, 0.0, 0.5))
+    assert policy.detail(Arc(0.0, 0.0, 0.5, 0.0, 90.0, None, "0")) == LevelOfDetail.HIDDEN
+    assert policy.detail(Arc(0.0, 0.0, 4.0, 0.0, 90.0, None, "0")) == LevelOfDetail.CHORD
+    assert policy.detail(Arc(0.0, 0.0, 100.0, 0.0, 90.0, None, "0")) == LevelOfDetail.FULL
+    assert policy.detail(Line(0.0, 0.0, 4.0, 0.0, None, "0")) == LevelOfDetail.MERGED
+    assert policy.detail(Line(0.0, 0.0, 100.0, 0.0, None, "0")) == LevelOfDetail.FULL
+
+    # the full detail returns when zoomed in
+    policy = LevelOfDetail(ViewTransform(0.0, 0.0, 10.0))
+    assert policy.detail(Arc(0.0, 0.0, 0.5, 0.0, 90.0, None, "0")) == LevelOfDetail.FULL
+    assert policy.detail(Line(0.0, 0.0, 4.0, 0.0, None, "0")) == LevelOfDetail.FULL
+
+
+def test_texts_collapse_into_dots():
+    """Test that just one text is displayed in canvas cell."""
+    policy = LevelOfDetail(ViewTransform())
+    assert policy.detail(Text(1.0, 1.0, "A", None, "0")) == LevelOfDetail.FULL
+    assert policy.detail(Text(10.0, 10.0, "B", None, "0")) == LevelOfDetail.DOT
+    assert policy.detail(Text(11.0, 11.0, "C", None, "0")) == LevelOfDetail.HIDDEN
+    assert policy.detail(Text(30.0, 1.0, "D", None, "0")) == LevelOfDetail.FULL
+
+
+def test_zoomed_out_drawing_has_less_items():
+    """Test that the zoomed out drawing is drawn by less items than entities."""
+    drawing = DxfImporter(str(TEST_DATA / "Building_1np.dxf")).import_dxf()
+    canvas = FakeCanvas(1000, 700)
+    renderer = CullingRenderer(canvas)
+    render(renderer, drawing, ViewTransform.fit(drawing.get_bounds(), 1000, 700))
+    assert len(renderer) == len(drawing.entities)
+    assert len(canvas.existing) < len(drawing.entities)
+    assert len(drawing.entity_index) == len(canvas.existing)
+
+    # merged lines are deleted when the last of them is released
+    render(renderer, drawing, ViewTransform(1e9, 1e9, 1.0))
+    assert not renderer.shared
+    assert not canvas.existing
+    assert len(drawing.entity_index) == len(canvas.existing)
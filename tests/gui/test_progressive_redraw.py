@@ -0,0 +1,69 @@
+"""Unit tests for the redraw of drawing that runs in time slices."""
+
+from pathlib import Path
+
+from geometry.view_transform import ViewTransform
+from gui.culling_renderer import CullingRenderer
+from gui.progressive_redraw import ProgressiveRedraw
+from importers.dxf_importer import DxfImporter
+from tests.gui.fakes import FakeCanvas, FakeRoot, render
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+def test_redraw_runs_in_slices(monkeypatch):
+    """Test that the redraw is split into slices and texts are drawn after lines."""
+    monkeypatch.setattr(ProgressiveRedraw, "FRAME_BUDGET", 0.0)
+    monkeypatch.setattr(CullingRenderer, "STEP_SIZE", 10)
+    drawing = DxfImporter(str(TEST_DATA / "Building_3np.dxf")).import_dxf()
+    canvas = FakeCanvas(1000, 700)
+    renderer = CullingRenderer(canvas)
+    view = ViewTransform.fit(drawing.get_bounds(), 1000, 700)
+    view.zoom(20.0, 500, 350)
+    finished = []
+    root = FakeRoot()
+    redraw = ProgressiveRedraw(
+        root, renderer.render_steps(drawing, view), lambda: finished.append(True)
+    )
+    redraw.start()
+
+    # the first slice draws just the first chunk of entities
+    assert 0 < len(renderer) <= CullingRenderer.STEP_SIZE
+    slices = 1
+    while root.jobs:
+        root.run_next()
+        slices += 1
+    assert finished and redraw.finished
+    assert slices > 1
+
+    expected = drawing.spatial_index.in_rectangle(renderer.visible_rectangle(view, 0.25))
+    assert len(renderer) == len(expected)
+    assert len(drawing.entity_index) == len(canvas.existing)
+    types = [item[0] for item in canvas.tcl_items]
+    assert "text" in types
+    assert "line" not in types[types.index("text") :]
+
+
+def test_stale_redraw_is_cancelled(monkeypatch):
+    """Test that cancelled redraw deletes unused items and the next one finishes the drawing."""
+    monkeypatch.setattr(ProgressiveRedraw, "FRAME_BUDGET", 0.0)
+    monkeypatch.setattr(CullingRenderer, "STEP_SIZE", 10)
+    drawing = DxfImporter(str(TEST_DATA / "Building_3np.dxf")).import_dxf()
+    canvas = FakeCanvas(1000, 700)
+    renderer = CullingRenderer(canvas)
+    view = ViewTransform.fit(drawing.get_bounds(), 1000, 700)
+    render(renderer, drawing, view)
+
+    root = FakeRoot()
+    view.zoom(2.0, 500, 350)
+    redraw = ProgressiveRedraw(root, renderer.render_steps(drawing, view))
+    redraw.start()
+    redraw.cancel()
+    assert not root.jobs
+    assert len(drawing.entity_index) == len(canvas.existing)
+
+    # entities that were not drawn by the cancelled redraw are drawn after scroll
+    render(renderer, drawing, view, False)
+    expected = drawing.spatial_index.in_rectangle(renderer.visible_rectangle(view, 0.25))
+    assert len(renderer) == len(expected)
+    assert len(drawing.entity_index) == len(canvas.existing)
@@ -0,0 +1,59 @@
+"""Unit tests for the decoder of text data stored in DXF files."""
+
+from importers.dxf_decoder import DxfDecoder
+from importers.dxf_encoding_strategy import DxfEncodingStrategy
+
+
+def test_detect_encoding_from_codepage():
+    """Test that the encoding is taken from $DWGCODEPAGE header variable."""
+    prefix = b"  0\nSECTION\n  2\nHEADER\n  9\n$DWGCODEPAGE\n  3\nANSI_1250\n"
+    decoder = DxfDecoder()
+    assert decoder.detect(prefix) == "cp1250"
+    assert decoder.strategy == DxfEncodingStrategy.HEADER_CODEPAGE
+
+
+def test_detect_encoding_from_version():
+    """Test that new DXF versions are always decoded as UTF-8."""
+    prefix = b"  9\n$ACADVER\n  1\nAC1027\n  9\n$DWGCODEPAGE\n  3\nANSI_1250\n"
+    decoder = DxfDecoder()
+    assert decoder.detect(prefix) == "utf-8"
+    assert decoder.strategy == DxfEncodingStrategy.HEADER_VERSION
+
+
+def test_detect_encoding_from_prefix_sample():
+    """Test that the encoding is detected from the file prefix."""
+    decoder = DxfDecoder()
+    assert decoder.detect("  1\nmístnost\n".encode("windows-1250")) == "windows-1250"
+    assert decoder.strategy == DxfEncodingStrategy.PREFIX_SAMPLE
+
+
+def test_detect_encoding_truncated_prefix():
+    """Test that multibyte sequence cut at the end of prefix does not matter."""
+    decoder = DxfDecoder()
+    assert decoder.detect("  1\nmístnost".encode()[:-7]) == "utf-8"
+
+
+def test_decoder_switch():
+    """Test that the decoder switches encoding when it finds invalid byte."""
+    decoder = DxfDecoder()
+    decoder.detect(b"  0\nSECTION\n")
+    assert decoder.decode(b"abc") == "abc"
+    assert decoder.decode("žluťoučký".encode("windows-1250")) == "žluťoučký"
+    assert decoder.encoding == "windows-1250"
+    assert decoder.strategy == DxfEncodingStrategy.DECODER_SWITCH
+
+
+def test_codepage_to_encoding():
+    """Test the conversion of DXF code page names."""
+    assert DxfDecoder.codepage_to_encoding("ANSI_1252") == "cp1252"
+    assert DxfDecoder.codepage_to_encoding("dos852") == "cp852"
+    assert DxfDecoder.codepage_to_encoding("UTF8") == "utf-8"
+    assert DxfDecoder.codepage_to_encoding("foo") is None
+
+
+def test_detect_encoding_binary():
+    """Test that the code page is found in header of binary DXF file."""
+    prefix = b"\x09\x00$DWGCODEPAGE\x00\x03\x00ANSI_1250\x00"
+    decoder = DxfDecoder()
+    assert decoder.detect(prefix, binary=True) == "cp1250"
+    assert decoder.strategy == DxfEncodingStrategy.HEADER_CODEPAGE
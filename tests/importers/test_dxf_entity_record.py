@@ -0,0 +1,71 @@
+"""Unit tests for the dispatch tables that fill attributes of entities read from DXF."""
+
+import pytest
+
+from entities.drawing_entity_type import DrawingEntityType
+from importers.dxf_codes import DxfCodes
+from importers.dxf_entity_record import DxfEntityRecord
+from importers.dxf_importer import DxfImporter
+
+
+def dispatch(entity_type, groups):
+    """Fill the record of given entity type by groups of code and data."""
+    record = DxfEntityRecord(entity_type)
+    handlers = DxfImporter.ENTITY_HANDLERS[entity_type]
+    for code, data in groups:
+        handler = handlers.get(code)
+        if handler is not None:
+            handler(record, data)
+    return record
+
+
+@pytest.mark.parametrize(
+    "entity_type,code,data,field,expected",
+    [
+        (DrawingEntityType.LINE, DxfCodes.X1, "1.5", "x1", 1.5),
+        (DrawingEntityType.LINE, DxfCodes.Y1, "2.5", "y1", 2.5),
+        (DrawingEntityType.LINE, DxfCodes.X2, "3.5", "x2", 3.5),
+        (DrawingEntityType.LINE, DxfCodes.Y2, "4.5", "y2", 4.5),
+        (DrawingEntityType.CIRCLE, DxfCodes.X1, "1.0", "x1", 1.0),
+        (DrawingEntityType.CIRCLE, DxfCodes.Y1, "2.0", "y1", 2.0),
+        (DrawingEntityType.CIRCLE, DxfCodes.RADIUS, "3.0", "radius", 3.0),
+        (DrawingEntityType.CIRCLE, DxfCodes.MIRROR, "-1.0", "mirror", -1),
+        (DrawingEntityType.ARC, DxfCodes.RADIUS, "5.0", "radius", 5.0),
+        (DrawingEntityType.ARC, DxfCodes.ANGLE1, "30.0", "angle1", 30.0),
+        (DrawingEntityType.ARC, DxfCodes.ANGLE2, "60.0", "angle2", 60.0),
+        (DrawingEntityType.POLYLINE, DxfCodes.X1, "1.0", "points_x", [1.0]),
+        (DrawingEntityType.POLYLINE, DxfCodes.Y1, "2.0", "points_y", [2.0]),
+        (DrawingEntityType.TEXT, DxfCodes.X1, "1.0", "x1", 1.0),
+        (DrawingEntityType.TEXT, DxfCodes.PRIMARY_TEXT, "m^2^", "text", "m^2^"),
+        (DrawingEntityType.INSERT, DxfCodes.NAME, "door", "name", "door"),
+        (DrawingEntityType.INSERT, DxfCodes.XSCALE, "2.0", "xscale", 2.0),
+        (DrawingEntityType.INSERT, DxfCodes.YSCALE, "3.0", "yscale", 3.0),
+        (DrawingEntityType.INSERT, DxfCodes.ANGLE1, "90.0", "angle1", 90.0),
+    ],
+)
+def test_group_sets_field(entity_type, code, data, field, expected):
+    """Test that the group code of entity type sets the right field of record."""
+    record = dispatch(entity_type, [(code, data)])
+    assert getattr(record, field) == expected
+
+
+@pytest.mark.parametrize("entity_type", list(DxfImporter.ENTITY_HANDLERS))
+def test_common_groups(entity_type):
+    """Test that layer and color are set for all entity types."""
+    record = dispatch(entity_type, [(DxfCodes.LAYER_NAME, "outer walls"), (DxfCodes.COLOR, "3")])
+    assert record.layer == "outer_walls"
+    assert record.color == 3
+
+
+def test_unknown_groups_are_ignored():
+    """Test that groups not used by the entity type don't change the record."""
+    record = dispatch(DrawingEntityType.LINE, [(DxfCodes.RADIUS, "5.0"), (DxfCodes.NAME, "x")])
+    assert record.radius == 0.0
+    assert record.name == ""
+
+
+def test_all_entity_types_have_tables():
+    """Test that each imported entity type has dispatch table and store function."""
+    for entity_type in DxfImporter.ENTITY_TYPES.values():
+        assert entity_type in DxfImporter.ENTITY_HANDLERS
+        assert entity_type in DxfImporter.STORE_FUNCTIONS
@@ -0,0 +1,349 @@
+"""Unit tests for the importer for drawings stored in a DXF format."""
+
+import struct
+from pathlib import Path
+
+import pytest
+
+from entities.drawing_entity_type import DrawingEntityType
+from entities.insert import Insert
+from importers.dxf_binary_tokenizer import DxfBinaryTokenizer
+from importers.dxf_import_filter import DxfImportFilter
+from importers.dxf_importer import DxfImporter
+from importers.dxf_tokenizer_type import DxfTokenizerType
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+SIMPLE_DXF = """999
+comment
+  0
+SECTION
+  2
+ENTITIES
+  0
+LINE
+  8
+walls
+ 62
+1
+ 10
+1.0
+ 20
+2.0
+ 11
+3.0
+ 21
+4.0
+  0
+CIRCLE
+  8
+doors
+ 62
+2
+ 10
+5.0
+ 20
+6.0
+ 40
+7.0
+  0
+TEXT
+  8
+descriptions
+ 62
+3
+ 10
+8.0
+ 20
+9.0
+  1
+m\\U+00B2
+  0
+ENDSEC
+  0
+EOF
+"""
+
+BLOCKS_DXF = """  0
+SECTION
+  2
+BLOCKS
+  0
+BLOCK
+  8
+0
+  2
+door
+ 10
+1.0
+ 20
+1.0
+  0
+LINE
+  8
+0
+ 62
+0
+ 10
+1.0
+ 20
+1.0
+ 11
+2.0
+ 21
+1.0
+  0
+ENDBLK
+  0
+ENDSEC
+  0
+SECTION
+  2
+ENTITIES
+  0
+INSERT
+  8
+doors
+ 62
+5
+  2
+door
+ 10
+10.0
+ 20
+20.0
+ 50
+90.0
+  0
+INSERT
+  8
+doors
+ 62
+6
+  2
+door
+ 10
+0.0
+ 20
+0.0
+ 41
+2.0
+  0
+ENDSEC
+  0
+EOF
+"""
+
+
+def drawing_as_text(drawing):
+    """Convert all entities from drawing into textual representation."""
+    return [entity.str() for entity in drawing.entities]
+
+
+HEADER_DXF = """  0
+SECTION
+  2
+HEADER
+  9
+$ACADVER
+  1
+AC1015
+  9
+$INSUNITS
+ 70
+4
+  9
+$EXTMIN
+ 10
+-2.0
+ 20
+-1.0
+ 30
+0.0
+  9
+$EXTMAX
+ 10
+{xmax}
+ 20
+13.0
+ 30
+0.0
+  0
+ENDSEC
+  0
+SECTION
+  2
+TABLES
+  0
+TABLE
+  2
+LAYER
+  0
+ENDTAB
+  0
+ENDSEC
+"""
+
+
+def to_binary_dxf(text):
+    """Convert the content of ASCII DXF file into binary DXF."""
+    lines = text.splitlines()
+    output = [DxfBinaryTokenizer.SENTINEL]
+    for code, value in zip(lines[0::2], lines[1::2]):
+        code = int(code)
+        value = value.strip()
+        value_type = DxfBinaryTokenizer.value_type(code)
+        output.append(struct.pack("<H", code))
+        if value_type == DxfBinaryTokenizer.DOUBLE:
+            output.append(struct.pack("<d", float(value)))
+        elif value_type == DxfBinaryTokenizer.INT16:
+            output.append(struct.pack("<h", int(value)))
+        elif value_type == DxfBinaryTokenizer.INT32:
+            output.append(struct.pack("<i", int(value)))
+        else:
+            output.append(value.encode() + b"\x00")
+    return b"".join(output)
+
+
+@pytest.fixture
+def simple_dxf(tmp_path):
+    """Write simple DXF file into temporary directory."""
+    path = tmp_path / "simple.dxf"
+    path.write_text(SIMPLE_DXF)
+    return str(path)
+
+
+@pytest.mark.parametrize("tokenizer", list(DxfTokenizerType))
+def test_import_simple_dxf(simple_dxf, tokenizer):
+    """Test the import of simple DXF file."""
+    drawing = DxfImporter(simple_dxf, tokenizer).import_dxf()
+    assert drawing_as_text(drawing) == [
+        "L 1 walls 1.0 -2.0 3.0 -4.0",
+        "C 2 doors 5.0 -6.0 7.0",
+        "T 3 descriptions 8.0 -9.0 m^2^",
+    ]
+    assert drawing.metadata["encoding"] == "utf-8"
+
+
+@pytest.mark.parametrize("tokenizer", list(DxfTokenizerType))
+def test_import_empty_file(tmp_path, tokenizer):
+    """Test the import of empty DXF file."""
+    path = tmp_path / "empty.dxf"
+    path.write_bytes(b"")
+    drawing = DxfImporter(str(path), tokenizer).import_dxf()
+    assert len(drawing.entities) == 0
+    assert drawing.lines == 0
+
+
+def test_tokenizers_produce_same_drawing():
+    """Test that all tokenizers produce the same drawing."""
+    filename = str(TEST_DATA / "Building_3np.dxf")
+    expected = DxfImporter(filename, DxfTokenizerType.TEXT).import_dxf()
+    drawing = DxfImporter(filename, DxfTokenizerType.MMAP).import_dxf()
+    assert drawing_as_text(drawing) == drawing_as_text(expected)
+    assert drawing.statistic == expected.statistic
+    assert drawing.lines == expected.lines
+
+
+def test_parallel_import_produces_same_drawing(monkeypatch):
+    """Test that parallel import of ENTITIES section produces the same drawing."""
+    monkeypatch.setattr(DxfImporter, "PARALLEL_MIN_SIZE", 0)
+    filename = str(TEST_DATA / "Building_3np.dxf")
+    expected = DxfImporter(filename).import_dxf()
+    drawing = DxfImporter(filename, workers=3).import_dxf()
+    assert drawing_as_text(drawing) == drawing_as_text(expected)
+    assert drawing.statistic == expected.statistic
+    assert drawing.lines == expected.lines
+
+
+def test_import_filter_layers(simple_dxf):
+    """Test that entities from excluded layers are not imported."""
+    import_filter = DxfImportFilter(exclude_layers=["doors"])
+    drawing = DxfImporter(simple_dxf, import_filter=import_filter).import_dxf()
+    assert drawing_as_text(drawing) == [
+        "L 1 walls 1.0 -2.0 3.0 -4.0",
+        "T 3 descriptions 8.0 -9.0 m^2^",
+    ]
+    assert drawing.statistic[DrawingEntityType.CIRCLE] == 0
+
+    import_filter = DxfImportFilter(include_layers=["walls", "doors"])
+    drawing = DxfImporter(simple_dxf, import_filter=import_filter).import_dxf()
+    assert len(drawing.entities) == 2
+
+
+def test_import_filter_entity_types(simple_dxf):
+    """Test that entities of excluded types are not imported."""
+    import_filter = DxfImportFilter(exclude_types=[DrawingEntityType.TEXT])
+    drawing = DxfImporter(simple_dxf, import_filter=import_filter).import_dxf()
+    assert drawing_as_text(drawing) == [
+        "L 1 walls 1.0 -2.0 3.0 -4.0",
+        "C 2 doors 5.0 -6.0 7.0",
+    ]
+
+    import_filter = DxfImportFilter(include_types=[DrawingEntityType.CIRCLE])
+    drawing = DxfImporter(simple_dxf, import_filter=import_filter).import_dxf()
+    assert drawing_as_text(drawing) == ["C 2 doors 5.0 -6.0 7.0"]
+
+
+def test_scan_layers(simple_dxf):
+    """Test the pre-scan of layers with entity counts."""
+    assert DxfImporter(simple_dxf).scan_layers() == {
+        "descriptions": 1,
+        "doors": 1,
+        "walls": 1,
+    }
+
+
+@pytest.mark.parametrize("tokenizer", list(DxfTokenizerType))
+def test_import_blocks(tmp_path, tokenizer):
+    """Test that block definitions are shared by inserts and expanded on demand."""
+    path = tmp_path / "blocks.dxf"
+    path.write_text(BLOCKS_DXF)
+    drawing = DxfImporter(str(path), tokenizer).import_dxf()
+    assert list(drawing.blocks) == ["door"]
+    assert len(drawing.blocks["door"].entities) == 1
+    assert drawing.statistic[DrawingEntityType.INSERT] == 2
+    assert drawing.statistic[DrawingEntityType.LINE] == 0
+    assert all(insert.block is drawing.blocks["door"] for insert in drawing.entities)
+    assert [entity.str() for entity in Insert.expand_all(drawing.entities)] == [
+        "L 5 doors 10.0 -20.0 10.0 -21.0",
+        "L 6 doors 0.0 0.0 2.0 0.0",
+    ]
+
+
+def test_import_binary_dxf(tmp_path, simple_dxf):
+    """Test that binary DXF is detected and produces the same drawing as ASCII DXF."""
+    path = tmp_path / "simple_binary.dxf"
+    path.write_bytes(to_binary_dxf(SIMPLE_DXF))
+    expected = DxfImporter(simple_dxf).import_dxf()
+    drawing = DxfImporter(str(path)).import_dxf()
+    assert drawing_as_text(drawing) == drawing_as_text(expected)
+    assert drawing.statistic == expected.statistic
+    assert drawing.lines == expected.lines
+    assert drawing.metadata["format"] == "binary"
+    assert DxfImporter(str(path)).scan_layers() == DxfImporter(simple_dxf).scan_layers()
+
+
+@pytest.mark.parametrize("tokenizer", list(DxfTokenizerType))
+def test_import_header(tmp_path, tokenizer):
+    """Test that header variables are stored in metadata and extents are used as bounds."""
+    path = tmp_path / "header.dxf"
+    path.write_text(HEADER_DXF.format(xmax=12.0) + SIMPLE_DXF)
+    drawing = DxfImporter(str(path), tokenizer).import_dxf()
+    assert drawing.metadata["version"] == "AC1015"
+    assert drawing.metadata["units"] == "mm"
+    assert drawing.metadata["extmax"] == "12.0 13.0"
+    assert (drawing.bounds.xmin, drawing.bounds.ymin) == (-2.0, -13.0)
+    assert (drawing.bounds.xmax, drawing.bounds.ymax) == (12.0, 1.0)
+    # skipped sections are counted as well
+    assert drawing.lines == (HEADER_DXF + SIMPLE_DXF).count("\n") // 2
+    assert len(drawing.entities) == 3
+
+
+def test_import_header_wrong_extents(tmp_path):
+    """Test that extents that do not contain all entities are not used."""
+    path = tmp_path / "header.dxf"
+    path.write_text(HEADER_DXF.format(xmax=5.0) + SIMPLE_DXF)
+    drawing = DxfImporter(str(path)).import_dxf()
+    assert drawing.bounds is None
+    assert drawing.get_bounds().xmax == 12.0
@@ -0,0 +1,71 @@
+"""Unit tests for the on-disk cache of imported drawings."""
+
+import os
+from pathlib import Path
+
+from importers.drawing_loader import DrawingLoader
+from importers.dxf_import_filter import DxfImportFilter
+from importers.import_cache import ImportCache
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+def test_loader_uses_cache(tmp_path, monkeypatch):
+    """Test that the drawing is imported just once and then loaded from cache."""
+    filename = str(TEST_DATA / "Building_3np.dxf")
+    loader = DrawingLoader(ImportCache(str(tmp_path), 10 * 1024 * 1024))
+    expected = loader.load(filename)
+    assert len(loader.cache.entries()) == 1
+
+    def import_drawing(self, filename, progress=None):
+        raise AssertionError("the drawing should be loaded from cache")
+
+    monkeypatch.setattr(DrawingLoader, "import_drawing", import_drawing)
+    drawing = loader.load(filename)
+    assert [entity.str() for entity in drawing.entities] == [
+        entity.str() for entity in expected.entities
+    ]
+    assert drawing.statistic == expected.statistic
+    assert drawing.metadata == expected.metadata
+    assert drawing.lines == expected.lines
+
+
+def test_key_depends_on_content(tmp_path):
+    """Test that the cache key is changed when the file content is changed."""
+    path = tmp_path / "drawing.dxf"
+    path.write_text("  0\nEOF\n")
+    key = ImportCache.key(str(path), "dxf")
+    assert ImportCache.key(str(path), "drw") != key
+    path.write_text("999\nchanged\n  0\nEOF\n")
+    assert ImportCache.key(str(path), "dxf") != key
+
+
+def test_lru_eviction(tmp_path):
+    """Test that the least recently used snapshots are evicted first."""
+    cache = ImportCache(str(tmp_path), 250)
+    for index, key in enumerate(["a", "b", "c"]):
+        cache.path(key).write_bytes(b"x" * 100)
+        os.utime(cache.path(key), (index, index))
+    # snapshot "a" is used recently
+    os.utime(cache.path("a"), (10, 10))
+    assert cache.evict() == 1
+    assert [key for key, _, _ in cache.entries()] == ["c", "a"]
+    assert cache.clear() == 2
+    assert cache.entries() == []
+
+
+def test_key_depends_on_import_options():
+    """Test that drawings imported with different storage or filter have different keys."""
+    filename = str(TEST_DATA / "Building_3np.dxf")
+    key = DrawingLoader().cache_key(filename)
+    assert DrawingLoader().cache_key(filename) == key
+    assert DrawingLoader(columnar=True).cache_key(filename) != key
+    # the number of workers doesn't change the imported drawing
+    assert DrawingLoader(workers=2).cache_key(filename) == key
+
+    import_filter = DxfImportFilter(exclude_layers=["koty"])
+    filtered = DrawingLoader(import_filter=import_filter).cache_key(filename)
+    assert filtered != key
+    assert DrawingLoader(import_filter=DxfImportFilter(exclude_layers=["koty"])).cache_key(
+        filename
+    ) == filtered
@@ -0,0 +1,33 @@
+"""Unit tests for the progress of drawing import."""
+
+from pathlib import Path
+
+import pytest
+
+from importers.dxf_importer import DxfImporter
+from importers.dxf_tokenizer_type import DxfTokenizerType
+from importers.import_progress import ImportCancelledError, ImportProgress
+
+TEST_DATA = Path(__file__).parent.parent.parent / "test-data"
+
+
+@pytest.mark.parametrize("tokenizer", list(DxfTokenizerType))
+def test_progress_is_reported(tokenizer):
+    """Test that the importer reports number of bytes consumed."""
+    filename = TEST_DATA / "Building_3np.dxf"
+    progress = ImportProgress()
+    DxfImporter(str(filename), tokenizer, progress=progress).import_dxf()
+    messages = list(progress.messages())
+    assert messages
+    consumed = [message[1] for message in messages]
+    assert consumed == sorted(consumed)
+    assert all(message[2] == filename.stat().st_size for message in messages)
+
+
+def test_import_is_cancelled():
+    """Test that the import is stopped when the cancellation is requested."""
+    progress = ImportProgress()
+    progress.cancel()
+    importer = DxfImporter(str(TEST_DATA / "Building_3np.dxf"), progress=progress)
+    with pytest.raises(ImportCancelledError):
+        importer.import_dxf()
@@ -0,0 +1,26 @@
+"""Unit tests for the representation of vector drawing."""
+
+from pathlib import Path
+
+from geometry.view_transform import ViewTransform
+from gui.culling_renderer import CullingRenderer
+from importers.dxf_importer import DxfImporter
+from tests.gui.fakes import FakeCanvas, render
+
+TEST_DATA = Path(__file__).parent.parent / "test-data"
+
+
+def test_find_entity_by_id():
+    """Test that entities are found by IDs of graphics entities drawn onto canvas."""
+    drawing = DxfImporter(str(TEST_DATA / "Building_3np.dxf"), columnar=True).import_dxf()
+    assert drawing.find_entity_by_id(1) is None
+
+    canvas = FakeCanvas(1000, 700)
+    render(CullingRenderer(canvas), drawing, ViewTransform.fit(drawing.get_bounds(), 1000, 700))
+    assert len(drawing.entity_index) == len(canvas.existing)
+    entities = {entity.str() for entity in drawing.entities}
+    for item in canvas.existing:
+        assert drawing.find_entity_by_id(item).str() in entities
+
+    drawing.clear_entity_index()
+    assert drawing.find_entity_by_id(1) is None
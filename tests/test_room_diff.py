@@ -0,0 +1,30 @@
+"""Unit tests for the differences between rooms on drawing and rooms from SAP."""
+
+from drawing import Drawing
+from room_diff import RoomDiff
+
+
+def test_compute_changes():
+    """Test that added, removed, and unchanged rooms are found in original order."""
+    rooms = [{"room_id": room_id} for room_id in ["A", "B", "C", "D"]]
+    sap_rooms = [{"AOID": room_id} for room_id in ["E", "D", "B", "F", "E"]]
+    changes = RoomDiff.compute(rooms, RoomDiff.sap_room_ids(sap_rooms))
+    assert changes.added == ["E", "F"]
+    assert changes.removed == ["A", "C"]
+    assert changes.unchanged == ["B", "D"]
+
+
+def test_apply_changes():
+    """Test that changes are applied to drawing and canvas IDs of removed rooms are returned."""
+    drawing = Drawing([], {})
+    drawing.rooms = [
+        {"room_id": "A", "canvas_id": 1, "polygon": [(0.0, 0.0)]},
+        {"room_id": "B", "canvas_id": 2, "polygon": [(1.0, 1.0)]},
+        {"room_id": "C"},
+    ]
+    changes = RoomDiff.compute(drawing.rooms, ["B", "D"])
+    assert RoomDiff.apply(changes, drawing) == [1]
+    assert [room["room_id"] for room in drawing.rooms] == ["B", "D"]
+    assert drawing.find_room_by_canvas_id(1) is None
+    assert drawing.find_room_by_room_id("D")["polygon"] == []
+    assert drawing.room_counter == 3
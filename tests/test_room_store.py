@@ -0,0 +1,55 @@
+"""Unit tests for the registry of rooms on drawing."""
+
+from pathlib import Path
+
+from exporters.drawing_exporter import DrawingExporter
+from importers.drawing_importer import DrawingImporter
+from room_store import RoomStore
+
+TEST_DRAWINGS = Path(__file__).parent.parent / "test-drawings"
+
+
+def test_lookup_and_update():
+    """Test that rooms are found by room ID and canvas ID after updates."""
+    rooms = RoomStore([{"room_id": "A", "polygon": [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)]}])
+    room = rooms.add("B", canvas_id=10)
+    assert rooms.find_by_room_id("A")["polygon"] == [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0)]
+    assert rooms.find_by_canvas_id(10) is room
+    assert "polygon" not in room
+    assert "type" not in room
+
+    room["canvas_id"] = 11
+    room["polygon"] = [(2.0, 3.0)]
+    room["type"] = "L"
+    assert rooms.find_by_canvas_id(10) is None
+    assert rooms.find_by_canvas_id(11) is room
+    assert room.as_dict() == {
+        "room_id": "B",
+        "canvas_id": 11,
+        "polygon": [(2.0, 3.0)],
+        "type": "L",
+    }
+
+    rooms.remove(room)
+    assert rooms.find_by_canvas_id(11) is None
+    assert [room["room_id"] for room in rooms] == ["A"]
+
+
+def test_polygons_are_compacted():
+    """Test that coordinate arrays don't grow when polygons are replaced repeatedly."""
+    rooms = RoomStore()
+    room = rooms.add("A")
+    for i in range(100):
+        room["polygon"] = [(float(i), 0.0), (0.0, float(i))]
+    assert room["polygon"] == [(99.0, 0.0), (0.0, 99.0)]
+    assert len(rooms.points_x) < 10
+
+
+def test_export_rooms_from_drawing(tmp_path):
+    """Test that rooms are exported in the same order and with the same polygons."""
+    drawing = DrawingImporter(str(TEST_DRAWINGS / "input_with_15_rooms.drw")).import_drawing()
+    assert len(drawing.rooms) == 15
+    filename = tmp_path / "output.drw"
+    DrawingExporter(str(filename), drawing).export()
+    exported = DrawingImporter(str(filename)).import_drawing()
+    assert exported.rooms.as_dicts() == drawing.rooms.as_dicts()